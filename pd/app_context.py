@@ -3,8 +3,10 @@
 # pd/app_context.py
 
 from dataclasses import dataclass
+from pathlib import Path
 import sqlite3
 
+from pd.core.connections import ConnectionManager
 from pd.platform.paths import AppPaths
 from pd.platform.resources import ResourceManager
 from pd.core.services import PDService
@@ -13,6 +15,8 @@ from pd.core.i18n import I18n
 @dataclass
 class AppContext:
     conn: sqlite3.Connection
+    db_path: Path
+    db: ConnectionManager
     paths: AppPaths
     pd_service: PDService
     config: dict
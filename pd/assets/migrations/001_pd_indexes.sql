@@ -0,0 +1,6 @@
+-- Covering index for the per-model queries (counts, washers, stats).
+CREATE INDEX IF NOT EXISTS idx_pd_model
+    ON pd (model_id, washer1_thickness, washer2_thickness, spring_length, final_pressure);
+
+CREATE INDEX IF NOT EXISTS idx_pd_opening_pressure
+    ON pd (opening_pressure_id);
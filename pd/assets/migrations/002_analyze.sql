@@ -0,0 +1,2 @@
+-- Refresh planner statistics so the new indexes are picked up.
+ANALYZE;
@@ -0,0 +1,95 @@
+-- Per-model running aggregates, kept up to date by triggers on pd.
+-- Averages and variances are derived from n, sums and sums of squares.
+CREATE TABLE IF NOT EXISTS pd_model_summary (
+    model_id INTEGER PRIMARY KEY,
+    n INTEGER NOT NULL DEFAULT 0,
+    sum_washer1 REAL NOT NULL DEFAULT 0,
+    sumsq_washer1 REAL NOT NULL DEFAULT 0,
+    sum_washer2 REAL NOT NULL DEFAULT 0,
+    sumsq_washer2 REAL NOT NULL DEFAULT 0,
+    sum_spring REAL NOT NULL DEFAULT 0,
+    sumsq_spring REAL NOT NULL DEFAULT 0,
+    sum_total REAL NOT NULL DEFAULT 0,
+    sumsq_total REAL NOT NULL DEFAULT 0,
+    FOREIGN KEY (model_id) REFERENCES pd_models(id) ON DELETE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_pd_summary_insert
+AFTER INSERT ON pd
+BEGIN
+    INSERT OR IGNORE INTO pd_model_summary (model_id) VALUES (NEW.model_id);
+    UPDATE pd_model_summary SET
+        n = n + 1,
+        sum_washer1 = sum_washer1 + NEW.washer1_thickness,
+        sumsq_washer1 = sumsq_washer1 + NEW.washer1_thickness * NEW.washer1_thickness,
+        sum_washer2 = sum_washer2 + NEW.washer2_thickness,
+        sumsq_washer2 = sumsq_washer2 + NEW.washer2_thickness * NEW.washer2_thickness,
+        sum_spring = sum_spring + NEW.spring_length,
+        sumsq_spring = sumsq_spring + NEW.spring_length * NEW.spring_length,
+        sum_total = sum_total + (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length),
+        sumsq_total = sumsq_total + (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length)
+                                  * (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length)
+    WHERE model_id = NEW.model_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pd_summary_delete
+AFTER DELETE ON pd
+BEGIN
+    UPDATE pd_model_summary SET
+        n = n - 1,
+        sum_washer1 = sum_washer1 - OLD.washer1_thickness,
+        sumsq_washer1 = sumsq_washer1 - OLD.washer1_thickness * OLD.washer1_thickness,
+        sum_washer2 = sum_washer2 - OLD.washer2_thickness,
+        sumsq_washer2 = sumsq_washer2 - OLD.washer2_thickness * OLD.washer2_thickness,
+        sum_spring = sum_spring - OLD.spring_length,
+        sumsq_spring = sumsq_spring - OLD.spring_length * OLD.spring_length,
+        sum_total = sum_total - (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length),
+        sumsq_total = sumsq_total - (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length)
+                                  * (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length)
+    WHERE model_id = OLD.model_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pd_summary_update
+AFTER UPDATE OF model_id, washer1_thickness, washer2_thickness, spring_length ON pd
+BEGIN
+    UPDATE pd_model_summary SET
+        n = n - 1,
+        sum_washer1 = sum_washer1 - OLD.washer1_thickness,
+        sumsq_washer1 = sumsq_washer1 - OLD.washer1_thickness * OLD.washer1_thickness,
+        sum_washer2 = sum_washer2 - OLD.washer2_thickness,
+        sumsq_washer2 = sumsq_washer2 - OLD.washer2_thickness * OLD.washer2_thickness,
+        sum_spring = sum_spring - OLD.spring_length,
+        sumsq_spring = sumsq_spring - OLD.spring_length * OLD.spring_length,
+        sum_total = sum_total - (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length),
+        sumsq_total = sumsq_total - (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length)
+                                  * (OLD.washer1_thickness + OLD.washer2_thickness + OLD.spring_length)
+    WHERE model_id = OLD.model_id;
+
+    INSERT OR IGNORE INTO pd_model_summary (model_id) VALUES (NEW.model_id);
+    UPDATE pd_model_summary SET
+        n = n + 1,
+        sum_washer1 = sum_washer1 + NEW.washer1_thickness,
+        sumsq_washer1 = sumsq_washer1 + NEW.washer1_thickness * NEW.washer1_thickness,
+        sum_washer2 = sum_washer2 + NEW.washer2_thickness,
+        sumsq_washer2 = sumsq_washer2 + NEW.washer2_thickness * NEW.washer2_thickness,
+        sum_spring = sum_spring + NEW.spring_length,
+        sumsq_spring = sumsq_spring + NEW.spring_length * NEW.spring_length,
+        sum_total = sum_total + (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length),
+        sumsq_total = sumsq_total + (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length)
+                                  * (NEW.washer1_thickness + NEW.washer2_thickness + NEW.spring_length)
+    WHERE model_id = NEW.model_id;
+END;
+
+-- Initial fill, same query as PDRepository.rebuild_model_summary
+DELETE FROM pd_model_summary;
+INSERT INTO pd_model_summary
+SELECT
+    model_id,
+    COUNT(*),
+    SUM(washer1_thickness), SUM(washer1_thickness * washer1_thickness),
+    SUM(washer2_thickness), SUM(washer2_thickness * washer2_thickness),
+    SUM(spring_length), SUM(spring_length * spring_length),
+    SUM(washer1_thickness + washer2_thickness + spring_length),
+    SUM((washer1_thickness + washer2_thickness + spring_length) * (washer1_thickness + washer2_thickness + spring_length))
+FROM pd
+GROUP BY model_id;
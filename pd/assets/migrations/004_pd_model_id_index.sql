@@ -0,0 +1,6 @@
+-- Keyset pages of a search by model: the rows of each model in id order.
+-- idx_pd_model holds the washers after model_id, so its rows are not in id order.
+CREATE INDEX IF NOT EXISTS idx_pd_model_id
+    ON pd (model_id);
+
+ANALYZE pd;
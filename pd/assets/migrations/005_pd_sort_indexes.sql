@@ -0,0 +1,17 @@
+-- Keyset pages of the unit table sorted by a column: each index holds
+-- (column, id) in order, the rowid being the last key of every entry.
+-- Model names and opening pressures are paged through idx_pd_model_id
+-- and idx_pd_opening_pressure.
+CREATE INDEX IF NOT EXISTS idx_pd_washer1
+    ON pd (washer1_thickness);
+
+CREATE INDEX IF NOT EXISTS idx_pd_washer2
+    ON pd (washer2_thickness);
+
+CREATE INDEX IF NOT EXISTS idx_pd_spring
+    ON pd (spring_length);
+
+CREATE INDEX IF NOT EXISTS idx_pd_final_pressure
+    ON pd (final_pressure);
+
+ANALYZE pd;
@@ -2,35 +2,41 @@
 # License: GPL v3 Copyright: 2026, Mateusz Jamróz
 # pd/bootstrap.py
 
-import sqlite3
 import sys
+from pd.startup.profiling import profiler, enable_from_argv
 from PyQt6.QtWidgets import QApplication, QDialog
 from pd.platform.os_detect import get_platform
 from pd.platform.paths import init_paths
 from pd.startup.logging import init_logging
 from pd.core.database import init_database
+from pd.core.connections import ConnectionManager, DatabaseSettings
 from pd.core.config import load_config
 from pd.core.i18n import I18n
-from pd.ui.app import run_ui
 from pd.startup.error_handler import handle_startup_error as hse
-from pd.app_context import AppContext
-from pd.core.repositories import PDRepository
-from pd.core.services import PDService
 from pd.platform.resources import ResourceManager
 from pd.launcher.launcher import Launcher
 from pd.ui.widgets.db_selector import get_database_path
 
+# The services (numpy) and the main window (pyqtgraph, dialogs) are
+# imported in start_app once the launcher is done, see --profile-startup
+
 def start_app():
-    platform = get_platform()
-    paths = init_paths(platform)
-    config = load_config(paths.config / "config.ini")
+    enable_from_argv(sys.argv)
+    profiler.since_start("import bootstrap")
+
+    with profiler.phase("config"):
+        platform = get_platform()
+        paths = init_paths(platform)
+        config = load_config(paths.config / "config.ini")
 
-    app = QApplication(sys.argv)
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
 
     selected_lang = config["general"]["language"]
     selected_module = config["launcher"].get("saved_data_package", "")   
 
     if config.getboolean("launcher", "show_on_startup", fallback=True):
+        # Waiting for the user, only the total of the profile includes it
         launcher = Launcher(config, paths)
 
         if launcher.exec() == QDialog.DialogCode.Accepted:
@@ -49,7 +55,8 @@ def start_app():
         else:
             return
 
-    i18n = I18n(selected_lang)
+    with profiler.phase("i18n"):
+        i18n = I18n(selected_lang, cache_dir=paths.config)
 
     if selected_module == "pd":
         try:
@@ -58,17 +65,27 @@ def start_app():
             db_path = get_database_path(config, paths, i18n)
             with open(paths.config / "config.ini", 'w', encoding='utf-8') as f:
                 config.write(f)
-            init_database(db_path)
 
-            conn = sqlite3.connect(db_path)
-            conn.execute("PRAGMA foreign_keys = ON;")
+            with profiler.phase("import services"):
+                from pd.app_context import AppContext
+                from pd.core.repositories import PDRepository
+                from pd.core.services import PDService
+                from pd.core.statistics import StatsOptions
+
+            with profiler.phase("database"):
+                init_database(db_path)
 
-            pd_repo = PDRepository(conn)
-            pd_service = PDService(pd_repo)
-            resources = ResourceManager()
+                db = ConnectionManager(db_path, DatabaseSettings.from_config(config))
+                conn = db.connection()
+
+                pd_repo = PDRepository(conn)
+                pd_service = PDService(pd_repo, StatsOptions.from_config(config))
+                resources = ResourceManager()
 
             ctx = AppContext(
                 conn=conn,
+                db_path=db_path,
+                db=db,
                 paths=paths,
                 pd_service=pd_service,
                 config=config,
@@ -76,10 +93,13 @@ def start_app():
                 resources=resources
             )
 
+            with profiler.phase("import ui"):
+                from pd.ui.app import run_ui
+
             run_ui(ctx, app)
 
             del ctx
-            conn.close()
+            db.close_all()
         except Exception as e:
             hse(e, i18n)
 
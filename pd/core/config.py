@@ -26,6 +26,22 @@ DEFAULT_CONFIG = {
         "path": "",
         "use_default": "false",
         "show_ask": "false",
+        # SQLite performance tuning, see pd.core.connections
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": "268435456",
+        "cache_size": "-65536",
+        "busy_timeout": "5000",
+    },
+    "statistics": {
+        "percentiles": "5, 95",
+        # most common configuration: window width over the totals (mm), minimum units
+        "tolerance": "0.03",
+        "min_count": "5",
+        # precompute stats of the biggest models in the background after startup
+        "warmup": "true",
+        # models opened last, newest first, see MainWindow
+        "recent_models": "",
     },
 }
 
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/connections.py
+
+"""
+Per-thread SQLite connections.
+sqlite3 connections must not be shared between threads, so every
+thread asks the ConnectionManager for its own one. Background query
+workers use the read-only flavor; with WAL enabled they never block
+the writer on the GUI thread.
+"""
+
+import sqlite3
+import logging
+import threading
+from configparser import ConfigParser
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 268435456      # bytes, 0 disables memory mapping
+    cache_size: int = -65536        # negative: KiB, positive: pages
+    busy_timeout: int = 5000        # ms
+
+    @classmethod
+    def from_config(cls, config: ConfigParser) -> "DatabaseSettings":
+        section = config["database"]
+        defaults = cls()
+
+        journal_mode = section.get("journal_mode", defaults.journal_mode).upper()
+        if journal_mode not in JOURNAL_MODES:
+            logger.warning("Invalid journal_mode %r, using %s", journal_mode, defaults.journal_mode)
+            journal_mode = defaults.journal_mode
+
+        synchronous = section.get("synchronous", defaults.synchronous).upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            logger.warning("Invalid synchronous %r, using %s", synchronous, defaults.synchronous)
+            synchronous = defaults.synchronous
+
+        return cls(
+            journal_mode=journal_mode,
+            synchronous=synchronous,
+            mmap_size=section.getint("mmap_size", fallback=defaults.mmap_size),
+            cache_size=section.getint("cache_size", fallback=defaults.cache_size),
+            busy_timeout=section.getint("busy_timeout", fallback=defaults.busy_timeout),
+        )
+
+class ConnectionManager:
+    def __init__(self, db_path: Path, settings: DatabaseSettings | None = None):
+        self.db_path = Path(db_path)
+        self.settings = settings or DatabaseSettings()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Read-write connection of the calling thread.
+        """
+        conn = getattr(self._local, "writer", None)
+        if conn is None:
+            conn = self._connect(read_only=False)
+            self._local.writer = conn
+        return conn
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Read-only connection of the calling thread, for query workers.
+        """
+        conn = getattr(self._local, "reader", None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            self._local.reader = conn
+        return conn
+
+    def close_thread(self) -> None:
+        """
+        Close the connections of the calling thread.
+        Short-lived threads should call it before they finish.
+        """
+        for name in ("writer", "reader"):
+            conn = getattr(self._local, name, None)
+            if conn is not None:
+                self._forget(conn)
+                conn.close()
+                setattr(self._local, name, None)
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for conn in connections:
+            conn.close()
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        timeout = self.settings.busy_timeout / 1000
+        # Connections are only used by their own thread, check_same_thread is
+        # disabled so that close_all() can run from the GUI thread on exit.
+        if read_only:
+            uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=timeout, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+
+        self._apply_pragmas(conn, read_only)
+
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection, read_only: bool) -> None:
+        s = self.settings
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute(f"PRAGMA busy_timeout = {int(s.busy_timeout)};")
+        conn.execute(f"PRAGMA cache_size = {int(s.cache_size)};")
+        conn.execute(f"PRAGMA mmap_size = {int(s.mmap_size)};")
+
+        if read_only:
+            conn.execute("PRAGMA query_only = ON;")
+            return
+
+        # journal_mode is stored in the database file, readers inherit it
+        mode = conn.execute(f"PRAGMA journal_mode = {s.journal_mode};").fetchone()[0]
+        if mode.upper() != s.journal_mode:
+            logger.warning("Requested journal_mode %s, database uses %s", s.journal_mode, mode)
+        conn.execute(f"PRAGMA synchronous = {s.synchronous};")
+
+    def _forget(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
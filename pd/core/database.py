@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 from pd.platform.resources import resource_path
 from pd.core.seed import seed_pd_models, seed_opening_pressures
+from pd.core.migrations import run_migrations
 
 logger = logging.getLogger(__name__)
 
@@ -14,25 +15,35 @@ def init_database(db_path: Path) -> None:
     """
     Initialize the SQLite database.
     If the database file does not exist, it creates a new one from pd.sql.
+    Pending schema migrations are applied on every startup.
     """
     try:
         if db_path.exists():
             logger.info("Database already exists at %s", db_path)
-            return
-        
-        logger.info("Database not found, initializing from schema.")
-        
-        schema_path = resource_path("pd/assets/pd.sql")
-        if not schema_path.exists():
-            raise RuntimeError(f"Database schema file not found at {schema_path}")
-        
+        else:
+            _create_database(db_path)
+
         with sqlite3.connect(db_path) as conn:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                conn.executescript(f.read())
-                seed_pd_models(conn)
-                seed_opening_pressures(conn)
+            version = run_migrations(conn)
+        conn.close()
 
-        logger.info("Database initialized successfully.")
+        logger.info("Database schema at version %d.", version)
     except Exception as e:
         logger.error("Failed to initialize database: %s", e)
         raise
+
+def _create_database(db_path: Path) -> None:
+    logger.info("Database not found, initializing from schema.")
+
+    schema_path = resource_path("pd/assets/pd.sql")
+    if not schema_path.exists():
+        raise RuntimeError(f"Database schema file not found at {schema_path}")
+
+    with sqlite3.connect(db_path) as conn:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            conn.executescript(f.read())
+            seed_pd_models(conn)
+            seed_opening_pressures(conn)
+    conn.close()
+
+    logger.info("Database initialized successfully.")
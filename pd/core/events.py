@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/events.py
+
+"""
+Change events published by PDService after every write.
+Views subscribe to them (through pd.ui.event_bus.EventBus) and apply
+the single changed row instead of reloading the whole unit table.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pd.core.models import PDView
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class UnitAdded:
+    unit: PDView
+
+@dataclass(frozen=True, slots=True)
+class UnitUpdated:
+    old: PDView
+    new: PDView
+
+@dataclass(frozen=True, slots=True)
+class UnitDeleted:
+    unit: PDView
+
+@dataclass(frozen=True, slots=True)
+class ModelAdded:
+    model_id: int
+    model_name: str
+
+@dataclass(frozen=True, slots=True)
+class UnitsReloaded:
+    """
+    Bulk change (import, rolled back transaction), listeners reload everything.
+    """
+
+ChangeEvent = UnitAdded | UnitUpdated | UnitDeleted | ModelAdded | UnitsReloaded
+
+class EventHub:
+    def __init__(self):
+        self._listeners: list[Callable[[ChangeEvent], None]] = []
+
+    def subscribe(self, listener: Callable[[ChangeEvent], None]) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[ChangeEvent], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def emit(self, event: ChangeEvent) -> None:
+        # The write is already done, a failing listener must not undo it for the caller
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Listener %r failed on %r", listener, event)
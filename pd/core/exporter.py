@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/exporter.py
+
+"""
+Streaming export of the unit table to CSV, JSON Lines and XLSX.
+Rows are read from the database in fetchmany chunks and written
+straight to the file, so memory stays flat for any table size.
+The column names match pd.core.importer, exported files can be
+imported again.
+"""
+
+import csv
+import json
+import logging
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from pd.core.repositories import PDRepository
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = (
+    "id",
+    "model",
+    "opening_pressure",
+    "washer1",
+    "washer2",
+    "spring_length",
+    "final_pressure",
+)
+
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".xlsx": "xlsx",
+}
+
+# Report progress every PROGRESS_STEP rows
+PROGRESS_STEP = 5000
+
+class ExportCancelled(Exception):
+    pass
+
+def export_format(path: Path) -> str:
+    fmt = EXPORT_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Unsupported export format: {Path(path).suffix}")
+    return fmt
+
+def export_units(
+    repo: PDRepository,
+    path: Path,
+    fmt: str | None = None,
+    model_id=None,
+    opening_pressure_id=None,
+    progress: Callable[[int], None] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+    chunk_size: int = 1000,
+) -> int:
+    """
+    Export pump units to path, optionally filtered by model and opening pressure.
+    The format is guessed from the file suffix when fmt is not given.
+    Returns the number of exported rows.
+    """
+    path = Path(path)
+    fmt = fmt or export_format(path)
+    writer = _WRITERS.get(fmt)
+    if writer is None:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    rows = _export_rows(
+        repo.iter_all_with_name(model_id, opening_pressure_id, chunk_size=chunk_size),
+        progress,
+        cancelled
+    )
+    count = writer(path, rows)
+
+    logger.info("Exported %d units to %s.", count, path)
+    return count
+
+def _export_rows(rows, progress, cancelled) -> Iterator[tuple]:
+    # (id, model_id, model_name, opening_pressure, washer1, washer2, spring, final)
+    for n, row in enumerate(rows, start=1):
+        yield (row[0], row[2], row[3], row[4], row[5], row[6], row[7])
+
+        if n % PROGRESS_STEP == 0:
+            if cancelled and cancelled():
+                raise ExportCancelled()
+            if progress:
+                progress(n)
+
+def _write_csv(path: Path, rows: Iterator[tuple]) -> int:
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+def _write_jsonl(path: Path, rows: Iterator[tuple]) -> int:
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+def _write_xlsx(path: Path, rows: Iterator[tuple]) -> int:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("pd")
+    ws.append(EXPORT_COLUMNS)
+
+    count = 0
+    for row in rows:
+        ws.append(row)
+        count += 1
+
+    wb.save(path)
+    return count
+
+_WRITERS = {
+    "csv": _write_csv,
+    "jsonl": _write_jsonl,
+    "xlsx": _write_xlsx,
+}
@@ -2,39 +2,78 @@
 # License: GPL v3 Copyright: 2026, Mateusz Jamróz
 # pd/core/i18n.py
 
+import hashlib
 import json
+import logging
+import marshal
+import os
 
 from dataclasses import dataclass
+from pathlib import Path
 
 from pd.core.plural import get_plural_form
 from pd.platform.resources import resource_path
 
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the cached catalog changes
+CATALOG_FORMAT = 1
+
+# Last key segments that hold plural templates, see plural()
+PLURAL_FORMS = frozenset({"zero", "one", "two", "few", "many", "other"})
+
 class I18n:
-    def __init__(self, language: str):
+    def __init__(self, language: str, cache_dir: Path | None = None):
+        """
+        cache_dir: where the flattened catalog is cached (next to the user config),
+        None to always parse the JSON.
+        """
         self.language = language
-        self.translations = self._load_translations(language)
+        self.catalog, self.plurals = self._load_catalog(language, cache_dir)
 
-    def _load_translations(self, language: str) -> dict:
+    def _load_catalog(self, language: str, cache_dir: Path | None) -> tuple[dict, dict]:
         path = resource_path(f"pd/assets/i18n/{language}.json")
         if not path.exists():
             raise RuntimeError(f"Missing language file: {language}.json")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        # Keyed on the content, a onefile build unpacks the catalog with a new mtime on every launch
+        data = path.read_bytes()
+        stamp = (CATALOG_FORMAT, hashlib.blake2b(data, digest_size=16).hexdigest())
+        cache = cache_dir / f"i18n_{language}.marshal" if cache_dir is not None else None
+        if cache is not None:
+            try:
+                with open(cache, 'rb') as f:
+                    cached_stamp, catalog, plurals = marshal.load(f)
+                if tuple(cached_stamp) == stamp:
+                    return catalog, plurals
+            except (OSError, EOFError, ValueError, TypeError):
+                pass  # Missing or stale cache, rebuilt below
+
+        catalog = _flatten(json.loads(data.decode('utf-8')))
+        plurals = {
+            tuple(key.rsplit('.', 1)): template
+            for key, template in catalog.items()
+            if key.rsplit('.', 1)[-1] in PLURAL_FORMS
+        }
+
+        if cache is not None:
+            try:
+                tmp = cache.with_suffix(".tmp")
+                with open(tmp, 'wb') as f:
+                    marshal.dump((stamp, catalog, plurals), f)
+                os.replace(tmp, cache)
+            except OSError:
+                logger.warning("Could not cache the %s catalog in %s", language, cache)
+        return catalog, plurals
         
     def t(self, key: str) -> str:
         """
         Translate a given key to the current language.
         """
-        node = self.translations
-        for part in key.split('.'):
-            if not isinstance(node, dict) or part not in node:
-                return f"[{key}]"
-            node = node[part]
-        if not isinstance(node, str):
+        text = self.catalog.get(key)
+        if text is None:
             return f"[{key}]"
-        
-        return node
+        return text
     
     def current_language(self) -> str:
         code = self.language
@@ -42,8 +81,23 @@ class I18n:
     
     def plural(self, key: str, n: int, **kwargs) -> str:
         form = get_plural_form(self.language, n)
-        template = self.t(f"{key}.{form}")
+        template = self.plurals.get((key, form))
+        if template is None:
+            template = f"[{key}.{form}]"
         return template.format(n=n, **kwargs)
+
+def _flatten(node: dict, prefix: str = "") -> dict[str, str]:
+    """
+    {"a": {"b": "text"}} -> {"a.b": "text"}, only strings are translations.
+    """
+    flat = {}
+    for name, value in node.items():
+        key = f"{prefix}{name}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{key}."))
+        elif isinstance(value, str):
+            flat[key] = value
+    return flat
     
 @dataclass(frozen=True)
 class Language:
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/importer.py
+
+"""
+Bulk import of bench logs (CSV, TSV, XLSX) into the pd table.
+Rows are streamed from the file, validated in chunks and handed
+to PDRepository.insert_many, so the whole file is loaded in one
+transaction without keeping it in memory.
+"""
+
+import csv
+import math
+import itertools
+import operator
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pd.core.repositories import PDRepository
+
+logger = logging.getLogger(__name__)
+
+# Column order used when the file has no header row
+IMPORT_COLUMNS = (
+    "model",
+    "opening_pressure",
+    "washer1",
+    "washer2",
+    "spring_length",
+    "final_pressure",
+)
+
+HEADER_ALIASES = {
+    "model": "model",
+    "model_name": "model",
+    "model_id": "model",
+    "opening_pressure": "opening_pressure",
+    "washer1": "washer1",
+    "washer1_thickness": "washer1",
+    "lower": "washer1",
+    "washer2": "washer2",
+    "washer2_thickness": "washer2",
+    "upper": "washer2",
+    "spring": "spring_length",
+    "spring_length": "spring_length",
+    "final_pressure": "final_pressure",
+}
+
+SUPPORTED_SUFFIXES = (".csv", ".tsv", ".txt", ".xlsx")
+
+@dataclass
+class ImportRowError:
+    line: int
+    message: str
+
+@dataclass
+class ImportResult:
+    inserted: int = 0
+    skipped: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+def read_rows(path: Path) -> Iterator[tuple[int, tuple]]:
+    """
+    Yield (line_number, values) for every non-empty row of the file.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        yield from _read_delimited(path, None)
+    elif suffix in (".tsv", ".txt"):
+        yield from _read_delimited(path, "\t")
+    elif suffix == ".xlsx":
+        yield from _read_xlsx(path)
+    else:
+        raise ValueError(f"Unsupported import format: {path.suffix}")
+
+def _read_delimited(path: Path, delimiter: str | None) -> Iterator[tuple[int, tuple]]:
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if delimiter is None:
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+            except csv.Error:
+                delimiter = ","
+
+        for line, row in enumerate(csv.reader(f, delimiter=delimiter), start=1):
+            if any(cell.strip() for cell in row):
+                yield line, tuple(row)
+
+def _read_xlsx(path: Path) -> Iterator[tuple[int, tuple]]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        for line, row in enumerate(ws.iter_rows(values_only=True), start=1):
+            if any(cell is not None and str(cell).strip() for cell in row):
+                yield line, row
+    finally:
+        wb.close()
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+class UnitImporter:
+    def __init__(
+        self,
+        repo: PDRepository,
+        chunk_size: int = 10_000,
+        max_errors: int = 1000,
+    ):
+        self.repo = repo
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+        # Lookups: model name -> id, opening pressure value -> id
+        self.models = {str(name).strip(): mid for mid, name in repo.get_models()}
+        self.pressures = {int(value): pid for pid, value in repo.get_opening_pressures()}
+
+    def import_file(
+        self,
+        path: Path,
+        progress: Callable[[int], None] | None = None,
+    ) -> ImportResult:
+        """
+        Import every valid row of the file in one transaction.
+        Invalid rows are reported in the result and do not abort the batch.
+        """
+        result = ImportResult()
+        rows = self._with_columns(read_rows(Path(path)))
+        result.inserted = self.repo.insert_many(self._valid_rows(rows, result, progress))
+
+        logger.info(
+            "Imported %d units from %s, %d rows skipped.",
+            result.inserted, path, result.skipped
+        )
+        return result
+
+    def _with_columns(self, rows: Iterator[tuple[int, tuple]]) -> Iterator[tuple[int, tuple]]:
+        """
+        Reorder every row to IMPORT_COLUMNS, using the header row when present.
+        """
+        first = next(rows, None)
+        if first is None:
+            return
+
+        line, values = first
+        header = [HEADER_ALIASES.get(str(v).strip().lower()) if v is not None else None for v in values]
+
+        if set(IMPORT_COLUMNS) <= set(header):
+            positions = [header.index(name) for name in IMPORT_COLUMNS]
+        else:
+            positions = list(range(len(IMPORT_COLUMNS)))
+            rows = itertools.chain([first], rows)
+
+        width = max(positions) + 1
+        pick = operator.itemgetter(*positions)
+        for line, values in rows:
+            if len(values) < width:
+                values = tuple(values) + (None,) * (width - len(values))
+            yield line, pick(values)
+
+    def _valid_rows(
+        self,
+        rows: Iterator[tuple[int, tuple]],
+        result: ImportResult,
+        progress: Callable[[int], None] | None,
+    ) -> Iterator[tuple]:
+        processed = 0
+        for chunk in _chunked(rows, self.chunk_size):
+            valid = []
+            for line, values in chunk:
+                try:
+                    valid.append(self._convert(values))
+                except ValueError as e:
+                    result.skipped += 1
+                    if len(result.errors) < self.max_errors:
+                        result.errors.append(ImportRowError(line, str(e)))
+
+            processed += len(chunk)
+            yield from valid
+
+            if progress:
+                progress(processed)
+
+    def _convert(self, values: tuple) -> tuple:
+        model, pressure, washer1, washer2, spring_length, final_pressure = values
+        return (
+            self._model_id(model),
+            _parse_float(washer1, "washer1"),
+            _parse_float(washer2, "washer2"),
+            _parse_float(spring_length, "spring_length"),
+            _parse_float(final_pressure, "final_pressure"),
+            self._pressure_id(pressure),
+        )
+
+    def _model_id(self, value) -> int:
+        model_id = self.models.get(value)
+        if model_id is not None:
+            return model_id
+
+        if value is None or str(value).strip() == "":
+            raise ValueError("Missing model")
+
+        # Spreadsheets store model numbers as numbers and drop the leading zero
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        name = str(value).strip()
+
+        model_id = self.models.get(name)
+        if model_id is None and name.isdigit():
+            model_id = self.models.get(name.zfill(10))
+        if model_id is None:
+            raise ValueError(f"Unknown model: {name}")
+        return model_id
+
+    def _pressure_id(self, value) -> int:
+        pressure = _parse_float(value, "opening_pressure")
+        pressure_id = self.pressures.get(int(round(pressure)))
+        if pressure_id is None:
+            raise ValueError(f"Unknown opening pressure: {value}")
+        return pressure_id
+
+def _parse_float(value, name: str) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        if value is None or str(value).strip() == "":
+            raise ValueError(f"Missing {name}") from None
+        try:
+            number = float(str(value).strip().replace(",", "."))
+        except ValueError:
+            raise ValueError(f"Invalid {name}: {value}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"Invalid {name}: {value}")
+    return number
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/migrations.py
+
+"""
+Versioned schema migrations keyed on PRAGMA user_version.
+Each file in pd/assets/migrations is named NNN_description.sql,
+NNN being the schema version it brings the database to.
+"""
+
+import sqlite3
+import logging
+from pathlib import Path
+from pd.platform.resources import resource_path
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = "pd/assets/migrations"
+
+def discover_migrations() -> list[tuple[int, Path]]:
+    """
+    Return (version, path) pairs sorted by version.
+    """
+    folder = resource_path(MIGRATIONS_DIR)
+    if not folder.exists():
+        raise RuntimeError(f"Migrations folder not found at {folder}")
+
+    migrations = []
+    for path in folder.glob("*.sql"):
+        prefix = path.name.split("_", 1)[0]
+        if not prefix.isdigit():
+            logger.warning("Skipping migration with invalid name: %s", path.name)
+            continue
+        migrations.append((int(prefix), path))
+
+    migrations.sort(key=lambda m: m[0])
+    return migrations
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def run_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Apply every migration newer than the database's user_version.
+    Each migration runs in its own transaction together with the
+    version bump, so a failed migration leaves the schema untouched.
+    Returns the schema version after migrating.
+    """
+    current = get_schema_version(conn)
+
+    for version, path in discover_migrations():
+        if version <= current:
+            continue
+
+        logger.info("Applying migration %s", path.name)
+        with open(path, 'r', encoding='utf-8') as f:
+            sql = f.read()
+
+        try:
+            conn.executescript(
+                f"BEGIN;\n{sql}\nPRAGMA user_version = {version};\nCOMMIT;"
+            )
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        current = version
+
+    return current
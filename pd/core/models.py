@@ -4,7 +4,10 @@
 
 from dataclasses import dataclass
 
-@dataclass
+# Slotted dataclasses: no per-instance __dict__, which matters when
+# whole tables are loaded as objects.
+
+@dataclass(slots=True)
 class PD:
     id: int
     model_id: str
@@ -14,7 +17,7 @@ class PD:
     final_pressure: float
     opening_pressure_id: float
 
-@dataclass
+@dataclass(slots=True)
 class PDView:
     id: int
     model_id: str
@@ -25,12 +28,25 @@ class PDView:
     spring_length: float
     final_pressure: float
 
-@dataclass
+@dataclass(slots=True)
 class PDModel:
     id: int
     model_name: str
 
-@dataclass
+@dataclass(slots=True)
 class PDOpeningPressure:
     id: int
-    value: int
\ No newline at end of file
+    value: int
+
+@dataclass(slots=True)
+class PDModelSummary:
+    model_id: int
+    count: int
+    avg_lower: float
+    avg_upper: float
+    avg_spring: float
+    avg_total: float
+    var_lower: float
+    var_upper: float
+    var_spring: float
+    var_total: float
@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/online_stats.py
+
+"""
+Incremental statistics of the models that were already opened.
+A model is seeded once from its columns, after that every added,
+edited or deleted unit only updates the running sums (Welford) and
+the sorted columns (SortedList), so the stats of a hot model are ready
+right after each bench entry.
+Running sums drift with many removals, so every model is rebuilt
+from a full fetch after reconcile_every changes.
+Counts, means and variances of a seed come from pd_model_summary when
+it is given and agrees with the columns, otherwise from
+statistics.columns_summary. Seeds are vectorized with
+NumPy when it is installed, the per-unit path is left to the deltas.
+"""
+
+import math
+import bisect
+import logging
+from collections import Counter, OrderedDict
+
+from sortedcontainers import SortedList
+
+from pd.core.statistics import (
+    DEFAULT_PERCENTILES,
+    DEFAULT_TOLERANCE,
+    DEFAULT_MIN_COUNT,
+    PDStats,
+    columns_summary,
+    percentile_sorted,
+)
+from pd.core.models import PDModelSummary
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+class RunningStats:
+    """
+    Welford's running mean and variance with removal.
+    """
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    @classmethod
+    def from_moments(cls, n: int, mean: float, var: float) -> "RunningStats":
+        """
+        State after n values with this mean and sample variance.
+        """
+        stats = cls()
+        stats.n = n
+        stats.mean = mean
+        stats.m2 = var * (n - 1) if n > 1 else 0.0
+        return stats
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 = max(0.0, self.m2 - delta * (x - self.mean))
+
+    @property
+    def std(self) -> float:
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.n - 1))
+
+class SortedColumn:
+    """
+    Column kept in ascending order, for medians, percentiles and ranges.
+    Adds, removes and indexing are O(log n).
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values: list[float] | None = None):
+        self.values = SortedList(values or ())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, x: float) -> None:
+        self.values.add(x)
+
+    def remove(self, x: float) -> bool:
+        if x not in self.values:
+            return False
+        self.values.remove(x)
+        return True
+
+    def percentile(self, p: float) -> float:
+        return percentile_sorted(self.values, p)
+
+class ModelStats:
+    """
+    Running statistics of one model.
+    """
+    def __init__(self):
+        self.lower = RunningStats()
+        self.upper = RunningStats()
+        self.spring = RunningStats()
+        self.total = RunningStats()
+        self.sorted_lower = SortedColumn()
+        self.sorted_upper = SortedColumn()
+        # Units per total (in 0.01 mm), and per rounded (washer1, washer2, spring) of each total
+        self.totals: Counter = Counter()
+        self.configs: dict[int, Counter] = {}
+        # Configurations of a seed not yet in configs: total -> (start, end) in seed_configs
+        self._seeded: dict[int, tuple[int, int]] = {}
+        self._seed_configs = None
+        self.changes = 0
+        self.consistent = True
+
+    @classmethod
+    def from_columns(cls, washer1, washer2, spring, summary: PDModelSummary | None = None) -> "ModelStats":
+        if np is None:
+            return cls._from_lists(_as_list(washer1), _as_list(washer2), _as_list(spring), summary)
+
+        data = np.empty((3, len(washer1)), dtype=np.float64)
+        data[0] = washer1
+        data[1] = washer2
+        data[2] = spring
+        n = data.shape[1]
+
+        stats = cls()
+        if n == 0:
+            return stats
+        if summary is None or summary.count != n:
+            summary = columns_summary(data[0], data[1], data[2])
+        stats._set_moments(summary)
+        stats.sorted_lower = SortedColumn(np.sort(data[0]).tolist())
+        stats.sorted_upper = SortedColumn(np.sort(data[1]).tolist())
+
+        # Same rounding as _config and _total_key, counted per distinct configuration
+        cents = np.rint(data * 100)
+        keys = np.rint((cents[0] / 100 + cents[1] / 100 + cents[2] / 100) * 100)
+        order = np.lexsort((cents[2], cents[1], cents[0], keys))
+        rows = np.vstack((keys, cents))[:, order]
+        starts = np.flatnonzero(np.concatenate(([True], (rows[:, 1:] != rows[:, :-1]).any(axis=0))))
+        counts = np.diff(np.append(starts, n))
+        rows = rows[:, starts]
+
+        # Only the totals are counted now, the configurations of a total when it is first needed
+        key_starts = np.flatnonzero(np.concatenate(([True], rows[0, 1:] != rows[0, :-1])))
+        key_ends = np.append(key_starts[1:], rows.shape[1])
+        key_counts = np.add.reduceat(counts, key_starts)
+        for key, start, end, count in zip(
+            rows[0, key_starts].tolist(), key_starts.tolist(), key_ends.tolist(), key_counts.tolist()
+        ):
+            stats.totals[int(key)] = count
+            stats._seeded[int(key)] = (start, end)
+        stats._seed_configs = (rows[1:] / 100, counts)
+        return stats
+
+    @classmethod
+    def _from_lists(cls, washer1, washer2, spring, summary: PDModelSummary | None) -> "ModelStats":
+        """
+        Per-unit seed, when NumPy is not installed.
+        """
+        stats = cls()
+        if not washer1:
+            return stats
+        if summary is None or summary.count != len(washer1):
+            summary = columns_summary(washer1, washer2, spring, use_numpy=False)
+        stats._set_moments(summary)
+        for a, b, c in zip(washer1, washer2, spring):
+            stats._count_config(a, b, c)
+        stats.sorted_lower = SortedColumn(washer1)
+        stats.sorted_upper = SortedColumn(washer2)
+        return stats
+
+    def _set_moments(self, summary: PDModelSummary) -> None:
+        """
+        Running sums from the model's pd_model_summary row, or from statistics.columns_summary.
+        """
+        n = summary.count
+        self.lower = RunningStats.from_moments(n, summary.avg_lower, summary.var_lower)
+        self.upper = RunningStats.from_moments(n, summary.avg_upper, summary.var_upper)
+        self.spring = RunningStats.from_moments(n, summary.avg_spring, summary.var_spring)
+        self.total = RunningStats.from_moments(n, summary.avg_total, summary.var_total)
+
+    @property
+    def count(self) -> int:
+        return self.lower.n
+
+    def add(self, washer1: float, washer2: float, spring: float) -> None:
+        self._count(washer1, washer2, spring)
+        self.sorted_lower.add(washer1)
+        self.sorted_upper.add(washer2)
+        self.changes += 1
+
+    def remove(self, washer1: float, washer2: float, spring: float) -> None:
+        config = _config(washer1, washer2, spring)
+        key = _total_key(config)
+        removed = (
+            self.sorted_lower.remove(washer1)
+            & self.sorted_upper.remove(washer2)
+        )
+        if not removed or self._configs_of(key, create=False).get(config, 0) == 0:
+            # Not the values this model was seeded with, rebuild it on the next read
+            self.consistent = False
+            return
+
+        self.lower.remove(washer1)
+        self.upper.remove(washer2)
+        self.spring.remove(spring)
+        self.total.remove(washer1 + washer2 + spring)
+        _decrement(self.configs[key], config)
+        if not self.configs[key]:
+            del self.configs[key]
+        _decrement(self.totals, key)
+        self.changes += 1
+
+    def stats(
+        self,
+        percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+        tolerance: float = DEFAULT_TOLERANCE,
+        min_count: int = DEFAULT_MIN_COUNT,
+    ) -> PDStats | None:
+        """
+        Same result as statistics.compute_stats over the model's columns.
+        """
+        if self.count == 0:
+            return None
+
+        lowers = self.sorted_lower
+        uppers = self.sorted_upper
+        return PDStats(
+            avg_lower=self.lower.mean,
+            avg_upper=self.upper.mean,
+            avg_spring=self.spring.mean,
+            avg_total=self.total.mean,
+            median_lower=lowers.percentile(50.0),
+            median_upper=uppers.percentile(50.0),
+            common_config=self.common_config(tolerance, min_count),
+            std_lower=self.lower.std,
+            std_upper=self.upper.std,
+            std_spring=self.spring.std,
+            std_total=self.total.std,
+            min_lower=lowers.values[0],
+            max_lower=lowers.values[-1],
+            min_upper=uppers.values[0],
+            max_upper=uppers.values[-1],
+            percentiles_lower={p: lowers.percentile(p) for p in percentiles},
+            percentiles_upper={p: uppers.percentile(p) for p in percentiles},
+        )
+
+    def common_config(
+        self,
+        tolerance: float = DEFAULT_TOLERANCE,
+        min_count: int = DEFAULT_MIN_COUNT,
+    ) -> tuple[float, float, float] | None:
+        """
+        statistics.most_common_config over the distinct totals instead of every unit.
+        """
+        keys = sorted(self.totals)
+        width = math.floor(round(tolerance * 100, 6))
+
+        best_key, best_count = None, 0
+        end, window = 0, 0
+        for key in keys:
+            while end < len(keys) and keys[end] <= key + width:
+                window += self.totals[keys[end]]
+                end += 1
+            if window > best_count:
+                best_key, best_count = key, window
+            window -= self.totals[key]
+
+        if best_count < min_count:
+            return None
+
+        candidates = Counter()
+        for key in keys[bisect.bisect_left(keys, best_key):bisect.bisect_right(keys, best_key + width)]:
+            candidates.update(self._configs_of(key))
+        return min((-n, config) for config, n in candidates.items())[1]
+
+    def _count(self, washer1: float, washer2: float, spring: float) -> None:
+        self.lower.add(washer1)
+        self.upper.add(washer2)
+        self.spring.add(spring)
+        self.total.add(washer1 + washer2 + spring)
+        self._count_config(washer1, washer2, spring)
+
+    def _count_config(self, washer1: float, washer2: float, spring: float) -> None:
+        config = _config(washer1, washer2, spring)
+        key = _total_key(config)
+        self.totals[key] += 1
+        self._configs_of(key)[config] += 1
+
+    def _configs_of(self, key: int, create: bool = True) -> Counter:
+        """
+        Units per configuration with this total, unpacked from the seed on first use.
+        """
+        configs = self.configs.get(key)
+        if configs is not None:
+            return configs
+        configs = Counter()
+        span = self._seeded.pop(key, None)
+        if span is not None:
+            start, end = span
+            values, counts = self._seed_configs
+            for a, b, c, n in zip(*values[:, start:end].tolist(), counts[start:end].tolist()):
+                configs[(a, b, c)] = n
+        if span is not None or create:
+            self.configs[key] = configs
+        return configs
+
+class OnlineStats:
+    """
+    ModelStats of the most recently opened models.
+    Changes to models that are not tracked are ignored, those models
+    are seeded from a full fetch when they are opened.
+    """
+    def __init__(self, reconcile_every: int = 1000, max_models: int = 32):
+        self.reconcile_every = reconcile_every
+        self.max_models = max_models
+        self._models: OrderedDict[int, ModelStats] = OrderedDict()
+        # Bumped by every change, a seed fetched before a change may miss it
+        self.version = 0
+
+    def get(self, model_id) -> ModelStats | None:
+        """
+        Tracked stats of the model, or None when it has to be seeded again.
+        """
+        key = _model_key(model_id)
+        stats = self._models.get(key)
+        if stats is None:
+            return None
+        if not stats.consistent or stats.changes >= self.reconcile_every:
+            return None
+        self._models.move_to_end(key)
+        return stats
+
+    def seed(self, model_id, washer1, washer2, spring, summary: PDModelSummary | None = None) -> ModelStats:
+        """
+        (Re)build the stats of a model from all of its columns, and its pd_model_summary row if given.
+        """
+        key = _model_key(model_id)
+        stats = ModelStats.from_columns(washer1, washer2, spring, summary)
+
+        old = self._models.get(key)
+        if old is not None and old.consistent and old.count == stats.count:
+            drift = abs(old.total.mean - stats.total.mean)
+            logger.debug("Reconciled stats of model %s after %d changes, drift %.3g", key, old.changes, drift)
+
+        self._models[key] = stats
+        self._models.move_to_end(key)
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+        return stats
+
+    def add(self, model_id, washer1: float, washer2: float, spring: float) -> None:
+        self.version += 1
+        stats = self._models.get(_model_key(model_id))
+        if stats is not None:
+            stats.add(float(washer1), float(washer2), float(spring))
+
+    def remove(self, model_id, washer1: float, washer2: float, spring: float) -> None:
+        self.version += 1
+        stats = self._models.get(_model_key(model_id))
+        if stats is not None:
+            stats.remove(float(washer1), float(washer2), float(spring))
+
+    def invalidate(self, model_id=None) -> None:
+        """
+        Forget one model, or all of them after bulk changes.
+        """
+        self.version += 1
+        if model_id is None:
+            self._models.clear()
+        else:
+            self._models.pop(_model_key(model_id), None)
+
+def _model_key(model_id) -> int:
+    return int(model_id)
+
+def _config(washer1: float, washer2: float, spring: float) -> tuple[float, float, float]:
+    return (round(washer1, 2), round(washer2, 2), round(spring, 2))
+
+def _total_key(config: tuple[float, float, float]) -> int:
+    return round(sum(config) * 100)
+
+def _decrement(counter: Counter, key) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+def _as_list(values) -> list[float]:
+    return values.tolist() if hasattr(values, "tolist") else [float(v) for v in values]
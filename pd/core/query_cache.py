@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/query_cache.py
+
+"""
+Read-through cache for small reference queries (models, opening pressures).
+Entries are keyed by query name and parameters and dropped as soon as
+the database changes:
+- PRAGMA data_version changes when any other connection commits,
+  including other processes and other workstations on a shared file,
+- the local write counter changes on every write of our own connection,
+  which data_version does not report.
+"""
+
+import sqlite3
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class QueryCache:
+    def __init__(self, conn: sqlite3.Connection, maxsize: int = 256):
+        self.conn = conn
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._version = None
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def note_write(self) -> None:
+        """
+        Called by the repository after every local write.
+        """
+        self._writes += 1
+
+    def get(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            version = self._current_version()
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+            try:
+                value = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            value = loader()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def _current_version(self) -> tuple[int, int]:
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self._writes)
+
+def cached_query(method):
+    """
+    Serve a repository read method from self.cache.
+    Lists are copied, callers may modify the result.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        value = self.cache.get((method.__name__, *args), lambda: method(self, *args))
+        return list(value) if isinstance(value, list) else value
+    return wrapper
@@ -2,24 +2,420 @@
 # License: GPL v3 Copyright: 2026, Mateusz Jamróz
 # pd/core/repositories.py
 
+import sys
 import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from pd.core.models import PD, PDView
+
+import numpy as np
+
+from pd.core.models import PD, PDView, PDModelSummary
+from pd.core.query_cache import QueryCache, cached_query
 
 # washer1 = lower washer
 # washer2 = upper washer
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PDRecord:
     washer1: float
     spring: float
     washer2: float
 
 
+# Row layout of the columnar fetch, one float64 field per column
+PD_COLUMNS_DTYPE = np.dtype([
+    ("washer1", "f8"),
+    ("washer2", "f8"),
+    ("spring", "f8"),
+    ("final_pressure", "f8"),
+])
+
+@dataclass(frozen=True)
+class PDColumns:
+    """
+    Columnar result set of one model, one contiguous float64 array per column.
+    """
+    washer1: np.ndarray
+    washer2: np.ndarray
+    spring: np.ndarray
+    final_pressure: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.washer1)
+
+    @property
+    def total(self) -> np.ndarray:
+        return self.washer1 + self.washer2 + self.spring
+
+    @classmethod
+    def from_rows(cls, rows) -> "PDColumns":
+        """
+        Build the columns from (washer1, washer2, spring, final_pressure) tuples
+        without creating a Python object per value.
+        """
+        data = np.fromiter(rows, dtype=PD_COLUMNS_DTYPE)
+        return cls(*(np.ascontiguousarray(data[name]) for name in PD_COLUMNS_DTYPE.names))
+
+
+@dataclass(frozen=True, slots=True)
+class Histogram:
+    """
+    Units per washer thickness (rounded to 0.01 mm), thicknesses ascending.
+    Its size depends on the distinct thicknesses, not on the unit count.
+    """
+    values: np.ndarray
+    counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    @classmethod
+    def from_pairs(cls, pairs) -> "Histogram":
+        """
+        (thickness, count) pairs as returned by GROUP BY ROUND(thickness, 2).
+        """
+        data = np.fromiter(pairs, dtype=[("value", "f8"), ("count", "i8")])
+        return cls(np.ascontiguousarray(data["value"]), np.ascontiguousarray(data["count"]))
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "Histogram":
+        """
+        Same bins from an already fetched column.
+        """
+        distinct, counts = np.unique(values, return_counts=True)
+        # round() like SQLite's ROUND (nearest double of the decimal), only per distinct value
+        rounded = np.fromiter((round(v, 2) for v in distinct.tolist()), dtype=np.float64, count=len(distinct))
+        values, inverse = np.unique(rounded, return_inverse=True)
+        return cls(values, np.bincount(inverse, weights=counts, minlength=len(values)).astype(np.int64))
+
+class ThicknessCounts:
+    """
+    Cumulative units over the 0.01 mm grid of the virtual washer slider:
+    cumulative[i] units are thinner than tick i (i/100 mm), so the units
+    at one tick are a difference of two entries.
+    """
+    def __init__(self, cumulative: np.ndarray):
+        self.cumulative = cumulative
+
+    @classmethod
+    def from_histogram(cls, histogram: Histogram, ticks: int = 0) -> "ThicknessCounts":
+        """
+        ticks: grid size at least, the grid also covers the thickest washer.
+        """
+        index = np.rint(histogram.values * 100).astype(np.int64)
+        keep = index >= 0
+        index, counts = index[keep], histogram.counts[keep]
+        size = max(ticks, int(index.max()) + 1 if len(index) else 0)
+        per_tick = np.bincount(index, weights=counts, minlength=size).astype(np.int64)
+        cumulative = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(per_tick, out=cumulative[1:])
+        return cls(cumulative)
+
+    def at(self, thickness: float) -> int:
+        """
+        Units with this thickness (rounded to 0.01 mm).
+        """
+        tick = round(thickness * 100)
+        if not 0 <= tick < len(self.cumulative) - 1:
+            return 0
+        return int(self.cumulative[tick + 1] - self.cumulative[tick])
+
+    def add(self, thickness: float, delta: int = 1) -> None:
+        """
+        Count a unit in (delta=1) or out (delta=-1) after a change event.
+        """
+        tick = round(thickness * 100)
+        if tick < 0:
+            return
+        if tick >= len(self.cumulative) - 1:
+            # Thicker than the grid, extend it with the running total
+            self.cumulative = np.pad(self.cumulative, (0, tick + 2 - len(self.cumulative)), mode="edge")
+        self.cumulative[tick + 1:] += delta
+
+# Row layout of the unit table, model names are kept once per model
+# Columns of the unit table pages can be sorted by, see PDRepository.get_view_page
+VIEW_SORTS = {
+    "id": "pd.id",
+    "model_id": "pd.model_id",
+    "washer1": "pd.washer1_thickness",
+    "washer2": "pd.washer2_thickness",
+    "spring_length": "pd.spring_length",
+    "final_pressure": "pd.final_pressure",
+}
+# Sorted by a value looked up through pd's key, paged one value at a time
+VIEW_GROUPED_SORTS = ("model_name", "opening_pressure")
+
+PD_VIEW_DTYPE = np.dtype([
+    ("id", "i8"),
+    ("model_id", "i8"),
+    ("opening_pressure", "i8"),
+    ("washer1", "f8"),
+    ("washer2", "f8"),
+    ("spring_length", "f8"),
+    ("final_pressure", "f8"),
+])
+
+class PDViewTable:
+    """
+    Unit table with the columns of PDView stored in contiguous arrays.
+    Model names are stored once per model (interned), rows are
+    materialized as PDViewRow views only when accessed.
+    """
+    __slots__ = ("id", "model_id", "opening_pressure", "washer1", "washer2",
+                 "spring_length", "final_pressure", "model_names")
+
+    def __init__(self, data: np.ndarray, model_names: dict[int, str]):
+        for name in PD_VIEW_DTYPE.names:
+            setattr(self, name, np.ascontiguousarray(data[name]))
+        self.model_names = model_names
+
+    @classmethod
+    def from_rows(cls, rows, model_names: dict[int, str]) -> "PDViewTable":
+        """
+        rows: (id, model_id, opening_pressure, washer1, washer2, spring_length, final_pressure)
+        """
+        return cls(np.fromiter(rows, dtype=PD_VIEW_DTYPE), model_names)
+
+    @classmethod
+    def from_views(cls, views: Iterable[PDView]) -> "PDViewTable":
+        views = list(views)
+        model_names = {int(v.model_id): sys.intern(v.model_name) for v in views if v.model_name is not None}
+        return cls.from_rows((_view_row(v) for v in views), model_names)
+
+    @classmethod
+    def concat(cls, tables: list["PDViewTable"]) -> "PDViewTable":
+        data = np.empty(sum(len(t) for t in tables), dtype=PD_VIEW_DTYPE)
+        model_names = {}
+        start = 0
+        for table in tables:
+            end = start + len(table)
+            for name in PD_VIEW_DTYPE.names:
+                data[name][start:end] = getattr(table, name)
+            model_names.update(table.model_names)
+            start = end
+        return cls(data, model_names)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __getitem__(self, index: int) -> "PDViewRow":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return PDViewRow(self, index)
+
+    def __iter__(self) -> Iterator["PDViewRow"]:
+        for index in range(len(self)):
+            yield PDViewRow(self, index)
+
+    def model_name_at(self, index: int) -> str:
+        return self.model_names.get(int(self.model_id[index]), "")
+
+    def sort_key(self, column: str, index: int) -> tuple:
+        """
+        (value, id) of a row, the keyset of PDRepository.get_view_page sorted by column.
+        """
+        if column == "model_name":
+            value = self.model_name_at(index)
+        else:
+            value = getattr(self, column)[index].item()
+        return (value, int(self.id[index]))
+
+    def set_row(self, index: int, view: PDView) -> None:
+        """
+        Overwrite one row in place, e.g. after the unit was edited.
+        """
+        for name, value in zip(PD_VIEW_DTYPE.names, _view_row(view)):
+            getattr(self, name)[index] = value
+        if view.model_name is not None:
+            self.model_names[int(view.model_id)] = sys.intern(view.model_name)
+
+    def inserted(self, index: int, view: PDView) -> "PDViewTable":
+        """
+        Copy of the table with view inserted before row index.
+        """
+        data = np.empty(len(self) + 1, dtype=PD_VIEW_DTYPE)
+        for name, value in zip(PD_VIEW_DTYPE.names, _view_row(view)):
+            data[name] = np.insert(getattr(self, name), index, value)
+        if view.model_name is not None:
+            self.model_names[int(view.model_id)] = sys.intern(view.model_name)
+        return PDViewTable(data, self.model_names)
+
+    def take(self, rows: np.ndarray) -> "PDViewTable":
+        """
+        Copy of the table with only these rows.
+        """
+        data = np.empty(len(rows), dtype=PD_VIEW_DTYPE)
+        for name in PD_VIEW_DTYPE.names:
+            data[name] = getattr(self, name)[rows]
+        return PDViewTable(data, self.model_names)
+
+    def without(self, index: int) -> "PDViewTable":
+        """
+        Copy of the table with one row removed.
+        """
+        data = np.empty(len(self) - 1, dtype=PD_VIEW_DTYPE)
+        for name in PD_VIEW_DTYPE.names:
+            data[name] = np.delete(getattr(self, name), index)
+        return PDViewTable(data, self.model_names)
+
+def _view_row(view: PDView) -> tuple:
+    return (
+        view.id,
+        int(view.model_id),
+        view.opening_pressure or 0,
+        view.washer1,
+        view.washer2,
+        view.spring_length,
+        view.final_pressure,
+    )
+
+class PDViewRow:
+    """
+    Read-only view of one PDViewTable row, with the attributes of PDView.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: PDViewTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def id(self) -> int:
+        return int(self._table.id[self._index])
+
+    @property
+    def model_id(self) -> int:
+        return int(self._table.model_id[self._index])
+
+    @property
+    def model_name(self) -> str:
+        return self._table.model_name_at(self._index)
+
+    @property
+    def opening_pressure(self) -> int:
+        return int(self._table.opening_pressure[self._index])
+
+    @property
+    def washer1(self) -> float:
+        return float(self._table.washer1[self._index])
+
+    @property
+    def washer2(self) -> float:
+        return float(self._table.washer2[self._index])
+
+    @property
+    def spring_length(self) -> float:
+        return float(self._table.spring_length[self._index])
+
+    @property
+    def final_pressure(self) -> float:
+        return float(self._table.final_pressure[self._index])
+
+    def to_view(self) -> PDView:
+        return PDView(
+            self.id,
+            self.model_id,
+            self.model_name,
+            self.opening_pressure,
+            self.washer1,
+            self.washer2,
+            self.spring_length,
+            self.final_pressure
+        )
+
+
 class PDRepository:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
+        # Reference queries (models, opening pressures), see pd.core.query_cache
+        self.cache = QueryCache(conn)
+
+        # Unit of work state, see transaction() and defer_commits()
+        self._tx_depth = 0
+        self._defer_depth = 0
+        self._max_pending = 0
+        self._pending = 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single commit.
+        Nested transactions join the outermost one. On error only the
+        writes made inside the transaction are rolled back, writes still
+        waiting in a write-behind queue are kept.
+        """
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield self
+            finally:
+                self._tx_depth -= 1
+            return
+
+        if self._defer_depth and not self.conn.in_transaction:
+            # Keep the transaction open after RELEASE for the write-behind queue
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT pd_unit_of_work")
+        self._tx_depth = 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth = 0
+            self.cache.note_write()
+            self.conn.execute("ROLLBACK TO pd_unit_of_work")
+            self.conn.execute("RELEASE pd_unit_of_work")
+            raise
+        self._tx_depth = 0
+        self.conn.execute("RELEASE pd_unit_of_work")
+        self._commit()
+
+    def defer_commits(self, max_pending: int) -> None:
+        """
+        Keep writes uncommitted until max_pending of them are queued
+        or flush() is called. Used by pd.core.unit_of_work.WriteBehindQueue.
+        """
+        self._defer_depth += 1
+        if self._defer_depth == 1 or max_pending < self._max_pending:
+            self._max_pending = max_pending
 
+    def resume_commits(self) -> None:
+        self.flush()
+        self._defer_depth = max(0, self._defer_depth - 1)
+
+    def flush(self) -> None:
+        """
+        Commit writes queued by defer_commits().
+        """
+        if self._tx_depth:
+            return
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self._pending = 0
+
+    @property
+    def pending_writes(self) -> int:
+        return self._pending
+
+    def _commit(self) -> None:
+        # Called after every write, also inside transactions
+        self.cache.note_write()
+        if self._tx_depth:
+            return
+        if self._defer_depth:
+            self._pending += 1
+            if self._pending < self._max_pending:
+                return
+        self.conn.commit()
+        self._pending = 0
+
+    @cached_query
     def get_models(self):
         """
         Only models of pump units, like 0414720215, without duplicates
@@ -28,6 +424,13 @@ class PDRepository:
         cursor.execute("SELECT id, model_name FROM pd_models")
         return cursor.fetchall()
     
+    @cached_query
+    def get_model_name(self, model_id: str) -> str | None:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT model_name FROM pd_models WHERE id = ?", (model_id,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
     def get_unit_by_pd_id(self, pd_id: str) -> PD | None:
         cursor = self.conn.cursor()
         cursor.execute(
@@ -61,7 +464,7 @@ class PDRepository:
                 pd.id
             )
         )
-        self.conn.commit()
+        self._commit()
     
     def count_by_model(self, model_id: str) -> int:
         """
@@ -69,16 +472,93 @@ class PDRepository:
         """
         cur = self.conn.cursor()
         cur.execute(
-            "SELECT COUNT(*) FROM pd WHERE model_id = ?",
+            "SELECT n FROM pd_model_summary WHERE model_id = ?",
             (model_id,)
         )
-        return cur.fetchone()[0]
+        row = cur.fetchone()
+        return row[0] if row else 0
+
+    def get_model_counts(self) -> dict[int, int]:
+        """
+        Number of pump units of every model that has any, from pd_model_summary
+        """
+        cur = self.conn.execute("SELECT model_id, n FROM pd_model_summary WHERE n > 0")
+        return dict(cur.fetchall())
+
+    def get_model_summary(self, model_id: str) -> PDModelSummary | None:
+        """
+        Count, averages and sample variances from the trigger-maintained pd_model_summary
+        """
+        cur = self.conn.cursor()
+        cur.execute(
+            """
+            SELECT n, sum_washer1, sumsq_washer1, sum_washer2, sumsq_washer2,
+                   sum_spring, sumsq_spring, sum_total, sumsq_total
+            FROM pd_model_summary
+            WHERE model_id = ?
+            """,
+            (model_id,)
+        )
+        row = cur.fetchone()
+        if not row or row[0] <= 0:
+            return None
+
+        n = row[0]
+
+        def mean_var(total, total_sq):
+            mean = total / n
+            if n < 2:
+                return mean, 0.0
+            # Clamp rounding noise of the running sums
+            return mean, max(0.0, (total_sq - total * mean) / (n - 1))
+
+        avg_lower, var_lower = mean_var(row[1], row[2])
+        avg_upper, var_upper = mean_var(row[3], row[4])
+        avg_spring, var_spring = mean_var(row[5], row[6])
+        avg_total, var_total = mean_var(row[7], row[8])
+
+        return PDModelSummary(
+            model_id=model_id,
+            count=n,
+            avg_lower=avg_lower,
+            avg_upper=avg_upper,
+            avg_spring=avg_spring,
+            avg_total=avg_total,
+            var_lower=var_lower,
+            var_upper=var_upper,
+            var_spring=var_spring,
+            var_total=var_total
+        )
+
+    def rebuild_model_summary(self) -> None:
+        """
+        Recompute pd_model_summary from scratch, e.g. to drop floating point drift
+        """
+        with self.transaction():
+            self.conn.execute("DELETE FROM pd_model_summary")
+            self.conn.execute(
+                """
+                INSERT INTO pd_model_summary
+                SELECT
+                    model_id,
+                    COUNT(*),
+                    SUM(washer1_thickness), SUM(washer1_thickness * washer1_thickness),
+                    SUM(washer2_thickness), SUM(washer2_thickness * washer2_thickness),
+                    SUM(spring_length), SUM(spring_length * spring_length),
+                    SUM(washer1_thickness + washer2_thickness + spring_length),
+                    SUM((washer1_thickness + washer2_thickness + spring_length) * (washer1_thickness + washer2_thickness + spring_length))
+                FROM pd
+                GROUP BY model_id
+                """
+            )
 
+    @cached_query
     def get_opening_pressures(self):
         cursor = self.conn.cursor()
         cursor.execute("SELECT id, value FROM pd_opening_pressure")
         return cursor.fetchall()
     
+    @cached_query
     def get_opening_press_value(self, opening_pressure_id: int) -> float:
         cursor = self.conn.cursor()
         cursor.execute("SELECT value FROM pd_opening_pressure WHERE id = ?", (opening_pressure_id,))
@@ -105,6 +585,40 @@ class PDRepository:
             for row in cur.fetchall()
         ]
     
+    def get_columns_by_model(self, model_id: str) -> PDColumns:
+        cur = self.conn.cursor()
+        cur.execute(
+            """
+            SELECT washer1_thickness, washer2_thickness, spring_length, final_pressure
+            FROM pd
+            WHERE model_id = ?
+            """,
+            (model_id,)
+        )
+        return PDColumns.from_rows(cur)
+
+    def get_washer_histograms(self, model_id: str) -> tuple[Histogram, Histogram]:
+        """
+        (lower, upper) washer histograms of a model, aggregated by SQLite over idx_pd_model
+        """
+        return (
+            self._washer_histogram("washer1_thickness", model_id),
+            self._washer_histogram("washer2_thickness", model_id),
+        )
+
+    def _washer_histogram(self, column: str, model_id: str) -> Histogram:
+        cur = self.conn.execute(
+            f"""
+            SELECT ROUND({column}, 2) AS thickness, COUNT(*)
+            FROM pd
+            WHERE model_id = ?
+            GROUP BY thickness
+            ORDER BY thickness
+            """,
+            (model_id,)
+        )
+        return Histogram.from_pairs(cur)
+
     def get_washers_by_model(self, model_id: str) -> tuple[list[float], list[float]]:
         cur = self.conn.cursor()
         cur.execute(
@@ -135,9 +649,189 @@ class PDRepository:
             """
         )
         rows = cursor.fetchall()
-        return [PDView(*row) for row in rows]
-    
-    def add(self, pd: PD) -> None:
+        # One string object per model name instead of one per row
+        return [PDView(r[0], r[1], sys.intern(r[2]) if r[2] is not None else None, *r[3:]) for r in rows]
+
+    def get_view_table(self, model_id=None, opening_pressure_id=None) -> PDViewTable:
+        """
+        The unit table (optionally filtered) as a PDViewTable, without a Python object per row.
+        """
+        where, params = self._view_filter(model_id, opening_pressure_id)
+        return self._view_table(where, params)
+
+    def get_view_row(self, pd_id: int) -> PDView | None:
+        """
+        One unit as shown in the unit table.
+        """
+        table = self._view_table("WHERE pd.id = ?", (pd_id,))
+        return table[0].to_view() if len(table) else None
+
+    def get_view_page(
+            self,
+            after: tuple | None = None,
+            limit: int = 1000,
+            model_ids=None,
+            sort: str = "id",
+            descending: bool = False
+        ) -> PDViewTable:
+        """
+        Keyset page of the unit table: up to limit rows in (sort, id) order,
+        following the row whose PDViewTable.sort_key is after (None for the first page).
+        sort is a PDViewTable column, model_ids restricts the page to these models,
+        e.g. the result of a search.
+        """
+        if sort in VIEW_GROUPED_SORTS:
+            return self._view_page_grouped(after, limit, model_ids, sort, descending)
+
+        column = VIEW_SORTS[sort]
+        direction, op = (" DESC", "<") if descending else ("", ">")
+        clauses = []
+        params = []
+        if after is not None:
+            if sort == "id":
+                clauses.append(f"pd.id {op} ?")
+                params.append(after[1])
+            else:
+                clauses.append(f"({column}, pd.id) {op} (?, ?)")
+                params.extend(after)
+        index = None
+        if model_ids is not None:
+            model_ids = list(model_ids)
+            clauses.append(f"pd.model_id IN ({', '.join('?' * len(model_ids))})")
+            params.extend(model_ids)
+            # Without per-value statistics SQLite may walk the whole table for a few rare models
+            if self._few_rows(model_ids, limit):
+                index = "idx_pd_model_id"
+        if sort == "model_id":
+            index = "idx_pd_model_id"
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = f"pd.id{direction}" if sort == "id" else f"{column}{direction}, pd.id{direction}"
+        return self._view_table(where, tuple(params), limit, index, order)
+
+    def _view_page_grouped(self, after, limit, model_ids, sort, descending) -> PDViewTable:
+        """
+        Page sorted by a column of a lookup table (model name, opening pressure value):
+        the rows of every value are read in id order through the index on pd's key.
+        """
+        if sort == "model_name":
+            counts = self.get_model_counts()
+            keep = counts.keys() if model_ids is None else counts.keys() & set(model_ids)
+            lookup = [(name, mid) for mid, name in self.get_models() if mid in keep]
+            column, index = "pd.model_id", "idx_pd_model_id"
+        else:
+            lookup = [(value, oid) for oid, value in self.get_opening_pressures()]
+            column, index = "pd.opening_pressure_id", "idx_pd_opening_pressure"
+            if model_ids is not None and self._few_rows(list(model_ids), limit):
+                index = "idx_pd_model_id"
+        groups: dict = {}
+        for key, key_id in lookup:
+            groups.setdefault(key, []).append(key_id)
+        keys = sorted(groups, reverse=descending)
+        if after is not None:
+            keys = [k for k in keys if (k <= after[0] if descending else k >= after[0])]
+
+        direction, op = (" DESC", "<") if descending else ("", ">")
+        pages = []
+        for key in keys:
+            ids = groups[key]
+            clauses = [f"{column} IN ({', '.join('?' * len(ids))})"]
+            params = list(ids)
+            if after is not None and key == after[0]:
+                clauses.append(f"pd.id {op} ?")
+                params.append(after[1])
+            if model_ids is not None and sort != "model_name":
+                clauses.append(f"pd.model_id IN ({', '.join('?' * len(model_ids))})")
+                params.extend(model_ids)
+            page = self._view_table(
+                f"WHERE {' AND '.join(clauses)}", tuple(params), limit, index, f"pd.id{direction}"
+            )
+            pages.append(page)
+            limit -= len(page)
+            if limit <= 0:
+                break
+        return pages[0] if len(pages) == 1 else PDViewTable.concat(pages)
+
+    def _few_rows(self, model_ids: list, limit: int) -> bool:
+        """
+        Whether the rows of these models are better read through idx_pd_model_id and
+        sorted, than found by walking a sort index: m matching rows out of n are
+        sorted in about m steps, the walk takes about limit * n / m.
+        """
+        counts = self.get_model_counts()
+        matched = sum(counts.get(model_id, 0) for model_id in model_ids)
+        return matched * matched <= limit * sum(counts.values())
+
+    def _view_table(
+            self,
+            where: str,
+            params: tuple,
+            limit: int | None = None,
+            index: str | None = None,
+            order: str = "pd.id"
+        ) -> PDViewTable:
+        model_names = {mid: sys.intern(name) for mid, name in self.get_models()}
+        where += f" ORDER BY {order}"
+        if limit is not None:
+            where += " LIMIT ?"
+            params += (limit,)
+        indexed = f"INDEXED BY {index}" if index is not None else ""
+        cursor = self.conn.execute(
+            f"""
+            SELECT pd.id, pd.model_id, COALESCE(op.value, 0),
+                   pd.washer1_thickness, pd.washer2_thickness, pd.spring_length, pd.final_pressure
+            FROM pd {indexed}
+            LEFT JOIN pd_opening_pressure op ON pd.opening_pressure_id = op.id
+            {where}
+            """,
+            params
+        )
+        return PDViewTable.from_rows(cursor, model_names)
+
+    def _view_filter(self, model_id, opening_pressure_id) -> tuple[str, tuple]:
+        clauses = []
+        params = []
+        if model_id is not None:
+            clauses.append("pd.model_id = ?")
+            params.append(model_id)
+        if opening_pressure_id is not None:
+            clauses.append("pd.opening_pressure_id = ?")
+            params.append(opening_pressure_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    def count_all_with_name(self, model_id=None, opening_pressure_id=None) -> int:
+        where, params = self._view_filter(model_id, opening_pressure_id)
+        cur = self.conn.cursor()
+        cur.execute(f"SELECT COUNT(*) FROM pd {where}", params)
+        return cur.fetchone()[0]
+
+    def iter_all_with_name(
+        self,
+        model_id=None,
+        opening_pressure_id=None,
+        chunk_size: int = 1000
+    ) -> Iterator[tuple]:
+        """
+        Stream the same rows as get_all_with_name as plain tuples,
+        fetching chunk_size rows at a time.
+        """
+        where, params = self._view_filter(model_id, opening_pressure_id)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT pd.id, pd.model_id, m.model_name, op.value, pd.washer1_thickness, pd.washer2_thickness, pd.spring_length, pd.final_pressure
+            FROM pd
+            LEFT JOIN pd_models m ON pd.model_id = m.id
+            LEFT JOIN pd_opening_pressure op ON pd.opening_pressure_id = op.id
+            {where}
+            ORDER BY pd.id
+            """,
+            params
+        )
+        while rows := cursor.fetchmany(chunk_size):
+            yield from rows
+
+    def add(self, pd: PD) -> int:
         cursor = self.conn.cursor()
         cursor.execute(
             "INSERT INTO pd (model_id, washer1_thickness, washer2_thickness, spring_length, final_pressure, opening_pressure_id) VALUES (?, ?, ?, ?, ?, ?)",
@@ -150,7 +844,8 @@ class PDRepository:
                 pd.opening_pressure_id
             )
         )
-        self.conn.commit()
+        self._commit()
+        return cursor.lastrowid
 
     def insert(
         self,
@@ -160,8 +855,8 @@ class PDRepository:
         spring_length,
         final_pressure,
         opening_pressure
-    ):
-        self.conn.execute(
+    ) -> int:
+        cursor = self.conn.execute(
             """
             INSERT INTO pd (
                 model_id,
@@ -181,18 +876,43 @@ class PDRepository:
                 opening_pressure
             )
         )
-        self.conn.commit()
+        self._commit()
+        return cursor.lastrowid
 
-    def insert_model(self, model_name: str) -> None:
-        self.conn.execute(
+    def insert_many(self, rows: Iterable[tuple]) -> int:
+        """
+        Insert many pump units in a single transaction.
+        Each row is (model_id, washer1, washer2, spring_length, final_pressure, opening_pressure_id).
+        rows may be a generator, it is consumed lazily by executemany.
+        Returns the number of inserted rows.
+        """
+        with self.transaction():
+            cur = self.conn.executemany(
+                """
+                INSERT INTO pd (
+                    model_id,
+                    washer1_thickness,
+                    washer2_thickness,
+                    spring_length,
+                    final_pressure,
+                    opening_pressure_id
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+        return cur.rowcount
+
+    def insert_model(self, model_name: str) -> int:
+        cursor = self.conn.execute(
             "INSERT INTO pd_models (model_name) VALUES (?)",
             (model_name,)
         )
-        self.conn.commit()
+        self._commit()
+        return cursor.lastrowid
 
     def delete(self, pd_id: int) -> None:
         self.conn.execute(
             "DELETE FROM pd WHERE id = ?",
             (pd_id,)
         )
-        self.conn.commit()
\ No newline at end of file
+        self._commit()
\ No newline at end of file
@@ -2,34 +2,238 @@
 # License: GPL v3 Copyright: 2026, Mateusz Jamróz
 # pd/core/services.py
 
-from pd.core.models import PD
-from pd.core.repositories import PDRepository
-from pd.core.statistics import PDStats, compute_stats
+import copy
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from pd.core.models import PD, PDModelSummary
+from pd.core.repositories import PDRepository, PDViewTable, Histogram
+from pd.core.importer import UnitImporter, ImportResult
+from pd.core.exporter import export_units
+from pd.core.unit_of_work import WriteBehindQueue
+from pd.core.statistics import PDStats, StatsOptions
+from pd.core.online_stats import OnlineStats, ModelStats
 from pd.core.models import PDView
+from pd.core.events import (
+    EventHub,
+    UnitAdded,
+    UnitUpdated,
+    UnitDeleted,
+    ModelAdded,
+    UnitsReloaded,
+)
+
+@dataclass
+class ModelSnapshot:
+    """
+    Everything the charts and the stats panel need for one model.
+    """
+    model_id: str
+    model_name: str
+    count: int
+    lower: Histogram
+    upper: Histogram
+    stats: PDStats | None
+
 
 class PDService:
-    def __init__(self, repo: PDRepository):
+    def __init__(self, repo: PDRepository, stats_options: StatsOptions | None = None):
         self.repo = repo
+        self.stats_options = stats_options or StatsOptions()
+        # Stats of opened models, kept up to date by add_new, update_unit and delete_unit
+        self.live_stats = OnlineStats()
+        self._stats_lock = threading.RLock()
+        self._writer = repo
+        # Change events for the views, see pd.core.events
+        self.events = EventHub()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager committing all writes made inside it at once.
+        """
+        try:
+            with self.repo.transaction():
+                yield
+        except BaseException:
+            # The deltas and events of the rolled back writes are already out
+            self._invalidate_stats()
+            self.events.emit(UnitsReloaded())
+            raise
+
+    def with_repo(self, repo: PDRepository) -> "PDService":
+        """
+        The same service reading through another repository, e.g. one on
+        a worker thread's read-only connection. Options, incremental stats
+        and events are shared with this service.
+        """
+        service = copy.copy(self)
+        service.repo = repo
+        return service
+
+    def write_behind(self, max_pending: int = 50) -> WriteBehindQueue:
+        """
+        Coalesce the following writes into fewer commits until the queue is closed.
+        """
+        return WriteBehindQueue(self.repo, max_pending=max_pending)
+
+    def flush_writes(self) -> None:
+        """
+        Commit writes waiting in a write-behind queue, so that reads on
+        other connections (pd.ui.query_executor) see them. Call it from
+        the thread of the writing connection.
+        """
+        if self._writer.pending_writes:
+            self._writer.flush()
+
+    def cache_info(self):
+        """
+        Hit/miss counters of the repository's reference query cache.
+        """
+        return self.repo.cache.info()
 
     def get_model_name(self, model_id: str) -> str:
-        models = self.repo.get_models()
-        for mid, name in models:
-            if str(mid) == str(model_id):
-                return name
-        return "Unknown Model"
+        name = self.repo.get_model_name(model_id)
+        return name if name is not None else "Unknown Model"
+
+    def model_snapshot(self, model_id: str) -> ModelSnapshot:
+        """
+        Name, count, washer histograms and stats of a model.
+        The rows are fetched only to seed untracked stats (with the
+        model's pd_model_summary row), otherwise SQLite returns just
+        the histogram bins.
+        """
+        stats = self._tracked(model_id)
+        if stats is not None:
+            lower, upper = self.repo.get_washer_histograms(model_id)
+        else:
+            version = self.live_stats.version
+            summary = self.model_summary(model_id)
+            columns = self.repo.get_columns_by_model(model_id)
+            stats = self._live_stats(model_id, columns, version, summary)
+            lower, upper = Histogram.from_values(columns.washer1), Histogram.from_values(columns.washer2)
+        return ModelSnapshot(
+            model_id=model_id,
+            model_name=self.get_model_name(model_id),
+            count=lower.total,
+            lower=lower,
+            upper=upper,
+            stats=stats
+        )
     
     def unit_info(self, pd_id: str) -> PD | None:
         return self.repo.get_unit_by_pd_id(pd_id)
     
     def update_unit(self, pd: PD) -> None:
+        old = self.repo.get_view_row(pd.id)
         self.repo.update(pd)
+        new = self.repo.get_view_row(pd.id)
+        if old is not None:
+            self._remove_delta(old)
+        if new is not None:
+            self._add_delta(new)
+        if old is not None and new is not None:
+            self.events.emit(UnitUpdated(old, new))
     
     def get_models(self):
         return self.repo.get_models()
     
     def get_model_stats(self, model_id: str) -> PDStats | None:
-        records = self.repo.get_wash1_2_spring_by_model(model_id)
-        return compute_stats(records)
+        stats = self._tracked(model_id)
+        if stats is not None:
+            return stats
+        version = self.live_stats.version
+        summary = self.model_summary(model_id)
+        return self._live_stats(model_id, self.repo.get_columns_by_model(model_id), version, summary)
+
+    def _tracked(self, model_id: str) -> PDStats | None:
+        """
+        Stats of a tracked model, None when it has to be (re)seeded.
+        """
+        with self._stats_lock:
+            tracked = self.live_stats.get(model_id)
+            if tracked is None or tracked.count == 0:
+                return None
+            return self._tracked_stats(tracked)
+
+    def _live_stats(
+            self,
+            model_id: str,
+            columns,
+            version: int,
+            summary: PDModelSummary | None = None
+        ) -> PDStats | None:
+        """
+        Stats from the incremental layer, seeded (or reconciled) from columns when needed.
+        version is live_stats.version from before columns were fetched, the
+        model's pd_model_summary row (if any) provides the means and variances.
+        """
+        with self._stats_lock:
+            tracked = self.live_stats.get(model_id)
+            if tracked is None:
+                if not self._can_seed(version):
+                    # Columns may miss a change, use them once without tracking
+                    return self._tracked_stats(ModelStats.from_columns(columns.washer1, columns.washer2, columns.spring, summary))
+                tracked = self.live_stats.seed(model_id, columns.washer1, columns.washer2, columns.spring, summary)
+            return self._tracked_stats(tracked)
+
+    def _can_seed(self, version: int) -> bool:
+        if self.live_stats.version != version:
+            return False  # Changed while the columns were fetched
+        # Other connections do not see writes waiting in a write-behind queue
+        return self.repo is self._writer or not self._writer.conn.in_transaction
+
+    def _tracked_stats(self, tracked) -> PDStats | None:
+        options = self.stats_options
+        return tracked.stats(
+            percentiles=options.percentiles,
+            tolerance=options.tolerance,
+            min_count=options.min_count
+        )
+
+    def _add_delta(self, unit: PDView) -> None:
+        with self._stats_lock:
+            self.live_stats.add(unit.model_id, unit.washer1, unit.washer2, unit.spring_length)
+
+    def _remove_delta(self, unit: PDView) -> None:
+        with self._stats_lock:
+            self.live_stats.remove(unit.model_id, unit.washer1, unit.washer2, unit.spring_length)
+
+    def _invalidate_stats(self) -> None:
+        with self._stats_lock:
+            self.live_stats.invalidate()
+
+    def _unit_added(self, pd_id: int) -> None:
+        unit = self.repo.get_view_row(pd_id)
+        if unit is not None:
+            self._add_delta(unit)
+            self.events.emit(UnitAdded(unit))
+
+    def warmup_order(self, recent=()) -> list[int]:
+        """
+        Models worth precomputing stats for: the ones with most units,
+        then the recently used ones (recent is newest first). As many as
+        the incremental stats keep, at most half of them recent.
+        """
+        counts = self.repo.get_model_counts()
+        limit = self.live_stats.max_models
+        recent = list(dict.fromkeys(int(m) for m in recent if int(m) in counts))[:limit // 2]
+        biggest = [m for m in sorted(counts, key=counts.get, reverse=True) if m not in recent]
+        return biggest[:limit - len(recent)] + recent
+
+    def model_summary(self, model_id: str) -> PDModelSummary | None:
+        """
+        Count, averages and variances of a model in a single-row lookup.
+        """
+        return self.repo.get_model_summary(model_id)
+
+    def rebuild_model_summary(self) -> None:
+        self.repo.rebuild_model_summary()
+        self._invalidate_stats()
 
     def get_opening_pressures(self):
         return self.repo.get_opening_pressures()
@@ -41,10 +245,18 @@ class PDService:
         return self.repo.get_all()
     
     def delete_unit(self, pd_id: int) -> None:
+        old = self.repo.get_view_row(pd_id)
         self.repo.delete(pd_id)
+        if old is not None:
+            self._remove_delta(old)
+            self.events.emit(UnitDeleted(old))
     
-    def washers_distribution(self, model_id: str) -> tuple[list[float], list[float]]:
-        return self.repo.get_washers_by_model(model_id)
+    def washers_distribution(self, model_id: str) -> tuple[np.ndarray, np.ndarray]:
+        columns = self.repo.get_columns_by_model(model_id)
+        return columns.washer1, columns.washer2
+
+    def washer_histograms(self, model_id: str) -> tuple[Histogram, Histogram]:
+        return self.repo.get_washer_histograms(model_id)
     
     def count_model(self, model_id: str) -> int:
         return self.repo.count_by_model(model_id)
@@ -76,7 +288,7 @@ class PDService:
             opening_pressure_id
         ]):
             raise ValueError("Wszystkie pola muszą być wypełnione.")
-        self.repo.add(pd)
+        self._unit_added(self.repo.add(pd))
 
     def add_new(
         self,
@@ -90,7 +302,7 @@ class PDService:
         if not model_id:
             raise ValueError("Model ID is required.")
         
-        self.repo.insert(
+        pd_id = self.repo.insert(
             model_id,
             washer1,
             washer2,
@@ -98,11 +310,50 @@ class PDService:
             final_pressure,
             opening_pressure
         )
+        self._unit_added(pd_id)
 
     def add_model(self, model_name: str) -> None:
         if not model_name:
             raise ValueError("Model name cannot be empty.")
-        self.repo.insert_model(model_name)
+        model_id = self.repo.insert_model(model_name)
+        self.events.emit(ModelAdded(model_id, model_name))
     
     def list_models_with_name(self) -> list[PDView]:
-        return self.repo.get_all_with_name()
\ No newline at end of file
+        return self.repo.get_all_with_name()
+
+    def view_table(self, model_id=None, opening_pressure_id=None) -> PDViewTable:
+        return self.repo.get_view_table(model_id, opening_pressure_id)
+
+    def view_page(
+            self,
+            after: tuple | None = None,
+            limit: int = 1000,
+            model_ids=None,
+            sort: str = "id",
+            descending: bool = False
+        ) -> PDViewTable:
+        return self.repo.get_view_page(after, limit, model_ids, sort, descending)
+
+    def import_units(self, path: Path, progress=None) -> ImportResult:
+        try:
+            return UnitImporter(self.repo).import_file(path, progress=progress)
+        finally:
+            self._invalidate_stats()
+            self.events.emit(UnitsReloaded())
+
+    def export_units(
+        self,
+        path: Path,
+        model_id=None,
+        opening_pressure_id=None,
+        progress=None,
+        cancelled=None
+    ) -> int:
+        return export_units(
+            self.repo,
+            path,
+            model_id=model_id,
+            opening_pressure_id=opening_pressure_id,
+            progress=progress,
+            cancelled=cancelled
+        )
\ No newline at end of file
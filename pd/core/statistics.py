@@ -5,14 +5,73 @@
 """
 Docstring for pd.core.statistics
 All magic happens here.
+
+Column statistics are computed with NumPy when it is available,
+otherwise with the pure-Python fallback. Both use the same
+definitions: sample standard deviation and linearly interpolated
+percentiles (NumPy's default method).
 """
 
-from statistics import mean, median
+import math
+import bisect
 from collections import Counter
-from itertools import combinations
-from dataclasses import dataclass
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pd.core.models import PDModelSummary
+
+if TYPE_CHECKING:
+    from pd.core.repositories import PDRecord, PDColumns
+
+DEFAULT_PERCENTILES = (5.0, 95.0)
+DEFAULT_TOLERANCE = 0.03    # mm
+DEFAULT_MIN_COUNT = 5
+
+# Absorbs float noise when comparing totals against the tolerance
+TOLERANCE_EPS = 1e-9
+
+@dataclass(frozen=True)
+class StatsOptions:
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+    tolerance: float = DEFAULT_TOLERANCE
+    min_count: int = DEFAULT_MIN_COUNT
+
+    @classmethod
+    def from_config(cls, config: ConfigParser) -> "StatsOptions":
+        section = config["statistics"]
+        raw = section.get("percentiles", "")
+        try:
+            percentiles = tuple(sorted(
+                float(p) for p in raw.replace(";", ",").split(",") if p.strip()
+            ))
+        except ValueError:
+            percentiles = DEFAULT_PERCENTILES
+        if any(not 0 <= p <= 100 for p in percentiles):
+            percentiles = DEFAULT_PERCENTILES
+
+        tolerance = section.getfloat("tolerance", fallback=DEFAULT_TOLERANCE)
+        min_count = section.getint("min_count", fallback=DEFAULT_MIN_COUNT)
+
+        return cls(
+            percentiles=percentiles,
+            tolerance=max(0.0, tolerance),
+            min_count=max(1, min_count)
+        )
 
-from pd.core.repositories import PDRecord
+@dataclass
+class ColumnStats:
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    percentiles: dict[float, float] = field(default_factory=dict)
 
 @dataclass
 class PDStats:
@@ -23,54 +82,259 @@ class PDStats:
     median_lower: float
     median_upper: float
     common_config: tuple[float, float, float] | None # lower, upper, spring
+    # Spread
+    std_lower: float = 0.0
+    std_upper: float = 0.0
+    std_spring: float = 0.0
+    std_total: float = 0.0
+    min_lower: float = 0.0
+    max_lower: float = 0.0
+    min_upper: float = 0.0
+    max_upper: float = 0.0
+    percentiles_lower: dict[float, float] = field(default_factory=dict)
+    percentiles_upper: dict[float, float] = field(default_factory=dict)
+
+def _split_columns(data) -> tuple:
+    """
+    (washer1, washer2, spring) from PDColumns or a list of PDRecord.
+    """
+    if isinstance(data, (list, tuple)):
+        return (
+            [r.washer1 for r in data],
+            [r.washer2 for r in data],
+            [r.spring for r in data],
+        )
+    return data.washer1, data.washer2, data.spring
 
-def compute_stats(records: list[PDRecord]) -> PDStats | None:
-    if not records:
+def compute_stats(
+    data: "PDColumns | list[PDRecord]",
+    summary: PDModelSummary | None = None,
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_count: int = DEFAULT_MIN_COUNT,
+    use_numpy: bool | None = None
+) -> PDStats | None:
+    """
+    When the model summary is given, averages and standard deviations
+    are taken from it instead of being recomputed from the columns.
+    use_numpy=None picks NumPy whenever it is installed.
+    """
+    lowers, uppers, springs = _split_columns(data)
+    if len(lowers) == 0:
         return None
 
-    lowers = [r.washer1 for r in records]
-    uppers = [r.washer2 for r in records]
-    springs = [r.spring for r in records]
-    totals = [r.washer1 + r.washer2 + r.spring for r in records]
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    if use_numpy:
+        lower, upper, spring, total = _columns_stats_numpy(lowers, uppers, springs, percentiles)
+    else:
+        lower, upper, spring, total = _columns_stats_python(lowers, uppers, springs, percentiles)
 
-    common = most_common_config(records)
+    common = most_common_config(lowers, uppers, springs, tolerance, min_count, use_numpy)
+
+    if summary is not None:
+        lower.mean, lower.std = summary.avg_lower, math.sqrt(summary.var_lower)
+        upper.mean, upper.std = summary.avg_upper, math.sqrt(summary.var_upper)
+        spring.mean, spring.std = summary.avg_spring, math.sqrt(summary.var_spring)
+        total.mean, total.std = summary.avg_total, math.sqrt(summary.var_total)
 
     return PDStats(
-        avg_lower=mean(lowers),
-        avg_upper=mean(uppers),
-        avg_spring=mean(springs),
-        avg_total=mean(totals),
-        median_lower=median(lowers),
-        median_upper=median(uppers),
-        common_config=common
+        avg_lower=lower.mean,
+        avg_upper=upper.mean,
+        avg_spring=spring.mean,
+        avg_total=total.mean,
+        median_lower=lower.median,
+        median_upper=upper.median,
+        common_config=common,
+        std_lower=lower.std,
+        std_upper=upper.std,
+        std_spring=spring.std,
+        std_total=total.std,
+        min_lower=lower.min,
+        max_lower=lower.max,
+        min_upper=upper.min,
+        max_upper=upper.max,
+        percentiles_lower=lower.percentiles,
+        percentiles_upper=upper.percentiles
+    )
+
+def _columns_stats_numpy(lowers, uppers, springs, percentiles) -> list[ColumnStats]:
+    data = np.empty((4, len(lowers)), dtype=np.float64)
+    data[0] = lowers
+    data[1] = uppers
+    data[2] = springs
+    np.add(data[0], data[1], out=data[3])
+    data[3] += data[2]
+
+    n = data.shape[1]
+    means = data.mean(axis=1)
+    if n > 1:
+        stds = data.std(axis=1, ddof=1)
+    else:
+        stds = np.zeros(4)
+
+    # min, median, max and the requested percentiles share a single partition
+    qs = [0.0, 50.0, 100.0, *percentiles]
+    quantiles = np.percentile(data, qs, axis=1)
+
+    return [
+        ColumnStats(
+            mean=float(means[i]),
+            median=float(quantiles[1, i]),
+            std=float(stds[i]),
+            min=float(quantiles[0, i]),
+            max=float(quantiles[2, i]),
+            percentiles={p: float(quantiles[3 + k, i]) for k, p in enumerate(percentiles)}
+        )
+        for i in range(4)
+    ]
+
+def _columns_stats_python(lowers, uppers, springs, percentiles) -> list[ColumnStats]:
+    lowers = [float(v) for v in lowers]
+    uppers = [float(v) for v in uppers]
+    springs = [float(v) for v in springs]
+    totals = [l + u + s for l, u, s in zip(lowers, uppers, springs)]
+    return [column_stats_python(values, percentiles) for values in (lowers, uppers, springs, totals)]
+
+def column_stats_python(values: list[float], percentiles=DEFAULT_PERCENTILES) -> ColumnStats:
+    """
+    Pure-Python statistics of one column, matching the NumPy engine.
+    """
+    n = len(values)
+    ordered = sorted(values)
+    mean = math.fsum(ordered) / n
+    if n > 1:
+        std = math.sqrt(math.fsum((v - mean) ** 2 for v in ordered) / (n - 1))
+    else:
+        std = 0.0
+
+    return ColumnStats(
+        mean=mean,
+        median=percentile_sorted(ordered, 50.0),
+        std=std,
+        min=ordered[0],
+        max=ordered[-1],
+        percentiles={p: percentile_sorted(ordered, p) for p in percentiles}
     )
 
+def columns_summary(washer1, washer2, spring, use_numpy: bool | None = None) -> PDModelSummary | None:
+    """
+    Counts, means and sample variances of the columns and their totals,
+    what the pd_model_summary triggers aggregate. model_id is left as 0.
+    """
+    n = len(washer1)
+    if n == 0:
+        return None
+
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    if use_numpy:
+        data = np.empty((4, n), dtype=np.float64)
+        data[0] = washer1
+        data[1] = washer2
+        data[2] = spring
+        np.add(data[0], data[1], out=data[3])
+        data[3] += data[2]
+        means = data.mean(axis=1).tolist()
+        variances = data.var(axis=1, ddof=1).tolist() if n > 1 else [0.0] * 4
+    else:
+        columns = [[float(v) for v in c] for c in (washer1, washer2, spring)]
+        columns.append([a + b + c for a, b, c in zip(*columns)])
+        means = [math.fsum(c) / n for c in columns]
+        variances = [
+            math.fsum((v - mean) ** 2 for v in c) / (n - 1) if n > 1 else 0.0
+            for c, mean in zip(columns, means)
+        ]
+    return PDModelSummary(0, n, *means, *variances)
+
+def percentile_sorted(ordered: list[float], p: float) -> float:
+    """
+    p-th percentile of an already sorted list.
+    Linear interpolation between closest ranks, like numpy.percentile.
+    """
+    pos = (len(ordered) - 1) * (p / 100)
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    frac = pos - lo
+    diff = ordered[hi] - ordered[lo]
+    # Same rounding as numpy's lerp, interpolate from the nearer end
+    if frac >= 0.5:
+        return ordered[hi] - diff * (1 - frac)
+    return ordered[lo] + diff * frac
+
 def most_common_config(
-    records: list[PDRecord],
-    tolerance: float = 0.03,
-    min_count: int = 5,
-    ):
-    sums = [(r, r.washer1 + r.washer2 + r.spring) for r in records]
-
-    clusters = []
-
-    for rec, total in sums:
-        placed = False
-        for cluster in clusters:
-            if abs(cluster[0][1] - total) <= tolerance:
-                cluster.append((rec, total))
-                placed = True
-                break
-        if not placed:
-            clusters.append([(rec, total)])
-
-    valid = [c for c in clusters if len(c) >= min_count]
-    if not valid:
+    washer1,
+    washer2,
+    spring,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_count: int = DEFAULT_MIN_COUNT,
+    use_numpy: bool | None = None
+    ) -> tuple[float, float, float] | None:
+    """
+    Most common (washer1, washer2, spring) configuration.
+    Finds the densest window of width tolerance over the sorted totals
+    (washer1 + washer2 + spring) and returns the modal triple inside it,
+    rounded to 0.01 mm. Returns None when the densest window holds fewer
+    than min_count units. O(n log n) and independent of row order.
+    """
+    if len(washer1) == 0:
+        return None
+
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    if use_numpy:
+        return _most_common_config_numpy(washer1, washer2, spring, tolerance, min_count)
+    return _most_common_config_python(washer1, washer2, spring, tolerance, min_count)
+
+def _most_common_config_numpy(washer1, washer2, spring, tolerance, min_count):
+    w1 = np.round(np.asarray(washer1, dtype=np.float64), 2)
+    w2 = np.round(np.asarray(washer2, dtype=np.float64), 2)
+    sp = np.round(np.asarray(spring, dtype=np.float64), 2)
+    totals = np.round(w1 + w2 + sp, 2)
+
+    # Sort by total, ties by the triple itself, so the input order never matters
+    order = np.lexsort((sp, w2, w1, totals))
+    sorted_totals = totals[order]
+
+    # Window starting at every unit: [total, total + tolerance]
+    ends = np.searchsorted(sorted_totals, sorted_totals + tolerance + TOLERANCE_EPS, side="right")
+    counts = ends - np.arange(len(sorted_totals))
+    start = int(np.argmax(counts))  # first maximum: the window with the smallest totals
+    if counts[start] < min_count:
+        return None
+
+    window = order[start:ends[start]]
+    triples = np.column_stack((w1[window], w2[window], sp[window]))
+    unique, unique_counts = np.unique(triples, axis=0, return_counts=True)
+    best = unique[int(np.argmax(unique_counts))]  # ties: lexicographically smallest
+
+    return (float(best[0]), float(best[1]), float(best[2]))
+
+def _most_common_config_python(washer1, washer2, spring, tolerance, min_count):
+    rows = sorted(
+        (round(a + b + c, 2), a, b, c)
+        for a, b, c in (
+            (round(a, 2), round(b, 2), round(c, 2))
+            for a, b, c in zip(_as_list(washer1), _as_list(washer2), _as_list(spring))
+        )
+    )
+    totals = [r[0] for r in rows]
+
+    best_start, best_end = 0, 0
+    for i, total in enumerate(totals):
+        end = bisect.bisect_right(totals, total + tolerance + TOLERANCE_EPS, lo=i)
+        if end - i > best_end - best_start:
+            best_start, best_end = i, end
+
+    if best_end - best_start < min_count:
         return None
-    
-    # Find the largest cluster
-    largest = max(valid, key=len)
-    r = largest[0][0]  # Take the first record in the largest cluster
 
-    return (r.washer1, r.washer2, r.spring)
+    counts = Counter(r[1:] for r in rows[best_start:best_end])
+    top = max(counts.values())
+    return min(triple for triple, n in counts.items() if n == top)
 
+def _as_list(values) -> list[float]:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
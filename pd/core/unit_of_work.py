@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/core/unit_of_work.py
+
+"""
+Write-behind batching for repository writes.
+Every commit costs an fsync, which is slow on network shares.
+While a WriteBehindQueue is open, writes are executed at once (and
+visible on the same connection) but committed together.
+"""
+
+from pd.core.repositories import PDRepository
+
+class WriteBehindQueue:
+    def __init__(self, repo: PDRepository, max_pending: int = 50):
+        self.repo = repo
+        self._open = True
+        repo.defer_commits(max_pending)
+
+    @property
+    def pending(self) -> int:
+        return self.repo.pending_writes
+
+    def flush(self) -> None:
+        """
+        Commit all queued writes now.
+        """
+        if self._open:
+            self.repo.flush()
+
+    def close(self) -> None:
+        """
+        Commit queued writes and go back to one commit per write.
+        """
+        if self._open:
+            self._open = False
+            self.repo.resume_commits()
+
+    def __enter__(self) -> "WriteBehindQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
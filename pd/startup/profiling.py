@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/startup/profiling.py
+
+"""
+Startup time per phase, enabled with --profile-startup.
+Each phase records its wall time and the modules it imported, the
+report goes to the log once the main window had its first paint.
+"""
+
+import logging
+import sys
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FLAG = "--profile-startup"
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self._modules = len(sys.modules)
+        self.phases: list[tuple[str, float, int]] = []   # name, seconds, new modules
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        modules = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start, len(sys.modules) - modules))
+
+    def since_start(self, name: str) -> None:
+        """
+        Phase from the import of this module until now, for the module-level imports.
+        """
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - self.started, len(sys.modules) - self._modules))
+
+    def report(self) -> str:
+        if not self.enabled:
+            return ""
+        width = max((len(name) for name, _, _ in self.phases), default=0)
+        lines = ["Startup profile:"]
+        for name, seconds, modules in self.phases:
+            lines.append(f"  {name:<{width}}  {seconds * 1000:8.1f} ms  {modules:5d} modules")
+        total = time.perf_counter() - self.started
+        lines.append(f"  {'total':<{width}}  {total * 1000:8.1f} ms  {len(sys.modules):5d} modules")
+        text = "\n".join(lines)
+        logger.info(text)
+        return text
+
+# One profiler for the whole startup path
+profiler = StartupProfiler()
+
+def enable_from_argv(argv: list[str]) -> None:
+    """
+    Turn profiling on when the flag is given, the flag is removed before Qt sees argv.
+    """
+    if PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+        profiler.enable()
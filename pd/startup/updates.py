@@ -2,9 +2,7 @@
 # License: GPL v3 Copyright: 2026, Mateusz Jamróz
 # pd/startup/updates.py
 
-import requests
 from pd import __version__, __author__
-from packaging.version import Version
 from pd.platform.os_detect import Platform
 from pathlib import Path
 from typing import Dict, Any
@@ -16,6 +14,9 @@ def check_update(
         platform: str,
         allow_prerelease: bool = False
     ) -> dict | None:
+    # requests and packaging load on the first check, not at startup
+    import requests
+    from packaging.version import Version
 
     try:
         r = requests.get(GITHUB_API, timeout=5)
@@ -70,6 +71,7 @@ def download_update(update_info: Dict[str, Any], dest_dir: Path) -> Path:
 
     dest_dir.mkdir(parents=True, exist_ok=True)
 
+    import requests
     with requests.get(url, stream=True, timeout=30) as r:
         r.raise_for_status()
         with open(dest_path, 'wb') as f:
@@ -4,11 +4,21 @@
 
 import sys
 
-from pd.ui.main_window import MainWindow
+from PyQt6.QtCore import QTimer
+
+from pd.startup.profiling import profiler
 
 def run_ui(ctx, app) -> None:
 
-    window = MainWindow(ctx)
-    window.show()
+    with profiler.phase("import main window"):
+        from pd.ui.main_window import MainWindow
+
+    with profiler.phase("main window"):
+        window = MainWindow(ctx)
+        window.show()
+
+    if profiler.enabled:
+        # Runs after the first paint of the window
+        QTimer.singleShot(0, profiler.report)
 
     sys.exit(app.exec())
\ No newline at end of file
@@ -17,9 +17,6 @@ from pd import (__version__,
                 __app_name__)
 from pd.app_context import AppContext
 from pd.platform.os_detect import get_platform
-from pd.startup.updates import check_update
-from pd.ui.dialogs.download.choose_dir import choose_download_dir
-from pd.ui.dialogs.download.download_dialog import DownloadDialog
 
 class AboutDialog(QDialog):
     def __init__(self, ctx: AppContext):
@@ -98,6 +95,11 @@ class AboutDialog(QDialog):
         return git_label
 
     def _check_updates(self):
+        # The update and download stack (requests) loads on the first check
+        from pd.startup.updates import check_update
+        from pd.ui.dialogs.download.choose_dir import choose_download_dir
+        from pd.ui.dialogs.download.download_dialog import DownloadDialog
+
         try:
             info = check_update(
                 current_version=__version__, 
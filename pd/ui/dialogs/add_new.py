@@ -14,14 +14,27 @@ from PyQt6.QtWidgets import (
     QComboBox
 )
 
+from PyQt6.QtCore import QTimer
+
 from pd.app_context import AppContext
 
+# Units added with "Add Another" are committed together after this idle time
+FLUSH_DELAY_MS = 2000
+
 class AddNewDialog(QDialog):
     def __init__(self, ctx: AppContext, on_accept_callback=None):
         super().__init__()
         self.setWindowTitle(ctx.i18n.t("add_new.title"))
         self.ctx = ctx
         self._on_accept_callback = on_accept_callback
+
+        # Coalesce commits of the "save and add next" loop
+        self._writes = ctx.pd_service.write_behind()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self._writes.flush)
+
         self._build_ui()
 
     def _build_ui(self):
@@ -114,6 +127,7 @@ class AddNewDialog(QDialog):
     def _save_and_new(self):
         try:
             self._save()
+            self._flush_timer.start()
             self._clear_fields()
             self.model_id.setFocus()
         except Exception as e:
@@ -124,6 +138,12 @@ class AddNewDialog(QDialog):
             )
 
 
+    def done(self, result: int):
+        # Accept, reject and closing the window all end here
+        self._flush_timer.stop()
+        self._writes.close()
+        super().done(result)
+
     def _collect_data(self):
         def parse_float(val):
             return float(val.replace(",", "."))
@@ -3,7 +3,6 @@
 # pd/ui.dialogs/download/download_worker.py
 
 from PyQt6.QtCore import QThread, pyqtSignal
-import requests
 from pathlib import Path
 
 class DownloadWorker(QThread):
@@ -18,6 +17,7 @@ class DownloadWorker(QThread):
         self.dest_dir = dest_dir
 
     def run(self):
+        import requests  # Loaded with the first download, not at startup
         try:
             self.dest_dir.mkdir(parents=True, exist_ok=True)
             dest_path = self.dest_dir / self.filename
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/dialogs/export/export_dialog.py
+
+from pathlib import Path
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QLabel,
+    QComboBox,
+    QProgressBar,
+    QPushButton,
+    QFileDialog
+)
+
+from pd.app_context import AppContext
+from pd.ui.dialogs.export.export_worker import ExportWorker
+
+# File dialog filter -> suffix appended when the user omits it
+FILE_FILTERS = {
+    "CSV (*.csv)": ".csv",
+    "JSON Lines (*.jsonl)": ".jsonl",
+    "Excel (*.xlsx)": ".xlsx",
+}
+
+class ExportDialog(QDialog):
+    def __init__(self, ctx: AppContext, parent=None):
+        super().__init__(parent)
+        self.ctx = ctx
+        self.worker = None
+        self.setWindowTitle(self.ctx.i18n.t("export.title"))
+        self.setMinimumSize(400, 180)
+        self._build_ui()
+
+    def _build_ui(self):
+        t = self.ctx.i18n.t
+        layout = QVBoxLayout(self)
+
+        form = QFormLayout()
+
+        self.model_id = QComboBox()
+        self.model_id.addItem(t("export.all"), userData=None)
+        for mid, mname in self.ctx.pd_service.get_models():
+            self.model_id.addItem(f"{mname}", userData=mid)
+
+        self.opening_pressure = QComboBox()
+        self.opening_pressure.addItem(t("export.all"), userData=None)
+        for pid, pval in self.ctx.pd_service.get_opening_pressures():
+            self.opening_pressure.addItem(f"{pval}", userData=pid)
+
+        form.addRow(t("fields.model_id") + ":", self.model_id)
+        form.addRow(t("fields.opening_pressure") + ":", self.opening_pressure)
+
+        self.label = QLabel(t("export.label"))
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+
+        self.export_button = QPushButton(t("export.export"))
+        self.export_button.setDefault(True)
+        self.export_button.clicked.connect(self._start_export)
+
+        self.cancel_button = QPushButton(t("buttons.cancel"))
+        self.cancel_button.clicked.connect(self._cancel)
+
+        btn_row = QHBoxLayout()
+        btn_row.addWidget(self.export_button)
+        btn_row.addWidget(self.cancel_button)
+
+        layout.addLayout(form)
+        layout.addWidget(self.label)
+        layout.addWidget(self.progress_bar)
+        layout.addLayout(btn_row)
+
+    def _start_export(self):
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            self.ctx.i18n.t("export.select_file"),
+            "pd_export.csv",
+            ";;".join(FILE_FILTERS)
+        )
+        if not file_path:
+            return
+
+        dest_path = Path(file_path)
+        if dest_path.suffix.lower() not in FILE_FILTERS.values():
+            dest_path = dest_path.with_name(dest_path.name + FILE_FILTERS.get(selected_filter, ".csv"))
+
+        self.export_button.setEnabled(False)
+        self.model_id.setEnabled(False)
+        self.opening_pressure.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.label.setText(self.ctx.i18n.t("export.exporting"))
+
+        self.worker = ExportWorker(
+            self.ctx.db,
+            dest_path,
+            model_id=self.model_id.currentData(),
+            opening_pressure_id=self.opening_pressure.currentData()
+        )
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished.connect(self._on_export_finished)
+        self.worker.cancelled.connect(self._on_export_cancelled)
+        self.worker.error.connect(self._on_export_error)
+        self.worker.start()
+
+    def _cancel(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.requestInterruption()
+            return
+        self.reject()
+
+    def _on_export_finished(self, count: int):
+        self.label.setText(self.ctx.i18n.t("export.finished").format(n=count))
+        self._finish()
+
+    def _on_export_cancelled(self):
+        self.label.setText(self.ctx.i18n.t("export.cancelled"))
+        self._finish()
+
+    def _on_export_error(self, error_msg: str):
+        self.label.setText(self.ctx.i18n.t("export.error").format(error=error_msg))
+        self._finish()
+
+    def _finish(self):
+        self.cancel_button.setText(self.ctx.i18n.t("buttons.close"))
+        self.cancel_button.clicked.disconnect()
+        self.cancel_button.clicked.connect(self.accept)
+
+    def reject(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.requestInterruption()
+            self.worker.wait()
+        super().reject()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/dialogs/export/export_worker.py
+
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from pd.core.connections import ConnectionManager
+from pd.core.exporter import export_units, ExportCancelled
+from pd.core.repositories import PDRepository
+
+class ExportWorker(QThread):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, db: ConnectionManager, dest_path: Path, model_id=None, opening_pressure_id=None):
+        super().__init__()
+        self.db = db
+        self.dest_path = dest_path
+        self.model_id = model_id
+        self.opening_pressure_id = opening_pressure_id
+
+    def run(self):
+        try:
+            # sqlite3 connections are bound to their thread, the worker uses its own
+            repo = PDRepository(self.db.reader())
+            total = repo.count_all_with_name(self.model_id, self.opening_pressure_id)
+
+            def on_progress(n: int):
+                if total:
+                    self.progress.emit(int(n * 100 / total))
+
+            count = export_units(
+                repo,
+                self.dest_path,
+                model_id=self.model_id,
+                opening_pressure_id=self.opening_pressure_id,
+                progress=on_progress,
+                cancelled=self.isInterruptionRequested
+            )
+            self.progress.emit(100)
+            self.finished.emit(count)
+        except ExportCancelled:
+            self.dest_path.unlink(missing_ok=True)
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.db.close_thread()
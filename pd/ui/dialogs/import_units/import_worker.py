@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/dialogs/import_units/import_worker.py
+
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from pd.core.connections import ConnectionManager
+from pd.core.repositories import PDRepository
+from pd.core.services import PDService
+
+class ImportWorker(QThread):
+    progress = pyqtSignal(int)      # rows processed
+    finished = pyqtSignal(object)   # ImportResult
+    error = pyqtSignal(str)
+
+    def __init__(self, db: ConnectionManager, pd_service: PDService, path: Path):
+        super().__init__()
+        self.db = db
+        self.pd_service = pd_service
+        self.path = path
+
+    def run(self):
+        try:
+            # sqlite3 connections are bound to their thread, the worker writes through its own
+            service = self.pd_service.with_repo(PDRepository(self.db.connection()))
+            result = service.import_units(self.path, progress=self.progress.emit)
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.db.close_thread()
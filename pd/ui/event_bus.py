@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/event_bus.py
+
+"""
+Qt side of the PDService change events (pd.core.events).
+Events published from a worker thread are delivered to the widgets
+in the GUI thread, as queued signals.
+"""
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from pd.core.events import (
+    EventHub,
+    UnitAdded,
+    UnitUpdated,
+    UnitDeleted,
+    ModelAdded,
+    UnitsReloaded,
+)
+
+class EventBus(QObject):
+    unit_added = pyqtSignal(object)            # PDView
+    unit_updated = pyqtSignal(object, object)  # old PDView, new PDView
+    unit_deleted = pyqtSignal(object)          # PDView
+    model_added = pyqtSignal(int, str)         # model_id, model_name
+    reloaded = pyqtSignal()
+
+    def __init__(self, hub: EventHub, parent=None):
+        super().__init__(parent)
+        self.hub = hub
+        hub.subscribe(self._dispatch)
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self._dispatch)
+
+    def _dispatch(self, event) -> None:
+        match event:
+            case UnitAdded(unit):
+                self.unit_added.emit(unit)
+            case UnitUpdated(old, new):
+                self.unit_updated.emit(old, new)
+            case UnitDeleted(unit):
+                self.unit_deleted.emit(unit)
+            case ModelAdded(model_id, model_name):
+                self.model_added.emit(model_id, model_name)
+            case UnitsReloaded():
+                self.reloaded.emit()
@@ -4,16 +4,20 @@
 
 import sqlite3
 
+from pathlib import Path
+
 from PyQt6.QtWidgets import (
     QMainWindow, 
     QMessageBox, 
     QVBoxLayout, 
     QWidget, 
-    QDialog,
-    QSplitter
+    QSplitter,
+    QFileDialog,
+    QApplication,
+    QProgressDialog
 )
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import QEvent, Qt
+from PyQt6.QtGui import QAction, QCursor
+from PyQt6.QtCore import QEvent, Qt, QTimer
 
 from pd.app_context import AppContext
 from pd.core.config import load_config, save_config
@@ -22,10 +26,17 @@ from pd.ui.dialogs.add_new import AddNewDialog
 from pd.ui.dialogs.add_model import AddModelDialog
 from pd.ui.dialogs.edit_unit import EditUnitDialog
 from pd.ui.dialogs.del_unit import DelModelDialog
-from pd.ui.dialogs.about import AboutDialog
-from pd.ui.dialogs.help import HelpDialog
 from pd.ui.views.charts_area import ChartsArea
 from pd.ui.views.pd_table import PDTable
+from pd.ui.event_bus import EventBus
+from pd.ui.query_executor import QueryExecutor, AsyncPDService
+from pd.ui.warmup import StatsWarmup
+
+# Models remembered for the stats warm-up, newest first
+RECENT_MODELS = 16
+
+# The warm-up starts once the window had time to paint
+WARMUP_DELAY_MS = 500
 
 # I just wanna SLEEEEEP, I just wanna DIEEEEEEEEEEEEEEEEEEEE
 
@@ -44,6 +55,14 @@ class MainWindow(QMainWindow):
         
         self.restore_settings()
 
+        # Reads for the charts run on worker threads, see pd.ui.query_executor
+        self.queries = QueryExecutor(ctx.db, self.pd_service, self)
+        self.pd_async = AsyncPDService(self.queries)
+        self.warmup = None
+        self._recent_models = [
+            m.strip() for m in self.ctx.config["statistics"].get("recent_models", "").split(",") if m.strip()
+        ]
+
         main_widget = QWidget()
         layout = QVBoxLayout(main_widget)
         
@@ -65,6 +84,18 @@ class MainWindow(QMainWindow):
         stgs_action.triggered.connect(lambda: SettingsDialog(self.ctx).exec())
         file_menu.addAction(stgs_action)
 
+        # Import units from CSV/TSV/XLSX bench logs
+        import_action = QAction(self.i18n.t("menu.import"), self)
+        import_action.setToolTip(self.i18n.t("import.tooltip"))
+        import_action.triggered.connect(self._import_units)
+        file_menu.addAction(import_action)
+
+        # Export units to CSV/JSON Lines/XLSX
+        export_action = QAction(self.i18n.t("menu.export"), self)
+        export_action.setToolTip(self.i18n.t("export.tooltip"))
+        export_action.triggered.connect(self._open_export_dialog)
+        file_menu.addAction(export_action)
+
         exit_action = QAction(self.i18n.t("menu.exit"), self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
@@ -92,16 +123,23 @@ class MainWindow(QMainWindow):
         del_unit.triggered.connect(self._delete_selected_unit)
         edit_menu.addAction(del_unit)
 
+        # Recompute per-model aggregates (pd_model_summary)
+        rebuild_stats = QAction(self.i18n.t("menu.rebuild_stats"), self)
+        rebuild_stats.setToolTip(self.i18n.t("rebuild_stats.tooltip"))
+        rebuild_stats.triggered.connect(self._rebuild_stats)
+        edit_menu.addAction(rebuild_stats)
+
         # HELP MENU
         # Help
         self.help_action = None
+        self._import_worker = None
         help_action = QAction(self.i18n.t("menu.help"), self)
         help_action.triggered.connect(self._show_help)
         help_menu.addAction(help_action)
 
         # About
         about_action = QAction(self.i18n.t("menu.about"), self)
-        about_action.triggered.connect(lambda: AboutDialog(self.ctx).exec())
+        about_action.triggered.connect(self._open_about_dialog)
         help_menu.addAction(about_action)
 
         #
@@ -117,7 +155,7 @@ class MainWindow(QMainWindow):
         
         #
         # TABLE AREA
-        self.table = PDTable(self.i18n)
+        self.table = PDTable(self.i18n, self.pd_service)
         self.table.rowSelected.connect(self._row_selected)
         self.table.setMinimumWidth(0)
         splitter.addWidget(self.table)
@@ -126,7 +164,7 @@ class MainWindow(QMainWindow):
 
         #
         # CHARTS AREA
-        self.charts_area = ChartsArea(self.i18n, self.ctx)
+        self.charts_area = ChartsArea(self.i18n, self.ctx, self.pd_async)
         self.charts_area.setMinimumWidth(200)
         splitter.addWidget(self.charts_area)
         splitter.setSizes([500, 900])
@@ -138,17 +176,52 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(splitter)
         self.setCentralWidget(main_widget)
+
+        #
+        # CHANGE EVENTS
+        # Writes update the table and the charts row by row, no reload
+        # Charts first: a table change can move the selection, which loads a fresh snapshot
+        self.events = EventBus(self.pd_service.events, self)
+        self.events.unit_added.connect(self.charts_area.unit_added)
+        self.events.unit_added.connect(self.table.unit_added)
+        self.events.unit_updated.connect(self.charts_area.unit_updated)
+        self.events.unit_updated.connect(self.table.unit_updated)
+        self.events.unit_deleted.connect(self.charts_area.unit_deleted)
+        self.events.unit_deleted.connect(self.table.unit_deleted)
+        self.events.model_added.connect(self.table.model_added)
+        self.events.reloaded.connect(self.refresh)
+
         self.refresh()
 
         self.installEventFilter(self)
 
+        if self.ctx.config["statistics"].getboolean("warmup", fallback=True):
+            QTimer.singleShot(WARMUP_DELAY_MS, self._start_warmup)
+
+    def _start_warmup(self):
+        """
+        Precompute the stats of the biggest and the recently used models.
+        """
+        self.warmup = StatsWarmup(self.queries, self._recent_models, self)
+        self.warmup.progress.connect(self._warmup_progress)
+        self.warmup.finished.connect(lambda _: self.statusBar().showMessage(self.i18n.t("app.label")))
+        self.warmup.start()
+
+    def _warmup_progress(self, done: int, total: int):
+        self.statusBar().showMessage(self.i18n.t("warmup.progress").format(done=done, total=total))
+
     def refresh(self):
-        models = self.ctx.pd_service.list_models_with_name()
-        
-        self.table.set_data(models)
+        self.table.reload()
+        self.charts_area.reload()
 
     def closeEvent(self, event: QEvent):
         self.save_settings()
+        self.events.close()
+        if self.warmup is not None:
+            self.warmup.stop()
+        if self._import_worker is not None:
+            self._import_worker.wait()  # The import commits as a whole, let it finish
+        self.queries.shutdown()
         event.accept()
 
     def restore_settings(self):
@@ -164,34 +237,25 @@ class MainWindow(QMainWindow):
         config = load_config(self.paths.config / "config.ini")
         config["ui"]["geometry"] = self.saveGeometry().toHex().data().decode()
         config["ui"]["window_state"] = self.saveState().toHex().data().decode()
+        config["statistics"]["recent_models"] = ", ".join(self._recent_models)
         save_config(config, self.paths.config / "config.ini")
 
     def _open_add_dialog(self):
-        dlg = AddNewDialog(self.ctx, on_accept_callback=self.refresh)
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            self.refresh()
-
-    def get_selected_pd_id(self) -> int | None:
-        selected = self.table.table.selectedItems()  # self.table to PDTable, a PDTable.table to QTableWidget
-        if not selected:
-            return None
-        
-        row = selected[0].row()
-        pd_id = int(self.table.table.item(row, 0).text())  # model_id is in hidden column 0
-        return pd_id, row
+        AddNewDialog(self.ctx).exec()
+
+    def get_selected_pd_id(self) -> tuple[int, int] | None:
+        return self.table.selected_pd_id()  # (pd_id, row) from the table model
     
     def _row_selected(self, pd_id: int, model: str, model_id: str):
         self.current_pd = pd_id
-
-        count = self.ctx.pd_service.count_model(model_id)
-        values = self.ctx.pd_service.washers_distribution(model_id)
         print(f"DEBUG: Selected PD ID: {pd_id}")
-        
-        if values:
-            self.charts_area.update_data(values[0], values[1], model_id)
-            
-            # Title on top Charts Area
-            self.charts_area.set_title(count, model)
+
+        if model_id in self._recent_models:
+            self._recent_models.remove(model_id)
+        self._recent_models = [model_id, *self._recent_models][:RECENT_MODELS]
+
+        # Charts, stats and the title are filled in when the snapshot arrives
+        self.charts_area.show_model(model_id)
 
     def _edit_selected_unit(self):
         result = self.get_selected_pd_id()
@@ -199,9 +263,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.i18n.t("edit_unit.title"), self.i18n.t("edit_unit.no_selection"))
             return
         pd_id, row = result
-        success = EditUnitDialog(self.ctx, pd_id=pd_id, row=row).exec()
-        if success == QDialog.DialogCode.Accepted:
-            self.refresh()
+        EditUnitDialog(self.ctx, pd_id=pd_id, row=row).exec()
 
     def _delete_selected_unit(self):
         result = self.get_selected_pd_id()
@@ -209,12 +271,78 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.i18n.t("delete_unit.title"), self.i18n.t("delete_unit.no_selection"))
             return
         pd_id, row = result
-        dlg = DelModelDialog(self.ctx, pd_id)
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            self.refresh()
+        DelModelDialog(self.ctx, pd_id).exec()
+
+    def _import_units(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            self.i18n.t("import.title"),
+            "",
+            self.i18n.t("import.file_filter")
+        )
+        if not file_path:
+            return
+
+        from pd.ui.dialogs.import_units.import_worker import ImportWorker
+
+        # The import runs in one transaction, it cannot be cancelled halfway
+        self._import_progress = QProgressDialog(self.i18n.t("import.importing"), None, 0, 0, self)
+        self._import_progress.setWindowTitle(self.i18n.t("import.title"))
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.setMinimumDuration(0)
+        self._import_progress.show()
+
+        self._import_worker = ImportWorker(self.ctx.db, self.pd_service, Path(file_path))
+        self._import_worker.progress.connect(
+            lambda n: self._import_progress.setLabelText(self.i18n.t("import.progress").format(n=n))
+        )
+        self._import_worker.finished.connect(self._import_finished)
+        self._import_worker.error.connect(self._import_failed)
+        self._import_worker.start()
+
+    def _import_done(self):
+        self._import_progress.close()
+        self._import_worker.wait()
+        self._import_worker = None
+
+    def _import_failed(self, error_msg: str):
+        self._import_done()
+        QMessageBox.critical(self, self.i18n.t("import.title"), self.i18n.t("import.error") + f"\n{error_msg}")
+
+    def _import_finished(self, result):
+        self._import_done()
+        text = self.i18n.t("import.summary").format(inserted=result.inserted, skipped=result.skipped)
+        if result.errors:
+            details = "\n".join(
+                self.i18n.t("import.row_error").format(line=err.line, message=err.message)
+                for err in result.errors[:10]
+            )
+            text += f"\n\n{details}"
+        QMessageBox.information(self, self.i18n.t("import.title"), text)
+
+    def _rebuild_stats(self):
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        try:
+            self.pd_service.rebuild_model_summary()
+        except Exception as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.critical(self, self.i18n.t("rebuild_stats.title"), self.i18n.t("rebuild_stats.error") + f"\n{str(e)}")
+            return
+        QApplication.restoreOverrideCursor()
+        QMessageBox.information(self, self.i18n.t("rebuild_stats.title"), self.i18n.t("rebuild_stats.done"))
+
+    # Dialogs of the menus are imported on first use, to keep them out of the startup
+    def _open_export_dialog(self):
+        from pd.ui.dialogs.export.export_dialog import ExportDialog
+        ExportDialog(self.ctx, self).exec()
+
+    def _open_about_dialog(self):
+        from pd.ui.dialogs.about import AboutDialog
+        AboutDialog(self.ctx).exec()
 
     def _show_help(self):
         if self.help_action is None:
+            from pd.ui.dialogs.help import HelpDialog
             self.help_action = HelpDialog(self.ctx)
 
         self.help_action.show()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/query_executor.py
+
+"""
+Database reads off the GUI thread.
+Queries run in a QThreadPool, each pool thread reads through its own
+read-only connection (ConnectionManager.reader), and results come back
+as queued signals in the GUI thread. A request made with a key cancels
+the previous request of that key, so only the latest one is rendered
+when the user clicks through rows quickly.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from pd.core.connections import ConnectionManager
+from pd.core.repositories import PDRepository
+from pd.core.services import PDService
+
+logger = logging.getLogger(__name__)
+
+# Reads are short, more threads would only compete for the disk
+MAX_THREADS = 2
+
+# Priorities of QThreadPool.start, user requests go before background work
+PRIORITY_USER = 10
+PRIORITY_BACKGROUND = 0
+
+class QueryFuture(QObject):
+    """
+    Result of a submitted query, delivered in the thread that created the future.
+    """
+    finished = pyqtSignal(object)   # result
+    failed = pyqtSignal(object)     # exception
+    _done = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = threading.Event()
+        self._resolved = False
+        self._done.connect(self._deliver)
+
+    def cancel(self) -> None:
+        """
+        Drop the request: it is not started, or its result is discarded.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._resolved or self.cancelled
+
+    def then(self, on_result: Callable, on_error: Callable | None = None) -> "QueryFuture":
+        self.finished.connect(on_result)
+        if on_error is not None:
+            self.failed.connect(on_error)
+        return self
+
+    def _deliver(self, result, error) -> None:
+        # Runs in the receiving thread, the request may have been cancelled meanwhile
+        if not self.cancelled:
+            self._resolved = True
+            if error is not None:
+                self.failed.emit(error)
+            else:
+                self.finished.emit(result)
+        self.deleteLater()
+
+class _QueryTask(QRunnable):
+    def __init__(self, executor: "QueryExecutor", future: QueryFuture, fn: Callable, args, kwargs):
+        super().__init__()
+        self.executor = executor
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        # Always reported, the future is released when it is delivered
+        result, error = None, None
+        if not self.future.cancelled:
+            try:
+                result = self.fn(self.executor.service(), *self.args, **self.kwargs)
+            except Exception as e:
+                logger.exception("Query %s failed", getattr(self.fn, "__name__", self.fn))
+                error = e
+        self.future._done.emit(result, error)
+
+class QueryExecutor(QObject):
+    def __init__(self, db: ConnectionManager, pd_service: PDService, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.pd_service = pd_service
+        self._local = threading.local()
+        self._latest: dict[str, QueryFuture] = {}
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(MAX_THREADS)
+        # Keep the threads, and with them their connections and query caches
+        self.pool.setExpiryTimeout(-1)
+
+    def submit(self, fn: Callable, *args, priority: int = PRIORITY_USER, **kwargs) -> QueryFuture:
+        """
+        Run fn(service, *args, **kwargs) on a pool thread, service reads
+        through the thread's read-only connection.
+        """
+        future = QueryFuture(self)
+        self.pool.start(_QueryTask(self, future, fn, args, kwargs), priority)
+        return future
+
+    def latest(self, key: str, fn: Callable, *args, **kwargs) -> QueryFuture:
+        """
+        submit(), cancelling the previous request made with the same key.
+        """
+        previous = self._latest.get(key)
+        if previous is not None:
+            previous.cancel()
+        future = self._latest[key] = self.submit(fn, *args, **kwargs)
+        return future
+
+    def cancel(self, key: str) -> None:
+        previous = self._latest.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+    def service(self) -> PDService:
+        """
+        PDService of the calling pool thread.
+        """
+        repo = getattr(self._local, "repo", None)
+        if repo is None:
+            repo = self._local.repo = PDRepository(self.db.reader())
+        return self.pd_service.with_repo(repo)
+
+    def shutdown(self) -> None:
+        for future in self._latest.values():
+            future.cancel()
+        self._latest.clear()
+        self.pool.waitForDone()
+
+def _async_read(name: str):
+    method = getattr(PDService, name)
+
+    def read(self, *args, key: str | None = None, **kwargs) -> QueryFuture:
+        if key is not None:
+            return self.executor.latest(key, method, *args, **kwargs)
+        return self.executor.submit(method, *args, **kwargs)
+
+    read.__name__ = name
+    read.__doc__ = f"PDService.{name} on a pool thread, returns a QueryFuture. key: see QueryExecutor.latest."
+    return read
+
+class AsyncPDService:
+    """
+    Non-blocking variants of the PDService reads.
+    """
+    READS = (
+        "get_model_name",
+        "model_snapshot",
+        "unit_info",
+        "get_models",
+        "get_model_stats",
+        "model_summary",
+        "get_opening_pressures",
+        "get_opening_press_value",
+        "list_models",
+        "washers_distribution",
+        "washer_histograms",
+        "count_model",
+        "list_models_with_name",
+        "view_table",
+        "view_page",
+    )
+
+    def __init__(self, executor: QueryExecutor):
+        self.executor = executor
+
+for _name in AsyncPDService.READS:
+    setattr(AsyncPDService, _name, _async_read(_name))
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/utils/frame_scheduler.py
+
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QTimer
+
+# ~60 repaints per second
+FRAME_MS = 16
+
+class FrameScheduler(QObject):
+    """
+    Coalesces bursts of view updates: every key keeps only its latest
+    callback, and all pending callbacks run together once per frame.
+    """
+    def __init__(self, interval_ms: int = FRAME_MS, parent=None):
+        super().__init__(parent)
+        self._pending: dict[str, Callable[[], None]] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, key: str, fn: Callable[[], None]) -> None:
+        self._pending[key] = fn
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self, key: str) -> None:
+        self._pending.pop(key, None)
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        for fn in pending.values():
+            fn()
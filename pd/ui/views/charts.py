@@ -10,10 +10,12 @@ from PyQt6.QtWidgets import (
     QToolTip
 )
 from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import Qt
 
-from collections import Counter
+import numpy as np
 
-from pd.ui.widgets.chart_window import ChartWindow
+from pd.core.repositories import Histogram
+from pd.ui.widgets.chart_window import ChartWindow, ChartWindowPool, scatter_item
 from pd.ui.utils.tooltip import on_point_hovered
 
 # Y - two decimal places
@@ -81,39 +83,23 @@ class WashersChart(QWidget):
         layout.addWidget(self.plot_lower)
 
         # --- Scatter---
-        self.upper_scatter = pg.ScatterPlotItem(
-            pen=None,
-            brush=pg.mkBrush(0, 0, 200),    # blue
-            size=8,
-            symbol='o',
-            name="Upper Washer",
-            hoverable=True,
-            tip=None
-        )
+        self.upper_scatter = scatter_item(pg.mkBrush(0, 0, 200), "Upper Washer")    # blue
         self.upper_mean_line = pg.InfiniteLine(
             angle=0,
             pen=pg.mkPen('blue', width=2, style=pg.QtCore.Qt.PenStyle.DashLine),
         )
-        self.upper_scatter.sigHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot_upper))
+        self.upper_scatter.sigPointsHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot_upper))
         self.plot_upper.addItem(self.upper_mean_line)
         self.plot_upper.addItem(self.upper_scatter)
         self.upper_mean_line.hide()
         self.plot_upper.addLegend()
 
-        self.lower_scatter = pg.ScatterPlotItem(
-            pen=None,
-            brush=pg.mkBrush(0, 200, 0),    # green
-            size=8,
-            symbol='o',
-            name="Lower Washer",
-            hoverable=True,
-            tip=None
-        )
+        self.lower_scatter = scatter_item(pg.mkBrush(0, 200, 0), "Lower Washer")    # green
         self.lower_mean_line = pg.InfiniteLine(
             angle=0,
             pen=pg.mkPen('green', width=2, style=pg.QtCore.Qt.PenStyle.DashLine),
         )
-        self.lower_scatter.sigHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot_lower))
+        self.lower_scatter.sigPointsHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot_lower))
         self.plot_lower.addItem(self.lower_mean_line)
         self.plot_lower.addItem(self.lower_scatter)
         self.lower_mean_line.hide()
@@ -134,20 +120,34 @@ class WashersChart(QWidget):
         self.lower_virtual_line.hide()
         self.upper_virtual_line.hide()
 
+        # Detail windows, reused for every model
+        self._windows = ChartWindowPool(self._make_window)
+        # Points shown per chart as (counts, thicknesses), counts ascending for clipToView
+        self._points = {"lower": _points({}), "upper": _points({})}
+        self._lower_counts: dict[float, int] = {}
+        self._upper_counts: dict[float, int] = {}
+        self.upper_washers_count = 0
+        self.lower_washers_count = 0
+        self.model_name = ""
+
     def update_data(
             self,
-            lower_washers: list[float],
-            upper_washers: list[float],
+            lower: Histogram,
+            upper: Histogram,
             model_name: str
         ):
+        """
+        lower, upper: units per thickness, the charts never see single units.
+        """
         self.model_name = model_name
+        # Units per thickness, for add_unit and remove_unit
+        self._lower_counts = dict(zip(lower.values.tolist(), lower.counts.tolist()))
+        self._upper_counts = dict(zip(upper.values.tolist(), upper.counts.tolist()))
+
         # Lower spring plate
-        lower_count = Counter(lower_washers)
-        x_lower = list(lower_count.values())
-        y_lower = list(lower_count.keys())
-        self.lower_scatter.setData(x=x_lower, y=y_lower)
-        if lower_washers:
-            lower_mean = round(sum(lower_washers) / len(lower_washers), 2)
+        self._show_points("lower", self._lower_counts)
+        if len(lower):
+            lower_mean = round(float(np.average(lower.values, weights=lower.counts)), 2)
             self.lower_mean_line.setValue(lower_mean)
             self.lower_mean_line.show()
         else:
@@ -155,29 +155,76 @@ class WashersChart(QWidget):
         self.plot_lower.enableAutoRange()
 
         # Upper spring plate
-        upper_count = Counter(upper_washers)
-        x_upper = list(upper_count.values())
-        y_upper = list(upper_count.keys())
-        self.upper_scatter.setData(x=x_upper, y=y_upper)
-        if upper_washers:
-            upper_mean = round(sum(upper_washers) / len(upper_washers), 2)
+        self._show_points("upper", self._upper_counts)
+        if len(upper):
+            upper_mean = round(float(np.average(upper.values, weights=upper.counts)), 2)
             self.upper_mean_line.setValue(upper_mean)
             self.upper_mean_line.show()
         else:
             self.upper_mean_line.hide()
         self.plot_upper.enableAutoRange()
 
-        self.upper_washers_count = len(upper_washers)
-        self.lower_washers_count = len(lower_washers)
+        self.upper_washers_count = upper.total
+        self.lower_washers_count = lower.total
+        self._sync_windows()
+
+    def add_unit(self, lower: float, upper: float):
+        """
+        Count one more unit without recounting the model.
+        """
+        self.lower_washers_count += 1
+        self.upper_washers_count += 1
+        self._add_point("lower", self._lower_counts, lower)
+        self._add_point("upper", self._upper_counts, upper)
+        self.ensure_y_visible(self.plot_lower, lower)
+        self.ensure_y_visible(self.plot_upper, upper)
+        self._sync_windows()
+
+    def remove_unit(self, lower: float, upper: float):
+        self.lower_washers_count = max(0, self.lower_washers_count - 1)
+        self.upper_washers_count = max(0, self.upper_washers_count - 1)
+        self._remove_point("lower", self._lower_counts, lower)
+        self._remove_point("upper", self._upper_counts, upper)
+        self._sync_windows()
+
+    def set_means(self, lower_mean: float | None, upper_mean: float | None):
+        for line, mean in ((self.lower_mean_line, lower_mean), (self.upper_mean_line, upper_mean)):
+            if mean is None:
+                line.hide()
+            else:
+                line.setValue(round(mean, 2))
+                line.show()
+        self._sync_windows()
+
+    def _add_point(self, key: str, counts: dict, value: float):
+        value = round(value, 2)  # Same bins as the histograms
+        counts[value] = counts.get(value, 0) + 1
+        self._show_points(key, counts)
+
+    def _remove_point(self, key: str, counts: dict, value: float):
+        value = round(value, 2)
+        if value not in counts:
+            return
+        counts[value] -= 1
+        if counts[value] <= 0:
+            del counts[value]
+        self._show_points(key, counts)
+
+    def _show_points(self, key: str, counts: dict):
+        x, y = self._points[key] = _points(counts)
+        self._scatter(key).setData(x=x, y=y)
+
+    def _scatter(self, key: str):
+        return self.lower_scatter if key == "lower" else self.upper_scatter
 
     # New method to force y-axis range
     # autoRange() was buggy in some cases
-    def force_y_range(self, plot, values: list[float], padding: float = 0.05):
-        if not values:
+    def force_y_range(self, plot, values: np.ndarray, padding: float = 0.05):
+        if not len(values):
             return
         
-        vmin = min(values)
-        vmax = max(values)
+        vmin = float(np.min(values))
+        vmax = float(np.max(values))
 
         if vmin == vmax:
             vmin -= padding
@@ -192,11 +239,19 @@ class WashersChart(QWidget):
     # New method to handle virtual_line
     # virtual_line without that method was not change y-axis range in charts 
     def ensure_y_visible(self, plot, value: float, padding: float = 0.05):
+        y_range = self._y_range_with(plot, value, padding)
+        if y_range is not None:
+            plot.setYRange(*y_range, padding=0)
+
+    def _y_range_with(self, plot, value: float, padding: float = 0.05) -> tuple[float, float] | None:
+        """
+        Y range of the plot extended to show value, None if it is already visible.
+        """
         view = plot.getViewBox()
         (ymin, ymax) = view.viewRange()[1]
 
         if ymin <= value <= ymax:
-            return  # Already visible
+            return None  # Already visible
         
         span = ymax - ymin
         if span <= 0:
@@ -207,7 +262,27 @@ class WashersChart(QWidget):
         elif value > ymax:
             ymax = value + span * padding
 
-        plot.setYRange(ymin, ymax, padding=0)
+        return ymin, ymax
+
+    def show_virtuals(self, lower: float, upper: float):
+        """
+        Move both virtual lines in one repaint, ranges of both plots are
+        computed first and applied together.
+        """
+        targets = (
+            (self.plot_lower, self.lower_virtual_line, lower),
+            (self.plot_upper, self.upper_virtual_line, upper),
+        )
+        ranges = [self._y_range_with(plot, value) for plot, _, value in targets]
+        self.setUpdatesEnabled(False)
+        try:
+            for (plot, line, value), y_range in zip(targets, ranges):
+                line.setValue(value)
+                line.show()
+                if y_range is not None:
+                    plot.setYRange(*y_range, padding=0)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_point_hovered(self, item, points, ev, plot_widget):
         if points is None or len(points) == 0:
@@ -226,29 +301,45 @@ class WashersChart(QWidget):
         )
 
     def _open_uchart_window(self, event):
-        n = getattr(self, 'upper_washers_count', 0)
-        model_name = getattr(self, 'model_name', '')
-        model_id = getattr(self, 'model_id', '')
-        self.uchart_win = ChartWindow(
-            self.upper_scatter, 
-            self.upper_mean_line, 
-            self.upper_chart_title, 
-            self.i18n,
-            n,
-            model_name=model_name,
-            model_id=model_id)
-        self.uchart_win.show()
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._show_window("upper")
 
     def _open_lchart_window(self, event):
-        n = getattr(self, 'lower_washers_count', 0)
-        model_name = getattr(self, 'model_name', '')
-        model_id = getattr(self, 'model_id', '')
-        self.lchart_win = ChartWindow(
-            self.lower_scatter, 
-            self.lower_mean_line, 
-            self.lower_chart_title, 
-            self.i18n,
-            n,
-            model_name=model_name,
-            model_id=model_id)
-        self.lchart_win.show()
\ No newline at end of file
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._show_window("lower")
+
+    def _make_window(self, key: str) -> ChartWindow:
+        mean_line = self.lower_mean_line if key == "lower" else self.upper_mean_line
+        return ChartWindow(self._scatter(key), mean_line, self.i18n)
+
+    def _show_window(self, key: str):
+        window = self._windows.acquire(key)
+        self._fill_window(key, window)
+        window.show()
+        window.raise_()
+        window.activateWindow()
+
+    def _sync_windows(self):
+        # Open detail windows follow the charts
+        for key in ("lower", "upper"):
+            window = self._windows.visible(key)
+            if window is not None:
+                self._fill_window(key, window)
+
+    def _fill_window(self, key: str, window: ChartWindow):
+        x, y = self._points[key]
+        if key == "lower":
+            mean_line, title, n = self.lower_mean_line, self.lower_chart_title, self.lower_washers_count
+        else:
+            mean_line, title, n = self.upper_mean_line, self.upper_chart_title, self.upper_washers_count
+        mean = mean_line.value() if mean_line.isVisible() else None
+        window.show_data(x, y, mean, title, n, self.model_name)
+
+def _points(counts: dict[float, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (counts, thicknesses) of the bins, ordered by count as clipToView expects ascending x.
+    """
+    x = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    y = np.fromiter(counts.keys(), dtype=np.float64, count=len(counts))
+    order = np.argsort(x, kind="stable")
+    return x[order], y[order]
@@ -12,14 +12,17 @@ from PyQt6.QtCore import Qt
 
 from pd.ui.views.charts import WashersChart
 from pd.ui.views.stats_panel import StatsPanel
-from pd.core.services import PDService
+from pd.core.services import PDService, ModelSnapshot
+from pd.ui.query_executor import AsyncPDService
+from pd.ui.utils.frame_scheduler import FrameScheduler
 
 
 class ChartsArea(QWidget):
-    def __init__(self, i18n, ctx: PDService, parent=None):
+    def __init__(self, i18n, ctx: PDService, queries: AsyncPDService, parent=None):
         super().__init__(parent)
         self.i18n = i18n
         self.ctx = ctx
+        self.queries = queries
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -36,6 +39,7 @@ class ChartsArea(QWidget):
         self.charts = WashersChart(self.i18n)
         self.stats = StatsPanel(ctx)
         self.stats.virtual_lower_changed.connect(self._on_virtual_lower_changed)
+        self._frames = FrameScheduler(parent=self)
 
         content.addWidget(self.charts, 3)
         content.addWidget(self.stats, 1)
@@ -43,16 +47,108 @@ class ChartsArea(QWidget):
         layout.addWidget(self.title)
         layout.addLayout(content)
 
-    def update_data(self, lower, upper, model_id):
-        model_name = self.ctx.pd_service.get_model_name(model_id)
+        # Shown model, see update_data
+        self.model_id = None
+        self.model_name = ""
+        self.count = 0
+        # Model whose snapshot is being loaded, see show_model
+        self._loading = None
+
+    def show_model(self, model_id: str):
+        """
+        Load the model's snapshot in the background, a newer call replaces an older one.
+        """
+        # The pool reads on its own connections, units still queued by a
+        # write-behind session (Add Another) would be missing from the
+        # histograms and the count but present in the live stats
+        self.ctx.pd_service.flush_writes()
+        self._loading = model_id
+        self.queries.model_snapshot(model_id, key="charts.snapshot").then(self._snapshot_loaded)
+
+    def _snapshot_loaded(self, snapshot: ModelSnapshot):
+        self._loading = None
+        self.update_data(snapshot)
+        self.set_title(snapshot.count, snapshot.model_name)
+
+    def update_data(self, snapshot: ModelSnapshot):
+        self.model_id = snapshot.model_id
+        self.model_name = snapshot.model_name
+        self.count = snapshot.count
         self.stats._virtual_active = False
+        self._frames.cancel("virtual")
         self.charts.lower_virtual_line.hide()
         self.charts.upper_virtual_line.hide()
-        self.charts.update_data(lower, upper, model_name)
+        self.charts.update_data(snapshot.lower, snapshot.upper, snapshot.model_name)
         self.charts.set_chart_title()
-        self.charts.force_y_range(self.charts.plot_lower, lower)
-        self.charts.force_y_range(self.charts.plot_upper, upper)
-        self.stats.update_stats(self.ctx, model_id, model_name)
+        self.charts.force_y_range(self.charts.plot_lower, snapshot.lower.values)
+        self.charts.force_y_range(self.charts.plot_upper, snapshot.upper.values)
+        self.stats.update_stats(snapshot)
+
+    def reload(self):
+        """
+        Fetch the shown model again, after bulk changes.
+        """
+        model_id = self._loading or self.model_id
+        if model_id is not None:
+            self.show_model(model_id)
+
+    #
+    ## Change events, see pd.ui.event_bus.EventBus
+    def unit_added(self, unit):
+        if self._reload_loading(unit):
+            return
+        if self._shows(unit):
+            self.charts.add_unit(unit.washer1, unit.washer2)
+            self.stats.count_unit(unit.washer1, unit.washer2, +1)
+            self._counted(+1)
+
+    def unit_deleted(self, unit):
+        if self._reload_loading(unit):
+            return
+        if self._shows(unit):
+            self.charts.remove_unit(unit.washer1, unit.washer2)
+            self.stats.count_unit(unit.washer1, unit.washer2, -1)
+            self._counted(-1)
+
+    def unit_updated(self, old, new):
+        if self._reload_loading(old) or self._reload_loading(new):
+            return
+        if self._shows(old):
+            self.charts.remove_unit(old.washer1, old.washer2)
+            self.stats.count_unit(old.washer1, old.washer2, -1)
+        if self._shows(new):
+            self.charts.add_unit(new.washer1, new.washer2)
+            self.stats.count_unit(new.washer1, new.washer2, +1)
+        if self._shows(old) or self._shows(new):
+            self._counted(self._shows(new) - self._shows(old))
+
+    def _shows(self, unit) -> bool:
+        return self.model_id is not None and str(unit.model_id) == str(self.model_id)
+
+    def _reload_loading(self, unit) -> bool:
+        # The snapshot on its way may have been read before this change
+        if self._loading is None or str(unit.model_id) != str(self._loading):
+            return False
+        self.show_model(self._loading)
+        return True
+
+    def _counted(self, delta: int):
+        self.count += delta
+        self.set_title(self.count, self.model_name)
+        # Stats come from the incremental layer, no refetch of the model
+        model_id = self.model_id
+        self.queries.get_model_stats(model_id, key="charts.stats").then(
+            lambda stats: self._stats_loaded(model_id, stats)
+        )
+
+    def _stats_loaded(self, model_id: str, stats):
+        if model_id != self.model_id or self._loading is not None:
+            return  # Another model was opened meanwhile
+        if stats is None:
+            self.charts.set_means(None, None)
+            return
+        self.charts.set_means(stats.avg_lower, stats.avg_upper)
+        self.stats.show_stats(stats)
 
     def set_title(self, n: int, model_id: str):
         # Title for Charts Area
@@ -66,16 +162,15 @@ class ChartsArea(QWidget):
     def _on_virtual_lower_changed(self, virtual_lower: float):
         if not self.stats._virtual_active:
             return
-        
+        # Held arrows fire faster than the charts repaint, only the last value of a frame is drawn
+        self._frames.schedule("virtual", lambda: self._show_virtuals(virtual_lower))
+
+    def _show_virtuals(self, virtual_lower: float):
+        if not self.stats._virtual_active:
+            return
+
         avg_total = self.stats._avg_total
         avg_spring = self.stats._avg_spring
         virtual_upper = round(avg_total - avg_spring - virtual_lower, 2)
         self.stats.set_virtual_upper(virtual_upper)
-
-        self.charts.lower_virtual_line.setValue(virtual_lower)
-        self.charts.lower_virtual_line.show()
-        self.charts.ensure_y_visible(self.charts.plot_lower, virtual_lower)
-
-        self.charts.upper_virtual_line.setValue(virtual_upper)
-        self.charts.upper_virtual_line.show()
-        self.charts.ensure_y_visible(self.charts.plot_upper, virtual_upper)        
\ No newline at end of file
+        self.charts.show_virtuals(virtual_lower, virtual_upper)
@@ -6,19 +6,29 @@ from PyQt6.QtWidgets import (
     QWidget,
     QAbstractItemView,
     QVBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QLineEdit
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+from pd.ui.views.pd_table_model import PDTableModel
+from pd.ui.views.pd_table_filter import ModelNameIndex
+
+# Column widths are measured on this many rows instead of all of them
+SIZE_SAMPLE_ROWS = 200
+
+# Search runs once typing pauses for this long
+SEARCH_DEBOUNCE_MS = 150
 
 class PDTable(QWidget):
     rowSelected = pyqtSignal(int, str, str)
     # pd_id, model, model_id
 
-    def __init__(self, i18n, parent=None):
+    def __init__(self, i18n, pd_service, parent=None):
         super().__init__(parent)
         self.i18n = i18n
+        self.pd_service = pd_service
         self._setup_ui()
 
     def _setup_ui(self):
@@ -29,13 +39,28 @@ class PDTable(QWidget):
         # Search Label
         self.search = QLineEdit()
         self.search.setPlaceholderText(self.i18n.t("table.search"))
-        self.search.textChanged.connect(self._search_label)
+        self.search.textChanged.connect(self._search_timer_restart)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._search_label)
+        self._name_index = ModelNameIndex()
 
         # Table
-        self.table = QTableWidget()
+        self.model = PDTableModel(self.pd_service, [
+            self.i18n.t("table.pd_id"),
+            self.i18n.t("table.model_id"),
+            self.i18n.t("table.model_name"),
+            self.i18n.t("table.opening_pressure"),
+            self.i18n.t("table.washer1"),
+            self.i18n.t("table.washer2"),
+            self.i18n.t("table.spring_length"),
+            self.i18n.t("table.final_pressure"),
+        ], parent=self)
+        self.table = QTableView()
         self._setup(self.table)
         self.table.setStyleSheet("""
-        QTableWidget:item:selected {
+        QTableView:item:selected {
             color: lightblue;
         }
         """)
@@ -44,61 +69,81 @@ class PDTable(QWidget):
         layout.addSpacing(4)
         layout.addWidget(self.table)
 
-    def _search_label(self, text: str):
-        text = text.strip().lower()
+    def _search_timer_restart(self):
+        self._search_timer.start()
 
-        for row in range(self.table.rowCount()):
-            pu = self.table.item(row, 2)  # model_name column
-            if not pu:
-                self.table.setRowHidden(row, True)
-                continue
+    def _search_label(self):
+        self.model.set_model_filter(self._name_index.search(self.search.text()))
 
-            model = pu.text().lower()
-            self.table.setRowHidden(row, text not in model)
-        
-    def _setup(self, table: QTableWidget):
-        table.setColumnCount(8)
-        table.setHorizontalHeaderLabels([
-            self.i18n.t("table.pd_id"),
-            self.i18n.t("table.model_id"),
-            self.i18n.t("table.model_name"),
-            self.i18n.t("table.opening_pressure"),
-            self.i18n.t("table.washer1"),
-            self.i18n.t("table.washer2"),
-            self.i18n.t("table.spring_length"),
-            self.i18n.t("table.final_pressure"),
-        ])
+    def _setup(self, table: QTableView):
+        table.setModel(self.model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        table.itemSelectionChanged.connect(self._emit_selected)
+        table.selectionModel().selectionChanged.connect(self._emit_selected)
         table.setColumnHidden(0, True)  # Hide pd_id column
         table.setColumnHidden(1, True)  # Hide model_id column
+
+        # Uniform row heights, rows are never measured one by one
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(table.fontMetrics().height() + 8)
+
+        # Start in id order, a header click sorts the keyset query by that column
+        table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         table.setSortingEnabled(True)
 
     def _emit_selected(self):
-        items = self.table.selectedItems()
-        if not items:
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
             return
-        row = items[0].row()
-
-        pd_id = int(self.table.item(row, 0).text())
-        model_name = self.table.item(row, 2).text()
-        model_id = self.table.item(row, 1).text()
-
-        self.rowSelected.emit(pd_id, model_name, model_id)
-
-    def set_data(self, models: list):
-        self.table.setRowCount(len(models))
-
-        for row, model in enumerate(models):
-            self.table.setItem(row, 0, QTableWidgetItem(str(model.id)))  # hidden pd_id
-            self.table.setItem(row, 1, QTableWidgetItem(str(model.model_id)))  # hidden model_id
-            self.table.setItem(row, 2, QTableWidgetItem(str(model.model_name)))
-            self.table.setItem(row, 3, QTableWidgetItem(str(model.opening_pressure)))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{model.washer1:.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(f"{model.washer2:.2f}"))
-            self.table.setItem(row, 6, QTableWidgetItem(f"{model.spring_length:.2f}")) 
-            self.table.setItem(row, 7, QTableWidgetItem(str(int(model.final_pressure))))
-
-        self.table.resizeColumnsToContents()
-        self.table.resizeRowsToContents()
\ No newline at end of file
+        unit = self.model.row_at(rows[0].row())
+
+        self.rowSelected.emit(unit.id, unit.model_name, str(unit.model_id))
+
+    def selected_pd_id(self) -> tuple[int, int] | None:
+        """
+        (pd_id, row) of the selected unit.
+        """
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        row = rows[0].row()
+        return self.model.row_at(row).id, row
+
+    def reload(self):
+        self._name_index.rebuild(self.pd_service.get_models())
+        self.model.reload()
+        self._search_label()
+        self._fit_columns()
+
+    #
+    ## Change events, see pd.ui.event_bus.EventBus
+    def unit_added(self, unit):
+        self.model.insert_unit(unit)
+
+    def unit_updated(self, old, new):
+        self.model.update_unit(new)
+
+    def unit_deleted(self, unit):
+        self.model.remove_unit(unit.id)
+
+    def model_added(self, model_id: int, model_name: str):
+        # A running search may match the new model's name
+        self._name_index.rebuild(self.pd_service.get_models())
+        self._search_label()
+
+    def _fit_columns(self):
+        """
+        Size the columns to a sample of rows, like resizeColumnsToContents on the first rows.
+        """
+        metrics = self.table.fontMetrics()
+        header = self.table.horizontalHeader()
+        sample = range(min(self.model.rowCount(), SIZE_SAMPLE_ROWS))
+        padding = 2 * self.table.style().pixelMetric(self.table.style().PixelMetric.PM_HeaderMargin) + 16
+
+        for column in range(self.model.columnCount()):
+            if self.table.isColumnHidden(column):
+                continue
+            texts = [self.model.headers[column]]
+            texts.extend(self.model.data(self.model.index(row, column)) for row in sample)
+            header.resizeSection(column, max(metrics.horizontalAdvance(t) for t in texts) + padding)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/views/pd_table_filter.py
+
+"""
+Search of the unit table by model name.
+Every substring of every model name is indexed once, so a search is a
+single dict lookup that yields the matching model ids; the table model
+then fetches only the rows of those models (PDTableModel.set_model_filter).
+"""
+
+class ModelNameIndex:
+    def __init__(self, models=()):
+        self._index: dict[str, frozenset[int]] = {}
+        self.rebuild(models)
+
+    def rebuild(self, models) -> None:
+        """
+        models: (model_id, model_name) pairs, like PDService.get_models().
+        """
+        index: dict[str, set[int]] = {}
+        for model_id, name in models:
+            name = str(name).lower()
+            for start in range(len(name)):
+                for end in range(start + 1, len(name) + 1):
+                    index.setdefault(name[start:end], set()).add(model_id)
+        self._index = {key: frozenset(ids) for key, ids in index.items()}
+
+    def search(self, text: str) -> frozenset[int] | None:
+        """
+        Ids of the models whose name contains text, None for an empty search.
+        """
+        text = text.strip().lower()
+        if not text:
+            return None
+        return self._index.get(text, frozenset())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/views/pd_table_model.py
+
+"""
+Virtual table model of the unit table.
+Rows are fetched in keyset pages (rows after the last loaded one in
+the sort order) when the view scrolls near the end, each page is a
+columnar PDViewTable, so the view opens at once no matter how many
+units the database holds.
+A search restricts the keyset query to the matching models and a
+header click orders it by that column, the loaded rows are always
+the rows shown, in the order shown.
+Added, edited and deleted units are applied row by row (insert_unit,
+update_unit, remove_unit), the selection and scroll position stay.
+"""
+
+import bisect
+
+import numpy as np
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from pd.core.models import PDView
+from pd.core.repositories import PDViewTable, PDViewRow
+
+COLUMNS = (
+    "id",
+    "model_id",
+    "model_name",
+    "opening_pressure",
+    "washer1",
+    "washer2",
+    "spring_length",
+    "final_pressure",
+)
+
+PAGE_SIZE = 2000
+
+class PDTableModel(QAbstractTableModel):
+    def __init__(self, pd_service, headers: list[str], page_size: int = PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.pd_service = pd_service
+        self.headers = headers
+        self.page_size = page_size
+
+        self._pages: list[PDViewTable] = []
+        self._offsets: list[int] = [0]  # first row of every page, then the loaded row count
+        self._cursor: tuple | None = None   # sort key of the last loaded row
+        self._exhausted = False
+        self._model_filter: frozenset[int] | None = None   # search result, None shows every model
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        # Loaded units edited to a sort key after the cursor, a later page would bring them again
+        self._moved: set[int] = set()
+
+    #
+    ## Loading
+    def reload(self) -> None:
+        """
+        Drop the loaded rows and fetch the first page again.
+        """
+        self.beginResetModel()
+        self._pages = []
+        self._offsets = [0]
+        self._cursor = None
+        self._exhausted = False
+        self._moved.clear()
+        self._append(self._load_page())
+        self.endResetModel()
+
+    def set_model_filter(self, model_ids: frozenset[int] | None) -> None:
+        """
+        Show only the rows of model_ids, or all rows for None.
+        The rows are fetched again from the first page, with the models in the keyset query.
+        """
+        if model_ids == self._model_filter:
+            return
+        self._model_filter = model_ids
+        self.reload()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._insert_page(self._load_page())
+
+    def _load_page(self) -> PDViewTable:
+        if self._model_filter is not None and not self._model_filter:
+            # Nothing can match, no query
+            self._exhausted = True
+            return PDViewTable.from_rows((), {})
+        page = self.pd_service.view_page(
+            self._cursor,
+            self.page_size,
+            self._model_filter,
+            self._sort_name(),
+            self._sort_order == Qt.SortOrder.DescendingOrder
+        )
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if len(page):
+            self._cursor = page.sort_key(self._sort_name(), len(page) - 1)
+        if self._moved:
+            # Shown where they were when edited, not once more at their new key
+            page = page.take(np.flatnonzero(~np.isin(page.id, list(self._moved))))
+        return page
+
+    def _insert_page(self, page: PDViewTable) -> None:
+        """
+        Append a page loaded after the current rows.
+        """
+        if not len(page):
+            return
+        first = self._offsets[-1]
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._append(page)
+        self.endInsertRows()
+
+    def _append(self, page: PDViewTable) -> None:
+        if len(page):
+            self._pages.append(page)
+            self._offsets.append(self._offsets[-1] + len(page))
+
+    def _shows(self, unit: PDView) -> bool:
+        return self._model_filter is None or int(unit.model_id) in self._model_filter
+
+    def _sort_name(self) -> str:
+        return COLUMNS[self._sort_column] if self._sort_column >= 0 else "id"
+
+    def _before(self, a: tuple, b: tuple) -> bool:
+        """
+        Whether sort key a comes before b in the current order.
+        """
+        return a > b if self._sort_order == Qt.SortOrder.DescendingOrder else a < b
+
+    #
+    ## Changes
+    def insert_unit(self, unit: PDView) -> None:
+        """
+        Show a unit that was just added.
+        """
+        if not self._shows(unit) or self._find(unit.id) is not None:
+            return
+        self._insert_loaded(unit)
+
+    def _insert_loaded(self, unit: PDView) -> None:
+        """
+        Place a unit that is not loaded among the loaded rows, by its sort key.
+        """
+        table = PDViewTable.from_views([unit])
+        key = table.sort_key(self._sort_name(), 0)
+        if not self._exhausted and (self._cursor is None or self._before(self._cursor, key)):
+            return  # After the keyset cursor, a later page will contain it
+
+        loaded = self._position(key)
+        self.beginInsertRows(QModelIndex(), loaded, loaded)
+        if loaded == self._offsets[-1]:
+            self._append(table)
+        else:
+            page, index = self._page_of(loaded)
+            self._pages[page] = self._pages[page].inserted(index, unit)
+            for i in range(page + 1, len(self._offsets)):
+                self._offsets[i] += 1
+        self.endInsertRows()
+
+    def update_unit(self, unit: PDView) -> None:
+        """
+        Show the new values of an edited unit. The row keeps its place
+        in a sorted table until the next sort, like in a spreadsheet.
+        """
+        loaded = self._find(unit.id)
+        if loaded is None:
+            if self._shows(unit):
+                self._insert_loaded(unit)   # Moved into the searched models, or before the cursor
+            return
+        if not self._shows(unit):
+            self.remove_unit(unit.id)   # Moved out of the searched models
+            return
+
+        page, index = self._page_of(loaded)
+        self._pages[page].set_row(index, unit)
+        if not self._exhausted and self._sort_column > 0:
+            self._moved.add(int(unit.id))
+        self.dataChanged.emit(self.index(loaded, 0), self.index(loaded, len(COLUMNS) - 1))
+
+    def remove_unit(self, pd_id: int) -> None:
+        """
+        Drop a deleted unit.
+        """
+        loaded = self._find(pd_id)
+        if loaded is None:
+            return
+        self.beginRemoveRows(QModelIndex(), loaded, loaded)
+        self._drop_loaded(loaded)
+        self.endRemoveRows()
+
+    def _drop_loaded(self, loaded: int) -> None:
+        page, index = self._page_of(loaded)
+        table = self._pages[page].without(index)
+        if len(table):
+            self._pages[page] = table
+        else:
+            # The page ended one row after its start, that boundary goes with it
+            del self._pages[page]
+            del self._offsets[page + 1]
+        for i in range(page + 1, len(self._offsets)):
+            self._offsets[i] -= 1
+
+    def _find(self, pd_id: int) -> int | None:
+        """
+        Loaded row of a unit.
+        """
+        if self._sort_column <= 0 and self._sort_order == Qt.SortOrder.AscendingOrder:
+            # Id order, every page holds ascending ids
+            for page, start in zip(self._pages, self._offsets):
+                if page.id[0] <= pd_id <= page.id[-1]:
+                    index = int(np.searchsorted(page.id, pd_id))
+                    return start + index if page.id[index] == pd_id else None
+            return None
+        for page, start in zip(self._pages, self._offsets):
+            found = np.flatnonzero(page.id == pd_id)
+            if len(found):
+                return start + int(found[0])
+        return None
+
+    def _position(self, key: tuple) -> int:
+        """
+        Loaded row a unit with this sort key goes before.
+        """
+        name = self._sort_name()
+        lo, hi = 0, self._offsets[-1]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            page, index = self._page_of(mid)
+            if self._before(self._pages[page].sort_key(name, index), key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    #
+    ## Access
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._offsets[-1]
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(COLUMNS)
+
+    def row_at(self, row: int) -> PDViewRow:
+        page, index = self._page_of(row)
+        return self._pages[page][index]
+
+    def _page_of(self, loaded: int) -> tuple[int, int]:
+        page = bisect.bisect_right(self._offsets, loaded) - 1
+        return page, loaded - self._offsets[page]
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        page, i = self._page_of(index.row())
+        table = self._pages[page]
+        column = COLUMNS[index.column()]
+        if column == "model_name":
+            return table.model_name_at(i)
+
+        value = getattr(table, column)[i]
+        if column in ("washer1", "washer2", "spring_length"):
+            return f"{value:.2f}"
+        return str(int(value))
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    #
+    ## Sorting
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Order the keyset query by the column and fetch its first page,
+        SQLite reads the page from the column's index.
+        """
+        if (column, order) == (self._sort_column, self._sort_order):
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self.reload()
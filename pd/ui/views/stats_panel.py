@@ -13,6 +13,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 
+from pd.core.repositories import ThicknessCounts
+
 class StatsPanel(QWidget):
     virtual_lower_changed = pyqtSignal(float)
     def __init__(self, ctx, parent=None):
@@ -34,8 +36,14 @@ class StatsPanel(QWidget):
         self.median_lower = QLabel()
         self.median_upper = QLabel()
 
+        self.std_lower = QLabel()
+        self.std_upper = QLabel()
+        self.range_lower = QLabel()
+        self.range_upper = QLabel()
+        self.band_lower = QLabel()
+        self.band_upper = QLabel()
+
         self.common = QLabel()
-        self.common.setToolTip(self.i18n.t("stats_panel.common_config_tooltip"))
 
         self.virtual_label = QLabel("--")
         self.virtual_slider = QSlider(Qt.Orientation.Horizontal)
@@ -48,6 +56,11 @@ class StatsPanel(QWidget):
         self.virtual_slider.valueChanged.connect(self._on_virtual_changed)
 
         self.virtual_upper_label = QLabel("--")
+        self.virtual_lower_units = QLabel("--")
+        self.virtual_upper_units = QLabel("--")
+        # Units per slider tick of the shown model, see update_stats
+        self._lower_counts: ThicknessCounts | None = None
+        self._upper_counts: ThicknessCounts | None = None
 
         # Arrow buttons and slider
         self.btn_minus = QToolButton()
@@ -85,31 +98,62 @@ class StatsPanel(QWidget):
 
         layout.addRow("", QLabel(""))  # Spacer
 
+        layout.addRow(self.i18n.t("stats_panel.std_lower"), self.std_lower)
+        layout.addRow(self.i18n.t("stats_panel.std_upper"), self.std_upper)
+        layout.addRow(self.i18n.t("stats_panel.range_lower"), self.range_lower)
+        layout.addRow(self.i18n.t("stats_panel.range_upper"), self.range_upper)
+
+        # Band between the lowest and the highest configured percentile
+        percentiles = ctx.pd_service.stats_options.percentiles
+        self._band = (percentiles[0], percentiles[-1]) if len(percentiles) >= 2 else None
+        if self._band:
+            lo, hi = (f"{p:g}" for p in self._band)
+            layout.addRow(self.i18n.t("stats_panel.band_lower").format(lo=lo, hi=hi), self.band_lower)
+            layout.addRow(self.i18n.t("stats_panel.band_upper").format(lo=lo, hi=hi), self.band_upper)
+
+        layout.addRow("", QLabel(""))  # Spacer
+
         layout.addRow(self.i18n.t("stats_panel.common_config"), self.common)
 
         layout.addRow("", QLabel(""))  # Spacer
 
         layout.addRow(self.i18n.t("stats_panel.virtual_lower_label"), self.virtual_label)
         layout.addRow(self.i18n.t("stats_panel.virtual_upper_label"), self.virtual_upper_label)
+        layout.addRow(self.i18n.t("stats_panel.virtual_lower_units"), self.virtual_lower_units)
+        layout.addRow(self.i18n.t("stats_panel.virtual_upper_units"), self.virtual_upper_units)
         layout.addRow("", slider_row)
         
         outer.addLayout(layout)
         outer.addStretch(1)
 
-    def update_stats(self, ctx, model_id, model_name: str):
-        if not ctx or not model_id:
-            return
-        
-        stats = ctx.pd_service.get_model_stats(model_id)
+    def update_stats(self, snapshot):
         self.reset_virtuals()
         self._virtual_active = False
         self.virtual_slider.blockSignals(True)
-        self._configure_virtual_slider_range(model_name)
+        self._configure_virtual_slider_range(snapshot.model_name)
+        # Slider ticks are then array lookups, without the database
+        ticks = self.virtual_slider.maximum() + 1
+        self._lower_counts = ThicknessCounts.from_histogram(snapshot.lower, ticks)
+        self._upper_counts = ThicknessCounts.from_histogram(snapshot.upper, ticks)
+
+        stats = snapshot.stats
+        if stats is None:
+            self.virtual_slider.blockSignals(False)
+            return
+
 
         slider_value = int(stats.avg_lower * 100)
         self.virtual_slider.setValue(slider_value)
 
         self.virtual_slider.blockSignals(False)
+        self.show_stats(stats)
+
+    def show_stats(self, stats):
+        """
+        Fill in the labels, the virtual washers are kept (e.g. after a unit was added).
+        """
+        if stats is None:
+            return
 
         self.avg_lower.setText(f"{stats.avg_lower:.2f} mm")
         self.avg_spring.setText(f"{stats.avg_spring:.2f} mm")
@@ -119,6 +163,20 @@ class StatsPanel(QWidget):
         self.median_lower.setText(f"{stats.median_lower:.2f} mm")
         self.median_upper.setText(f"{stats.median_upper:.2f} mm")
 
+        self.std_lower.setText(f"{stats.std_lower:.3f} mm")
+        self.std_upper.setText(f"{stats.std_upper:.3f} mm")
+        self.range_lower.setText(f"{stats.min_lower:.2f} – {stats.max_lower:.2f} mm")
+        self.range_upper.setText(f"{stats.min_upper:.2f} – {stats.max_upper:.2f} mm")
+
+        if self._band:
+            lo, hi = self._band
+            self.band_lower.setText(f"{stats.percentiles_lower[lo]:.2f} – {stats.percentiles_lower[hi]:.2f} mm")
+            self.band_upper.setText(f"{stats.percentiles_upper[lo]:.2f} – {stats.percentiles_upper[hi]:.2f} mm")
+
+        # min_count can be changed in the settings while the app is running
+        self.common.setToolTip(self.i18n.t("stats_panel.common_config_tooltip").format(
+            min_count=self.ctx.pd_service.stats_options.min_count
+        ))
         if stats.common_config:
             l, s, u = stats.common_config
             self.common.setText(f"{l:.2f} mm + {s:.2f} mm + {u:.2f} mm")
@@ -135,6 +193,7 @@ class StatsPanel(QWidget):
             return
         mm = value / 100
         self.virtual_label.setText(f"{mm:.2f} mm")
+        self._show_units(self.virtual_lower_units, self._lower_counts, mm)
         self._virtual_active = True
         self.virtual_lower_changed.emit(mm)
 
@@ -166,7 +225,22 @@ class StatsPanel(QWidget):
     def set_virtual_upper(self, value: float):
         self.virtual_upper_label.setText(f"{value:.2f} mm")
         self.virtual_upper_label.show()
+        self._show_units(self.virtual_upper_units, self._upper_counts, value)
+
+    def count_unit(self, lower: float, upper: float, delta: int):
+        """
+        Keep the units per tick current after a change event of the shown model.
+        """
+        if self._lower_counts is None:
+            return
+        self._lower_counts.add(lower, delta)
+        self._upper_counts.add(upper, delta)
+
+    def _show_units(self, label: QLabel, counts: ThicknessCounts | None, mm: float):
+        label.setText("--" if counts is None else str(counts.at(mm)))
 
     def reset_virtuals(self):
         self.virtual_upper_label.setText("--")
-        self.virtual_label.setText("--")
\ No newline at end of file
+        self.virtual_label.setText("--")
+        self.virtual_lower_units.setText("--")
+        self.virtual_upper_units.setText("--")
\ No newline at end of file
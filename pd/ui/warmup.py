@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# pd/ui/warmup.py
+
+"""
+Background precomputation of model stats after startup.
+Models are warmed one at a time with background priority, so a
+request of the user is always the next one the pool runs.
+"""
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from pd.core.services import PDService
+from pd.ui.query_executor import QueryExecutor, PRIORITY_BACKGROUND
+
+class StatsWarmup(QObject):
+    progress = pyqtSignal(int, int)   # done, total
+    finished = pyqtSignal(int)        # warmed models
+
+    def __init__(self, executor: QueryExecutor, recent=(), parent=None):
+        super().__init__(parent)
+        self.executor = executor
+        self.recent = list(recent)
+        self._models: list[int] = []
+        self._done = 0
+        self._stopped = False
+
+    def start(self) -> None:
+        self._request(PDService.warmup_order, self.recent).then(self._ordered, self._failed)
+
+    def stop(self) -> None:
+        self._stopped = True
+        self.executor.cancel("warmup")
+
+    def _ordered(self, models: list[int]) -> None:
+        self._models = models
+        self._next()
+
+    def _next(self) -> None:
+        if self._stopped:
+            return
+        if self._done >= len(self._models):
+            self.finished.emit(self._done)
+            return
+        self.progress.emit(self._done, len(self._models))
+        model_id = self._models[self._done]
+        self._request(PDService.get_model_stats, model_id).then(self._warmed, self._warmed)
+
+    def _warmed(self, _result) -> None:
+        # A failed model is skipped, it is computed on its first click as before
+        self._done += 1
+        # Let the event loop run (and queue user requests) between models
+        QTimer.singleShot(0, self._next)
+
+    def _failed(self, _error) -> None:
+        self.finished.emit(0)
+
+    def _request(self, fn, *args):
+        return self.executor.latest("warmup", fn, *args, priority=PRIORITY_BACKGROUND)
@@ -10,44 +10,88 @@ from PyQt6.QtWidgets import (
 )
 from pd.ui.utils.tooltip import on_point_hovered
 
+def scatter_item(brush, name: str) -> pg.PlotDataItem:
+    """
+    Washer scatter series with level of detail: points outside the
+    view are skipped and dense views are subsampled (x must be ascending),
+    symbols are rendered once and cached.
+    """
+    item = pg.PlotDataItem(
+        pen=None,
+        symbol='o',
+        symbolPen=None,
+        symbolBrush=brush,
+        symbolSize=8,
+        name=name
+    )
+    item.setClipToView(True)
+    item.setDownsampling(auto=True, method="subsample")
+    # Tooltips are ours (on_point_hovered), not pyqtgraph's
+    item.scatter.setData(hoverable=True, tip=None, useCache=True)
+    return item
+
 class ChartWindow(QWidget):
-    def __init__(self, source_scatter, source_mean_line, title, i18n, n, model_name, model_id, parent=None):
+    """
+    Detail window of one washer chart. Built once and reused: show_data
+    only hands the chart's arrays to the existing plot items.
+    """
+    def __init__(self, source_scatter: pg.PlotDataItem, source_mean_line: pg.InfiniteLine, i18n, parent=None):
         super().__init__(parent)
         self.i18n = i18n
-        x, y = source_scatter.getData()
-        self.setWindowTitle(self.i18n.t("charts.chart_window_title").format(n=n, model_id=model_name))
         self.resize(800, 600)
 
         layout = QVBoxLayout(self)
         self.plot = pg.PlotWidget()
         layout.addWidget(self.plot)
 
-        scatter = pg.ScatterPlotItem(
-            x=x, y=y,
-            pen=source_scatter.opts['pen'],
-            brush=source_scatter.opts['brush'],
-            size=source_scatter.opts['size'],
-            symbol=source_scatter.opts['symbol'],
-            name=source_scatter.opts['name'],
-            hoverable=source_scatter.opts['hoverable'],
-            tip=source_scatter.opts['tip']
-        )
-        self.plot.addItem(scatter)
+        self.scatter = scatter_item(source_scatter.opts['symbolBrush'], source_scatter.name())
+        self.plot.addItem(self.scatter)
 
-        if source_mean_line.isVisible():
-            mean_line = pg.InfiniteLine(
-                angle=source_mean_line.angle,
-                pen=source_mean_line.pen,
-                movable=False
-            )
-            mean_line.setValue(source_mean_line.value())
-            self.plot.addItem(mean_line)
+        self.mean_line = pg.InfiniteLine(
+            angle=source_mean_line.angle,
+            pen=source_mean_line.pen,
+            movable=False
+        )
+        self.plot.addItem(self.mean_line)
 
         self.plot.setLabel("left", self.i18n.t("charts.podkladla_thickness_y"))
         self.plot.setLabel("bottom", self.i18n.t("charts.podkladla_count_x"))
-        self.plot.setTitle(title)
         self.plot.showGrid(x=True, y=True)
         self.plot.getAxis('bottom').setTickSpacing(major=1, minor=1)
         self.plot.getAxis('left').setTickSpacing(major=0.01, minor=0.01)
         self.plot.setBackground('w')
-        scatter.sigHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot))
\ No newline at end of file
+        self.scatter.sigPointsHovered.connect(lambda item, points, ev: on_point_hovered(self.i18n, points, self.plot))
+
+    def show_data(self, x, y, mean: float | None, title: str, n: int, model_name: str):
+        self.setWindowTitle(self.i18n.t("charts.chart_window_title").format(n=n, model_id=model_name))
+        self.plot.setTitle(title)
+        self.scatter.setData(x=x, y=y)
+        if mean is None:
+            self.mean_line.hide()
+        else:
+            self.mean_line.setValue(mean)
+            self.mean_line.show()
+        self.plot.enableAutoRange()
+
+class ChartWindowPool:
+    """
+    One ChartWindow per key, created on first use. Closing only hides
+    a window, the next open reuses it.
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self._windows: dict[str, ChartWindow] = {}
+
+    def acquire(self, key: str) -> ChartWindow:
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = self.factory(key)
+        return window
+
+    def visible(self, key: str) -> ChartWindow | None:
+        window = self._windows.get(key)
+        return window if window is not None and window.isVisible() else None
+
+    def close_all(self) -> None:
+        for window in self._windows.values():
+            window.close()
@@ -15,10 +15,14 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QCheckBox,
     QLineEdit,
+    QSpinBox,
+    QDoubleSpinBox,
+    QFormLayout,
 )
 
 from pd.core.i18n import AVAILABLE_LANGUAGES
 from pd.core.config import save_config
+from pd.core.statistics import StatsOptions
 
 
 class SettingsDialog(QDialog):
@@ -86,6 +90,30 @@ class SettingsDialog(QDialog):
         db_folder_row = QHBoxLayout()
         db_folder_row.addWidget(self.db_folder_label)
 
+        #
+        ## Most common configuration
+        stats_cfg = self.ctx.config["statistics"]
+        self.tolerance_spin = QDoubleSpinBox()
+        self.tolerance_spin.setDecimals(2)
+        self.tolerance_spin.setRange(0.0, 1.0)
+        self.tolerance_spin.setSingleStep(0.01)
+        self.tolerance_spin.setSuffix(" mm")
+        self.tolerance_spin.setValue(stats_cfg.getfloat("tolerance", fallback=0.03))
+        self.tolerance_spin.setToolTip(t("settings.common_tolerance_tooltip"))
+
+        self.min_count_spin = QSpinBox()
+        self.min_count_spin.setRange(1, 1000)
+        self.min_count_spin.setValue(stats_cfg.getint("min_count", fallback=5))
+        self.min_count_spin.setToolTip(t("settings.common_min_count_tooltip"))
+
+        stats_form = QFormLayout()
+        stats_form.addRow(t("settings.common_tolerance") + ":", self.tolerance_spin)
+        stats_form.addRow(t("settings.common_min_count") + ":", self.min_count_spin)
+
+        self.warmup_cb = QCheckBox(t("settings.warmup"))
+        self.warmup_cb.setChecked(stats_cfg.getboolean("warmup", fallback=True))
+        self.warmup_cb.setToolTip(t("settings.warmup_tooltip"))
+
         self.lang_restart_info = QLabel(t("settings.language_restart_info"))
         self.lang_restart_info.setStyleSheet("color: gray; font-style: italic;")
         self.lang_restart_info.setVisible(False)
@@ -106,6 +134,10 @@ class SettingsDialog(QDialog):
         layout.addWidget(self.db_show_ask_cb)
         layout.addWidget(self.db_use_default_cb)
         layout.addLayout(db_folder_row)
+        layout.addSpacing(10)
+        layout.addWidget(QLabel(t("settings.common_config")))
+        layout.addLayout(stats_form)
+        layout.addWidget(self.warmup_cb)
         layout.addStretch()
         layout.addWidget(self.lang_restart_info)
         layout.addLayout(btn_row)
@@ -138,6 +170,12 @@ class SettingsDialog(QDialog):
         cfg["database"]["show_ask"] = "true" if self.db_show_ask_cb.isChecked() else "false"
         cfg["database"]["use_default"] = "true" if self.db_use_default_cb.isChecked() else "false"
 
+        cfg["statistics"]["tolerance"] = f"{self.tolerance_spin.value():.2f}"
+        cfg["statistics"]["min_count"] = str(self.min_count_spin.value())
+        cfg["statistics"]["warmup"] = "true" if self.warmup_cb.isChecked() else "false"
+        # Applied right away, the next model selection uses the new values
+        self.ctx.pd_service.stats_options = StatsOptions.from_config(cfg)
+
         save_config(cfg, self.ctx.paths.config / "config.ini")
 
     def _save_and_close(self):
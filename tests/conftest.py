@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/conftest.py
+
+import os
+import random
+
+import pytest
+
+from pd.core.connections import ConnectionManager, DatabaseSettings
+from pd.core.database import init_database
+from pd.core.repositories import PDRepository
+from pd.core.services import PDService
+
+# Qt widgets and models without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+@pytest.fixture
+def make_service(tmp_path):
+    """
+    make_service(units, model_id) -> PDService over a new database holding
+    that many random units of the model.
+    """
+    managers = []
+
+    def make(units: int, model_id: int = 2) -> PDService:
+        path = tmp_path / f"pd{len(managers)}.db"
+        init_database(path)
+        db = ConnectionManager(path, DatabaseSettings())
+        managers.append(db)
+        repo = PDRepository(db.connection())
+        rng = random.Random(7)
+        repo.insert_many(
+            (model_id, round(rng.uniform(1, 2), 2), round(rng.uniform(1, 2), 2), round(rng.uniform(40, 41), 2), 265.0, 1)
+            for _ in range(units)
+        )
+        return PDService(repo)
+
+    yield make
+    for db in managers:
+        db.close_all()
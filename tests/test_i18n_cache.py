@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_i18n_cache.py
+
+"""
+The marshal cache of the flattened catalog.
+"""
+
+import json
+import marshal
+import os
+import shutil
+import sys
+
+from pd.core.i18n import I18n
+from pd.platform.resources import resource_path
+
+def _unpacked(tmp_path, monkeypatch):
+    """
+    Catalogs unpacked under a fake PyInstaller bundle dir.
+    """
+    bundle = tmp_path / "bundle"
+    (bundle / "pd/assets/i18n").mkdir(parents=True)
+    catalog = bundle / "pd/assets/i18n/en.json"
+    shutil.copy(resource_path("pd/assets/i18n/en.json"), catalog)
+    monkeypatch.setattr(sys, "_MEIPASS", str(bundle), raising=False)
+    return catalog
+
+def test_cache_hit_survives_new_mtime(tmp_path, monkeypatch):
+    catalog = _unpacked(tmp_path, monkeypatch)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    first = I18n("en", cache_dir)
+
+    # Mark the cache so a rebuild would be visible
+    cache = cache_dir / "i18n_en.marshal"
+    with open(cache, "rb") as f:
+        stamp, entries, plurals = marshal.load(f)
+    with open(cache, "wb") as f:
+        marshal.dump((stamp, {**entries, "test.cached": "yes"}, plurals), f)
+
+    # A onefile launch unpacks the same content with a new mtime
+    st = catalog.stat()
+    os.utime(catalog, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    second = I18n("en", cache_dir)
+    assert second.t("test.cached") == "yes"
+    assert second.catalog.keys() - {"test.cached"} == first.catalog.keys()
+
+def test_changed_content_rebuilds(tmp_path, monkeypatch):
+    catalog = _unpacked(tmp_path, monkeypatch)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    I18n("en", cache_dir)
+
+    data = json.loads(catalog.read_text(encoding="utf-8"))
+    data["test"] = {"added": "new"}
+    catalog.write_text(json.dumps(data), encoding="utf-8")
+    assert I18n("en", cache_dir).t("test.added") == "new"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_importer.py
+
+"""
+Bench log import (headers, delimiters, bad rows) and the export -> import round trip.
+"""
+
+import pytest
+
+from pd.core.exporter import export_units
+from pd.core.importer import UnitImporter
+
+MODEL_ID = 2
+MODEL_NAME = "0414720403"
+
+def _rows(repo) -> list[tuple]:
+    """
+    (model_name, opening_pressure, washer1, washer2, spring_length, final_pressure) of every unit.
+    """
+    return [row[2:] for row in repo.iter_all_with_name()]
+
+def _import(repo, path, **kwargs):
+    return UnitImporter(repo).import_file(path, **kwargs)
+
+def test_header_aliases_in_any_order(tmp_path, make_service):
+    repo = make_service(0).repo
+    path = tmp_path / "log.csv"
+    path.write_text(
+        "Spring;Upper;Lower;model_name;final_pressure;opening_pressure\n"
+        f"40.51;1.22;1.11;{MODEL_NAME};281;277\n",
+        encoding="utf-8"
+    )
+    result = _import(repo, path)
+
+    assert (result.inserted, result.skipped, result.errors) == (1, 0, [])
+    assert _rows(repo) == [(MODEL_NAME, 277, 1.11, 1.22, 40.51, 281.0)]
+
+def test_headerless_tsv_with_decimal_commas(tmp_path, make_service):
+    repo = make_service(0).repo
+    path = tmp_path / "log.tsv"
+    path.write_text(
+        f"{MODEL_NAME}\t263\t1,05\t1,45\t40,02\t270,5\n"
+        "\n"
+        # Spreadsheets drop the leading zero of model numbers
+        f"{int(MODEL_NAME)}\t288\t1,1\t1,2\t40,1\t271\n",
+        encoding="utf-8"
+    )
+    result = _import(repo, path)
+
+    assert result.inserted == 2
+    assert _rows(repo) == [
+        (MODEL_NAME, 263, 1.05, 1.45, 40.02, 270.5),
+        (MODEL_NAME, 288, 1.1, 1.2, 40.1, 271.0),
+    ]
+
+def test_bad_rows_are_reported_by_line(tmp_path, make_service):
+    repo = make_service(0).repo
+    path = tmp_path / "bad.csv"
+    path.write_text(
+        "model,opening_pressure,washer1,washer2,spring_length,final_pressure\n"
+        f"{MODEL_NAME},263,1.1,abc,40.5,270\n"
+        "9999999999,263,1.1,1.2,40.5,270\n"
+        f"{MODEL_NAME},263,1.1,1.2,40.5,270\n"
+        f"{MODEL_NAME},999,1.1,1.2,40.5,270\n"
+        f"{MODEL_NAME},263,,1.2,40.5,270\n",
+        encoding="utf-8"
+    )
+    result = _import(repo, path)
+
+    assert (result.inserted, result.skipped) == (1, 4)
+    assert [(e.line, e.message) for e in result.errors] == [
+        (2, "Invalid washer2: abc"),
+        (3, "Unknown model: 9999999999"),
+        (5, "Unknown opening pressure: 999"),
+        (6, "Missing washer1"),
+    ]
+    assert len(_rows(repo)) == 1
+
+def test_progress_is_reported_per_chunk(tmp_path, make_service):
+    repo = make_service(0).repo
+    path = tmp_path / "log.csv"
+    path.write_text("".join(f"{MODEL_NAME},263,1.1,1.2,40.5,270\n" for _ in range(25)), encoding="utf-8")
+    progress = []
+    result = UnitImporter(repo, chunk_size=10).import_file(path, progress=progress.append)
+
+    assert result.inserted == 25
+    assert progress == [10, 20, 25]
+
+@pytest.mark.parametrize("suffix", [".csv", ".xlsx"])
+def test_export_then_import_round_trip(tmp_path, make_service, suffix):
+    if suffix == ".xlsx":
+        pytest.importorskip("openpyxl")
+    source = make_service(50, MODEL_ID).repo
+    path = tmp_path / f"out{suffix}"
+    assert export_units(source, path) == 50
+
+    target = make_service(0).repo
+    result = _import(target, path)
+
+    assert (result.inserted, result.skipped, result.errors) == (50, 0, [])
+    assert _rows(target) == _rows(source)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_online_stats.py
+
+"""
+Incremental stats against a full recompute over the database.
+"""
+
+import random
+import time
+
+import pytest
+
+from pd.core.online_stats import ModelStats, SortedColumn
+from pd.core.services import PDService
+from pd.core.statistics import compute_stats
+
+MODEL_ID = 2
+
+@pytest.fixture
+def service(make_service):
+    return make_service(200, MODEL_ID)
+
+def _full(service: PDService, summary=None):
+    options = service.stats_options
+    return compute_stats(
+        service.repo.get_columns_by_model(MODEL_ID),
+        summary=summary,
+        percentiles=options.percentiles,
+        tolerance=options.tolerance,
+        min_count=options.min_count
+    )
+
+def test_seed_takes_moments_from_model_summary(service):
+    summary = service.model_summary(MODEL_ID)
+    live = service.get_model_stats(MODEL_ID)
+
+    assert live == _full(service, summary)
+    assert service.live_stats.get(MODEL_ID).count == summary.count
+
+def test_snapshot_seeds_with_model_summary(service):
+    snapshot = service.model_snapshot(MODEL_ID)
+
+    assert snapshot.stats == _full(service, service.model_summary(MODEL_ID))
+    assert snapshot.count == service.model_summary(MODEL_ID).count
+
+def test_summary_of_other_rows_is_ignored(service):
+    columns = service.repo.get_columns_by_model(MODEL_ID)
+    summary = service.model_summary(MODEL_ID)
+    seeded = ModelStats.from_columns(columns.washer1[:-1], columns.washer2[:-1], columns.spring[:-1], summary)
+
+    assert seeded.count == len(columns) - 1
+    assert seeded.lower.mean == pytest.approx(float(columns.washer1[:-1].mean()), rel=1e-12)
+
+def test_live_stats_follow_changes(service):
+    service.get_model_stats(MODEL_ID)
+    service.add_new(MODEL_ID, 1.23, 1.45, 40.2, 265.0, 1)
+    unit = service.repo.get_all()[3]
+    assert int(unit.model_id) == MODEL_ID
+    service.delete_unit(unit.id)
+
+    live = service.get_model_stats(MODEL_ID)
+    full = _full(service)
+    assert live.median_lower == full.median_lower
+    assert live.percentiles_upper == full.percentiles_upper
+    assert live.common_config == full.common_config
+    assert live.avg_total == pytest.approx(full.avg_total, rel=1e-12)
+    assert live.std_lower == pytest.approx(full.std_lower, rel=1e-9)
+
+def test_vectorized_seed_matches_per_unit_seed(service):
+    columns = service.repo.get_columns_by_model(MODEL_ID)
+    seeded = ModelStats.from_columns(columns.washer1, columns.washer2, columns.spring)
+    per_unit = ModelStats._from_lists(
+        columns.washer1.tolist(), columns.washer2.tolist(), columns.spring.tolist(), None
+    )
+
+    assert seeded.totals == per_unit.totals
+    assert all(seeded._configs_of(key) == per_unit.configs[key] for key in per_unit.totals)
+    assert seeded.sorted_lower.values == per_unit.sorted_lower.values
+    seeded, per_unit = seeded.stats(), per_unit.stats()
+    assert seeded.common_config == per_unit.common_config
+    assert seeded.median_upper == per_unit.median_upper
+    assert seeded.avg_total == pytest.approx(per_unit.avg_total, rel=1e-12)
+    assert seeded.std_spring == pytest.approx(per_unit.std_spring, rel=1e-9)
+
+def test_seeded_units_can_be_removed(service):
+    columns = service.repo.get_columns_by_model(MODEL_ID)
+    seeded = ModelStats.from_columns(columns.washer1, columns.washer2, columns.spring)
+    for a, b, c in zip(columns.washer1[:50].tolist(), columns.washer2[:50].tolist(), columns.spring[:50].tolist()):
+        seeded.remove(a, b, c)
+
+    rest = ModelStats._from_lists(
+        columns.washer1[50:].tolist(), columns.washer2[50:].tolist(), columns.spring[50:].tolist(), None
+    )
+    assert seeded.consistent
+    assert seeded.count == len(columns) - 50
+    assert seeded.totals == rest.totals
+    assert seeded.common_config() == rest.common_config()
+
+def _delta_seconds(size: int) -> float:
+    """
+    Best time of 2000 adds and removes on a sorted column of size values.
+    """
+    rng = random.Random(size)
+    column = SortedColumn([round(rng.uniform(1.0, 2.0), 2) for _ in range(size)])
+    values = [round(rng.uniform(1.0, 2.0), 2) for _ in range(1000)]
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for x in values:
+            column.add(x)
+        for x in values:
+            column.remove(x)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def test_sorted_column_delta_cost_independent_of_size():
+    small, large = _delta_seconds(1_000), _delta_seconds(500_000)
+    # A plain list moves the whole tail on every insert, ~100x slower at this size
+    assert large < small * 5
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_pd_table_model.py
+
+"""
+Row-level changes of the unit table model keep its pages consistent.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from PyQt6.QtCore import Qt
+
+from pd.ui.views.pd_table_model import PDTableModel, COLUMNS
+
+MODEL_ID = 2
+OTHER_ID = 3
+
+@pytest.fixture
+def service(make_service):
+    return make_service(5, MODEL_ID)
+
+@pytest.fixture
+def model(qapp, service):
+    model = PDTableModel(service, list(COLUMNS))
+    model.reload()
+    return model
+
+def _add(service):
+    service.add_new(MODEL_ID, 1.23, 1.45, 40.5, 265.0, 1)
+    pd_id = service.repo.get_all()[-1].id
+    return service.repo.get_view_row(pd_id)
+
+def _ids(model: PDTableModel) -> list[int]:
+    return [int(model.row_at(row).id) for row in range(model.rowCount())]
+
+def _consistent(model: PDTableModel) -> None:
+    loaded = sum(len(page) for page in model._pages)
+    assert model._offsets[-1] == loaded
+    assert len(model._offsets) == len(model._pages) + 1
+
+def test_remove_inserted_unit_then_filter_and_insert(model, service):
+    before = _ids(model)
+    unit = _add(service)
+    model.insert_unit(unit)
+    assert _ids(model) == before + [unit.id]
+
+    service.delete_unit(unit.id)
+    model.remove_unit(unit.id)
+    _consistent(model)
+    assert _ids(model) == before
+
+    model.set_model_filter(frozenset({MODEL_ID}))
+    assert _ids(model) == before
+
+    again = _add(service)
+    model.insert_unit(again)
+    _consistent(model)
+    assert _ids(model) == before + [again.id]
+
+def test_remove_only_row_of_first_page(qapp, make_service):
+    service = make_service(1, MODEL_ID)
+    model = PDTableModel(service, list(COLUMNS))
+    model.reload()
+    model.remove_unit(_ids(model)[0])
+    _consistent(model)
+    assert model.rowCount() == 0
+
+    unit = _add(service)
+    model.insert_unit(unit)
+    assert _ids(model) == [unit.id]
+
+def test_remove_page_between_pages(model, service):
+    before = _ids(model)
+    first = _add(service)
+    model.insert_unit(first)
+    second = _add(service)
+    model.insert_unit(second)
+
+    model.remove_unit(first.id)
+    _consistent(model)
+    assert _ids(model) == before + [second.id]
+    assert int(model.row_at(model.rowCount() - 1).id) == second.id
+
+def _fetch_all(model: PDTableModel) -> None:
+    while model.canFetchMore():
+        model.fetchMore()
+
+def test_filter_loads_only_matching_rows(qapp, make_service):
+    service = make_service(45, MODEL_ID)
+    for _ in range(3):
+        service.add_new(OTHER_ID, 1.1, 1.2, 40.1, 265.0, 1)
+    pages = []
+    view_page = service.view_page
+    service.view_page = lambda *args: pages.append(args) or view_page(*args)
+
+    model = PDTableModel(service, list(COLUMNS), page_size=10)
+    model.reload()
+    pages.clear()
+    model.set_model_filter(frozenset({OTHER_ID}))
+    _fetch_all(model)
+
+    assert model.rowCount() == 3
+    assert sum(len(page) for page in model._pages) == 3
+    assert {model.row_at(row).model_id for row in range(3)} == {OTHER_ID}
+    # One keyset query with the models in it, not a scan of every page
+    assert pages == [(None, 10, frozenset({OTHER_ID}), "id", False)]
+
+    model.set_model_filter(frozenset())
+    assert model.rowCount() == 0 and not model.canFetchMore()
+
+    model.set_model_filter(None)
+    assert model.rowCount() == 10
+    _fetch_all(model)
+    assert model.rowCount() == 48
+
+def test_edited_unit_moves_in_and_out_of_the_search(model, service):
+    ids = _ids(model)
+    model.set_model_filter(frozenset({MODEL_ID}))
+    unit = service.repo.get_view_row(ids[2])
+
+    model.update_unit(replace(unit, model_id=OTHER_ID))
+    assert _ids(model) == ids[:2] + ids[3:]
+
+    model.update_unit(unit)
+    _consistent(model)
+    assert _ids(model) == ids
+
+@pytest.fixture
+def mixed(make_service):
+    """
+    Units of three models and three opening pressures, with repeated values.
+    """
+    service = make_service(40, MODEL_ID)
+    service.repo.insert_many(
+        (model_id, 1.5, 1.25, 40.5, 270.0 + i % 3, pressure)
+        for i, (model_id, pressure) in enumerate([(OTHER_ID, 2), (5, 3), (OTHER_ID, 3), (5, 2)] * 6)
+    )
+    return service
+
+def _expected(service, column: str, descending: bool, model_ids=None) -> list[int]:
+    table = service.repo.get_view_table()
+    keys = [
+        table.sort_key(column, i) for i in range(len(table))
+        if model_ids is None or int(table.model_id[i]) in model_ids
+    ]
+    return [pd_id for _, pd_id in sorted(keys, reverse=descending)]
+
+@pytest.mark.parametrize("order", [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder])
+@pytest.mark.parametrize("column", range(len(COLUMNS)))
+@pytest.mark.parametrize("model_ids", [None, frozenset({OTHER_ID, 5})])
+def test_sorted_pages_follow_the_sort_order(qapp, mixed, column, order, model_ids):
+    model = PDTableModel(mixed, list(COLUMNS), page_size=7)
+    model.reload()
+    model.set_model_filter(model_ids)
+    model.sort(column, order)
+    # Only the first page, not the whole table
+    assert model.rowCount() == 7
+
+    _fetch_all(model)
+    descending = order == Qt.SortOrder.DescendingOrder
+    assert _ids(model) == _expected(mixed, COLUMNS[column], descending, model_ids)
+
+def test_sorted_table_places_new_and_edited_units(qapp, mixed):
+    model = PDTableModel(mixed, list(COLUMNS), page_size=10)
+    model.reload()
+    washer1 = COLUMNS.index("washer1")
+    model.sort(washer1, Qt.SortOrder.AscendingOrder)
+    first = model.row_at(0)
+
+    # Before the keyset cursor: placed among the loaded rows
+    mixed.add_new(MODEL_ID, 0.5, 1.0, 40.0, 265.0, 1)
+    unit = mixed.repo.get_view_row(mixed.repo.get_all()[-1].id)
+    model.insert_unit(unit)
+    assert model.row_at(0).id == unit.id
+
+    # After the cursor: left to a later page
+    mixed.add_new(MODEL_ID, 2.5, 1.0, 40.0, 265.0, 1)
+    late = mixed.repo.get_view_row(mixed.repo.get_all()[-1].id)
+    model.insert_unit(late)
+    assert late.id not in _ids(model)
+
+    # Edited past the cursor: keeps its row, and is not loaded twice
+    moved = replace(mixed.repo.get_view_row(first.id), washer1=2.4)
+    mixed.repo.update(replace(mixed.repo.get_unit_by_pd_id(first.id), washer1_thickness=2.4))
+    model.update_unit(moved)
+    assert model.row_at(1).id == first.id
+    _fetch_all(model)
+    ids = _ids(model)
+    assert len(ids) == len(set(ids)) == len(mixed.repo.get_all())
+    assert ids[-1] == late.id
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_statistics.py
+
+"""
+The NumPy engine, the pure-Python fallback and the baseline
+statistics.mean/median give the same results, and so do the
+incremental ModelStats.
+"""
+
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from pd.core.online_stats import ModelStats
+from pd.core.repositories import PDColumns, PDRecord
+from pd.core.statistics import (
+    compute_stats,
+    column_stats_python,
+    columns_summary,
+    most_common_config,
+    percentile_sorted,
+)
+
+PERCENTILES = (1.0, 5.0, 10.0, 25.0, 33.3, 50.0, 75.0, 90.0, 95.0, 99.0)
+
+def _records(n: int, seed: int = 0) -> list[PDRecord]:
+    rng = random.Random(seed)
+    return [
+        PDRecord(
+            washer1=round(rng.uniform(0.8, 2.0), 2),
+            spring=round(rng.uniform(40.0, 41.0), 2),
+            washer2=round(rng.uniform(0.8, 2.0), 2),
+        )
+        for _ in range(n)
+    ]
+
+def _columns(records: list[PDRecord]) -> PDColumns:
+    return PDColumns.from_rows((r.washer1, r.washer2, r.spring, 0.0) for r in records)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_empty_column_has_no_stats(use_numpy):
+    assert compute_stats([], use_numpy=use_numpy) is None
+    assert compute_stats(_columns([]), use_numpy=use_numpy) is None
+    assert most_common_config([], [], [], use_numpy=use_numpy) is None
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_single_value(use_numpy):
+    records = [PDRecord(washer1=1.23, spring=40.5, washer2=1.45)]
+    stats = compute_stats(records, percentiles=PERCENTILES, min_count=1, use_numpy=use_numpy)
+
+    assert stats.avg_lower == stats.median_lower == stats.min_lower == stats.max_lower == 1.23
+    assert stats.avg_upper == stats.median_upper == 1.45
+    assert stats.std_lower == stats.std_upper == stats.std_total == 0.0
+    assert set(stats.percentiles_lower.values()) == {1.23}
+    assert stats.common_config == (1.23, 1.45, 40.5)
+
+@pytest.mark.parametrize("n", [2, 3, 10, 11, 500, 501])
+def test_engines_match(n):
+    records = _records(n, seed=n)
+    fast = compute_stats(_columns(records), percentiles=PERCENTILES, use_numpy=True)
+    slow = compute_stats(records, percentiles=PERCENTILES, use_numpy=False)
+
+    # Order statistics are exact, sums may differ in the last bits
+    assert fast.median_lower == slow.median_lower
+    assert fast.median_upper == slow.median_upper
+    assert (fast.min_lower, fast.max_lower) == (slow.min_lower, slow.max_lower)
+    assert (fast.min_upper, fast.max_upper) == (slow.min_upper, slow.max_upper)
+    assert fast.percentiles_lower == slow.percentiles_lower
+    assert fast.percentiles_upper == slow.percentiles_upper
+    assert fast.common_config == slow.common_config
+    for name in ("avg_lower", "avg_upper", "avg_spring", "avg_total", "std_lower", "std_upper", "std_spring", "std_total"):
+        assert getattr(fast, name) == pytest.approx(getattr(slow, name), rel=1e-12, abs=1e-12), name
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("n", [1, 2, 3, 10, 11, 500, 501])
+def test_matches_baseline(use_numpy, n):
+    """
+    Means and medians as the original statistics.mean/median implementation.
+    """
+    records = _records(n, seed=100 + n)
+    stats = compute_stats(records, use_numpy=use_numpy)
+
+    lowers = [r.washer1 for r in records]
+    uppers = [r.washer2 for r in records]
+    springs = [r.spring for r in records]
+    totals = [r.washer1 + r.washer2 + r.spring for r in records]
+
+    assert stats.avg_lower == pytest.approx(statistics.mean(lowers), rel=1e-12)
+    assert stats.avg_upper == pytest.approx(statistics.mean(uppers), rel=1e-12)
+    assert stats.avg_spring == pytest.approx(statistics.mean(springs), rel=1e-12)
+    assert stats.avg_total == pytest.approx(statistics.mean(totals), rel=1e-12)
+    assert stats.median_lower == pytest.approx(statistics.median(lowers), rel=1e-12)
+    assert stats.median_upper == pytest.approx(statistics.median(uppers), rel=1e-12)
+    if n > 1:
+        assert stats.std_lower == pytest.approx(statistics.stdev(lowers), rel=1e-9)
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 7, 10, 101, 1000])
+def test_percentile_rounding_matches_numpy(n):
+    """
+    Bit-for-bit equal to numpy.percentile, including the interpolation
+    from the nearer end that numpy uses for fractions of 0.5 and above.
+    """
+    rng = np.random.default_rng(n)
+    values = np.round(rng.uniform(0.5, 3.0, n), 2)
+    ordered = sorted(values.tolist())
+    for p in (*PERCENTILES, 0.0, 12.5, 62.5, 87.5, 100.0):
+        assert percentile_sorted(ordered, p) == float(np.percentile(values, p)), p
+
+def test_column_stats_python_even_and_odd_medians():
+    assert column_stats_python([1.0, 3.0, 2.0]).median == 2.0
+    assert column_stats_python([4.0, 1.0, 3.0, 2.0]).median == 2.5
+
+@pytest.mark.parametrize("seed", range(5))
+def test_common_config_engines_match(seed):
+    records = _records(300, seed=seed)
+    columns = _columns(records)
+    args = (columns.washer1, columns.washer2, columns.spring)
+    assert most_common_config(*args, use_numpy=True) == most_common_config(*args, use_numpy=False)
+
+@pytest.mark.parametrize("n", [1, 2, 11, 500])
+def test_columns_summary_engines_match(n):
+    columns = _columns(_records(n, seed=n))
+    args = (columns.washer1, columns.washer2, columns.spring)
+    fast = columns_summary(*args, use_numpy=True)
+    slow = columns_summary(*args, use_numpy=False)
+
+    assert fast.count == slow.count == n
+    assert fast.avg_total == pytest.approx(slow.avg_total, rel=1e-12)
+    assert fast.var_lower == pytest.approx(slow.var_lower, rel=1e-9, abs=1e-15)
+    assert columns_summary([], [], [], use_numpy=True) is None
+
+def _discrete_columns(n: int, seed: int) -> PDColumns:
+    """
+    Few distinct values, so totals and configurations tie often.
+    """
+    rng = random.Random(seed)
+    return PDColumns.from_rows(
+        (rng.choice((1.0, 1.01, 1.02, 1.05)), rng.choice((1.1, 1.12, 1.13)), rng.choice((40.0, 40.01)), 0.0)
+        for _ in range(n)
+    )
+
+def _assert_same_stats(live, full):
+    assert live.median_lower == full.median_lower
+    assert live.median_upper == full.median_upper
+    assert live.percentiles_lower == full.percentiles_lower
+    assert live.percentiles_upper == full.percentiles_upper
+    assert (live.min_lower, live.max_lower, live.min_upper, live.max_upper) == (
+        full.min_lower, full.max_lower, full.min_upper, full.max_upper
+    )
+    assert live.common_config == full.common_config
+    assert live.avg_total == pytest.approx(full.avg_total, rel=1e-12)
+    assert live.std_total == pytest.approx(full.std_total, rel=1e-9)
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("tolerance", [0.0, 0.01, 0.025, 0.03, 0.05])
+@pytest.mark.parametrize("seed", range(4))
+def test_model_stats_match_compute_stats(use_numpy, tolerance, seed):
+    columns = _discrete_columns(60, seed) if seed % 2 else _columns(_records(400, seed=seed))
+    args = (columns.washer1, columns.washer2, columns.spring)
+    options = dict(percentiles=PERCENTILES, tolerance=tolerance, min_count=3)
+
+    live = ModelStats.from_columns(*args).stats(**options)
+    _assert_same_stats(live, compute_stats(columns, use_numpy=use_numpy, **options))
+
+@pytest.mark.parametrize("min_count", [1, 4, 5, 50])
+def test_model_stats_common_config_ties(min_count):
+    # Two windows of 4 units, the one with the smaller totals wins,
+    # inside it two configurations of 2 units, the smaller triple wins
+    rows = [
+        (1.02, 1.0, 40.0), (1.02, 1.0, 40.0), (1.01, 1.01, 40.0), (1.01, 1.01, 40.0),
+        (1.5, 1.5, 40.0), (1.5, 1.5, 40.0), (1.5, 1.51, 40.0), (1.5, 1.51, 40.0),
+    ]
+    columns = PDColumns.from_rows((*row, 0.0) for row in rows)
+    args = (columns.washer1, columns.washer2, columns.spring)
+
+    expected = (1.01, 1.01, 40.0) if min_count <= 4 else None
+    assert most_common_config(*args, min_count=min_count, use_numpy=True) == expected
+    assert most_common_config(*args, min_count=min_count, use_numpy=False) == expected
+    assert ModelStats.from_columns(*args).common_config(min_count=min_count) == expected
+
+def test_model_stats_match_compute_stats_after_deltas():
+    columns = _discrete_columns(80, seed=7)
+    rows = list(zip(columns.washer1.tolist(), columns.washer2.tolist(), columns.spring.tolist()))
+    live = ModelStats.from_columns(columns.washer1, columns.washer2, columns.spring)
+    for row in rows[:30]:
+        live.remove(*row)
+    added = [(1.05, 1.13, 40.01)] * 5
+    for row in added:
+        live.add(*row)
+
+    rest = PDColumns.from_rows((*row, 0.0) for row in rows[30:] + added)
+    _assert_same_stats(live.stats(PERCENTILES), compute_stats(rest, percentiles=PERCENTILES))
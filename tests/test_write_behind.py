@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# License: GPL v3 Copyright: 2026, Mateusz Jamróz
+# tests/test_write_behind.py
+
+"""
+Writes queued by a write-behind session and other connections.
+"""
+
+from pd.core.connections import ConnectionManager, DatabaseSettings
+from pd.core.database import init_database
+from pd.core.repositories import PDRepository
+from pd.core.services import PDService
+
+MODEL_ID = 2
+
+def test_flush_writes_makes_queued_units_visible_to_readers(tmp_path):
+    path = tmp_path / "pd.db"
+    init_database(path)
+    db = ConnectionManager(path, DatabaseSettings())
+    service = PDService(PDRepository(db.connection()))
+    reader = service.with_repo(PDRepository(db.reader()))
+    try:
+        with service.write_behind() as queue:
+            service.add_new(MODEL_ID, 1.23, 1.45, 40.5, 265.0, 1)
+            assert queue.pending == 1
+            assert reader.model_snapshot(MODEL_ID).count == 0
+
+            service.flush_writes()
+            assert queue.pending == 0
+            snapshot = reader.model_snapshot(MODEL_ID)
+            assert snapshot.count == 1
+            assert snapshot.stats.avg_lower == 1.23
+    finally:
+        db.close_all()